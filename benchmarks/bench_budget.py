@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from semantic_page_extractor import ExtractionBudget, extract_page_semantics
+
+
+def _heavy_page(links: int, options: int) -> str:
+    rows = "".join(f"<p><a href='/p/{i}'>{'Product title ' * 8}{i}</a></p>" for i in range(links))
+    choices = "".join(f"<option>Choice {i}</option>" for i in range(options))
+    return (
+        f"<html><head><title>Heavy</title></head><body><h1>{'Seasonal catalog ' * 15}</h1>"
+        f"<form><label for='s'>Pick</label><select id='s'>{choices}</select><button>Go</button></form>"
+        f"{rows}</body></html>"
+    )
+
+
+async def _measure(page, repeats: int, budget: ExtractionBudget | None) -> tuple[float, int, dict | None]:
+    timings = []
+    summary = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        summary = await extract_page_semantics(page, budget=budget)
+        timings.append((time.perf_counter() - start) * 1000)
+    truncation = summary.truncation.model_dump() if summary.truncation else None
+    return statistics.median(timings), len(summary.model_dump_json()), truncation
+
+
+async def run(args: argparse.Namespace) -> None:
+    budget = ExtractionBudget(
+        max_elements=args.max_elements,
+        max_options=args.max_options,
+        max_text_length=args.max_text_length,
+        deadline_ms=args.deadline_ms,
+    )
+    results = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for links in args.sizes:
+            await page.set_content(_heavy_page(links, args.options))
+            full_ms, full_bytes, _ = await _measure(page, args.repeats, None)
+            budget_ms, budget_bytes, truncation = await _measure(page, args.repeats, budget)
+            results.append(
+                {
+                    "links": links,
+                    "full_median_ms": round(full_ms, 2),
+                    "full_bytes": full_bytes,
+                    "budget_median_ms": round(budget_ms, 2),
+                    "budget_bytes": budget_bytes,
+                    "truncation": truncation,
+                }
+            )
+        await browser.close()
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare unbudgeted extraction with an ExtractionBudget on heavy pages")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000], help="Number of links per synthetic page")
+    parser.add_argument("--options", type=int, default=5000, help="Options in the page's select field")
+    parser.add_argument("--max-elements", type=int, default=200)
+    parser.add_argument("--max-options", type=int, default=50)
+    parser.add_argument("--max-text-length", type=int, default=120)
+    parser.add_argument("--deadline-ms", type=float, default=500)
+    parser.add_argument("--repeats", type=int, default=3, help="Extraction runs per mode and page size")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
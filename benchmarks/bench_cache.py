@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from semantic_page_extractor import SummaryCache, extract_page_semantics
+from semantic_page_extractor.browser_script import FINGERPRINT_SCRIPT
+
+
+def _catalog_page(cards: int) -> str:
+    rows = []
+    for i in range(cards):
+        rows.append(
+            f"<section><h2>Product {i}</h2><div><div><a href='/p/{i}'>View product {i}</a>"
+            f"<form><label for='q{i}'>Qty</label><input id='q{i}' type='number'>"
+            f"<button type='submit'>Add to cart</button></form></div></div></section>"
+        )
+    return f"<html><head><title>Catalog</title></head><body><h1>Catalog</h1><main>{''.join(rows)}</main></body></html>"
+
+
+async def _touch_and_fingerprint(page) -> None:
+    await page.evaluate("document.body.dataset.touched = String(Math.random())")
+    await page.evaluate(FINGERPRINT_SCRIPT)
+
+
+async def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def run(args: argparse.Namespace) -> None:
+    results = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for cards in args.sizes:
+            await page.set_content(_catalog_page(cards))
+            cache = SummaryCache()
+            uncached = await _median_ms(lambda: extract_page_semantics(page), args.repeats)
+            await extract_page_semantics(page, cache=cache)
+            cached = await _median_ms(lambda: extract_page_semantics(page, cache=cache), args.repeats)
+            fingerprint_walk = await _median_ms(lambda: _touch_and_fingerprint(page), args.repeats)
+            results.append(
+                {
+                    "cards": cards,
+                    "uncached_ms": round(uncached, 2),
+                    "cached_hit_ms": round(cached, 2),
+                    "fingerprint_after_mutation_ms": round(fingerprint_walk, 2),
+                    "hits": cache.hits,
+                    "misses": cache.misses,
+                }
+            )
+        await browser.close()
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare uncached extraction with SummaryCache hits")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000], help="Number of product cards per synthetic page")
+    parser.add_argument("--repeats", type=int, default=5, help="Calls per mode and page size")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -0,0 +1,69 @@
+import argparse
+import gzip
+import json
+import statistics
+import time
+from pathlib import Path
+
+from semantic_page_extractor.output import compact_actionable_binary, compact_actionable_payload, decode_compact
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _load_items(path: Path) -> list[dict]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return decode_compact(data) if isinstance(data, dict) else data
+
+
+def _scaled(items: list[dict], scale: int) -> list[dict]:
+    return [
+        {**item, "visible_text": f"{item.get('visible_text') or ''} #{copy}" if copy else item.get("visible_text")}
+        for copy in range(scale)
+        for item in items
+    ]
+
+
+def run(args: argparse.Namespace) -> None:
+    results = []
+    for path in sorted(DATA_DIR.glob("*.json")):
+        items = _scaled(_load_items(path), args.scale)
+        compact = compact_actionable_payload(items)
+        json_bytes = json.dumps(compact, separators=(",", ":")).encode("utf-8")
+        binary = compact_actionable_binary(compact)
+        results.append(
+            {
+                "fixture": path.name,
+                "elements": len(items),
+                "json_bytes": len(json_bytes),
+                "binary_bytes": len(binary),
+                "json_gzip_bytes": len(gzip.compress(json_bytes)),
+                "binary_gzip_bytes": len(gzip.compress(binary)),
+                "json_encode_ms": round(
+                    _median_ms(lambda: json.dumps(compact, separators=(",", ":")).encode("utf-8"), args.repeats), 3
+                ),
+                "binary_encode_ms": round(_median_ms(lambda: compact_actionable_binary(compact), args.repeats), 3),
+                "json_decode_ms": round(_median_ms(lambda: decode_compact(json_bytes), args.repeats), 3),
+                "binary_decode_ms": round(_median_ms(lambda: decode_compact(binary), args.repeats), 3),
+            }
+        )
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare JSON and binary compact actionable payloads on data/ fixtures")
+    parser.add_argument("--scale", type=int, default=100, help="Repeat each fixture's elements with distinct texts to simulate larger pages")
+    parser.add_argument("--repeats", type=int, default=20, help="Encode and decode runs per fixture")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -0,0 +1,64 @@
+import argparse
+import json
+import statistics
+import time
+
+from semantic_page_extractor.extractor import _to_summary
+
+
+def _raw_payload(elements: int) -> dict:
+    forms = []
+    links = []
+    for i in range(elements // 4):
+        section = f"Product {i % 50}"
+        submit = {"role": "button", "visible_text": "Add to cart", "aria_label": None, "disabled": False, "section_context": section}
+        forms.append(
+            {
+                "section_context": section,
+                "fields": [
+                    {"label_for": "Qty", "type": "number", "required": False, "options": None, "section_context": section},
+                    {"label_wrapped": "Size", "type": "radio", "options": ["S", "M", "L"], "section_context": section},
+                ],
+                "submit_buttons": [submit],
+            }
+        )
+        links.append(submit)
+        links.append({"role": "link", "visible_text": f"View product {i}", "aria_label": None, "disabled": False, "section_context": section})
+    return {"url": "https://example.com", "title": "Catalog", "headers": ["Catalog"], "forms": forms, "interactive_elements": links}
+
+
+def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(args: argparse.Namespace) -> None:
+    results = []
+    for elements in args.sizes:
+        raw = _raw_payload(elements)
+        validated = _median_ms(lambda: _to_summary(raw), args.repeats)
+        trusted = _median_ms(lambda: _to_summary(raw, trusted=True), args.repeats)
+        results.append(
+            {
+                "elements": elements,
+                "validated_ms": round(validated, 2),
+                "trusted_ms": round(trusted, 2),
+                "speedup": round(validated / trusted, 2),
+            }
+        )
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare validated and trusted PageSummary construction")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 10000], help="Approximate elements per synthetic page")
+    parser.add_argument("--repeats", type=int, default=5, help="Construction runs per size")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -0,0 +1,76 @@
+import argparse
+import json
+import statistics
+import time
+
+from semantic_page_extractor import diff_summaries
+from semantic_page_extractor.extractor import _to_summary
+
+
+def _raw_payload(elements: int, changed_every: int = 0) -> dict:
+    forms = []
+    links = []
+    for i in range(elements // 4):
+        section = f"Product {i % 50}"
+        changed = bool(changed_every) and i % changed_every == 0
+        submit = {"role": "button", "visible_text": "Add to cart", "aria_label": None, "disabled": changed, "section_context": section}
+        forms.append(
+            {
+                "section_context": section,
+                "fields": [
+                    {"label_for": "Qty", "type": "number", "required": changed, "options": None, "section_context": section},
+                    {"label_wrapped": "Size", "type": "radio", "options": ["S", "M", "L"], "section_context": section},
+                ],
+                "submit_buttons": [submit],
+            }
+        )
+        links.append(submit)
+        text = f"View product {i}" + (" (sale)" if changed else "")
+        links.append({"role": "link", "visible_text": text, "aria_label": None, "disabled": False, "section_context": section})
+    return {"url": "https://example.com", "title": "Catalog", "headers": ["Catalog"], "forms": forms, "interactive_elements": links}
+
+
+def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(args: argparse.Namespace) -> None:
+    results = []
+    for elements in args.sizes:
+        old = _to_summary(_raw_payload(elements), trusted=True)
+        same = _to_summary(_raw_payload(elements), trusted=True)
+        new = _to_summary(_raw_payload(elements, args.changed_every), trusted=True)
+        diff = diff_summaries(old, new)
+        dumps = _median_ms(lambda: old.model_dump_json() == new.model_dump_json(), args.repeats)
+        unchanged = _median_ms(lambda: diff_summaries(old, same), args.repeats)
+        changed = _median_ms(lambda: diff_summaries(old, new), args.repeats)
+        results.append(
+            {
+                "elements": elements,
+                "json_dump_compare_ms": round(dumps, 2),
+                "diff_unchanged_ms": round(unchanged, 2),
+                "diff_changed_ms": round(changed, 2),
+                "diff_us_per_element": round(changed * 1000 / elements, 3),
+                "changed_elements": len(diff.interactive_elements.changed) + len(diff.interactive_elements.added),
+                "delta_bytes": len(json.dumps(diff.to_dict())),
+                "full_bytes": len(new.model_dump_json()),
+            }
+        )
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure diff_summaries cost and delta size against full JSON dumps")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 10000], help="Approximate elements per synthetic page")
+    parser.add_argument("--changed-every", type=int, default=50, help="Change every Nth product card in the new snapshot")
+    parser.add_argument("--repeats", type=int, default=5, help="Diff runs per size")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from semantic_page_extractor import ExtractorPool, PageSummary, extract_many
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "sample-page.html"
+
+
+def _serve(body: bytes, delay_ms: float) -> ThreadingHTTPServer:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(delay_ms / 1000)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run_level(urls: list[str], concurrency: int, args: argparse.Namespace) -> dict:
+    ok = failed = 0
+    async with ExtractorPool(browsers=args.browsers, max_pages_per_browser=concurrency) as pool:
+        start = time.perf_counter()
+        async for _, result in extract_many(urls, concurrency=concurrency, pool=pool, timeout=args.timeout):
+            if isinstance(result, PageSummary):
+                ok += 1
+            else:
+                failed += 1
+        elapsed = time.perf_counter() - start
+    return {
+        "concurrency": concurrency,
+        "urls": len(urls),
+        "ok": ok,
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "urls_per_second": round(len(urls) / elapsed, 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = _serve(SAMPLE_PAGE.read_bytes(), args.delay_ms)
+    urls = [f"http://127.0.0.1:{server.server_port}/page/{i}" for i in range(args.urls)]
+    try:
+        results = [await _run_level(urls, concurrency, args) for concurrency in args.concurrency]
+    finally:
+        server.shutdown()
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure extract_many throughput against a local HTTP server")
+    parser.add_argument("--urls", type=int, default=64, help="URLs per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Concurrency levels to measure")
+    parser.add_argument("--browsers", type=int, default=1, help="Warm browsers in the pool")
+    parser.add_argument("--delay-ms", type=float, default=50.0, help="Server-side latency added to every response")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-URL timeout in seconds")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
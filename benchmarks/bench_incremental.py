@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from semantic_page_extractor import extract_page_semantics
+
+MUTATION = "(i) => { document.getElementById('badge').textContent = `Cart (${i})`; }"
+
+
+def _catalog_page(cards: int) -> str:
+    rows = []
+    for i in range(cards):
+        rows.append(
+            f"<section><h2>Product {i}</h2><div><div><a href='/p/{i}'>View product {i}</a>"
+            f"<form><label for='q{i}'>Qty</label><input id='q{i}' type='number'>"
+            f"<button type='submit'>Add to cart</button></form></div></div></section>"
+        )
+    return (
+        "<html><head><title>Catalog</title></head><body><h1>Catalog</h1>"
+        f"<header><a id='badge' href='/cart'>Cart (0)</a></header><main>{''.join(rows)}</main></body></html>"
+    )
+
+
+async def _measure(page, repeats: int, incremental: bool) -> tuple[list[float], str]:
+    timings = []
+    summary = await extract_page_semantics(page, incremental=incremental)
+    for i in range(repeats):
+        await page.evaluate(MUTATION, i + 1)
+        start = time.perf_counter()
+        summary = await extract_page_semantics(page, incremental=incremental)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, summary.page_signature
+
+
+async def run(args: argparse.Namespace) -> None:
+    results = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for cards in args.sizes:
+            await page.set_content(_catalog_page(cards))
+            elements = await page.evaluate("document.querySelectorAll('*').length")
+            full, full_signature = await _measure(page, args.repeats, incremental=False)
+            await page.set_content(_catalog_page(cards))
+            incremental, incremental_signature = await _measure(page, args.repeats, incremental=True)
+            results.append(
+                {
+                    "cards": cards,
+                    "elements": elements,
+                    "full_median_ms": round(statistics.median(full), 2),
+                    "incremental_median_ms": round(statistics.median(incremental), 2),
+                    "same_signature": full_signature == incremental_signature,
+                }
+            )
+        await browser.close()
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare full and incremental re-extraction after a small DOM change")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000], help="Number of product cards per synthetic page")
+    parser.add_argument("--repeats", type=int, default=5, help="Mutate-and-extract rounds per mode and page size")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
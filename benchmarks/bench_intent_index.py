@@ -0,0 +1,102 @@
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from semantic_page_extractor import (
+    ActionableIndex,
+    filter_actionable_elements,
+    filter_actionable_from_summary,
+    rank_actionable_elements,
+    rank_many,
+)
+from semantic_page_extractor.models import InteractiveElement, PageSummary
+from semantic_page_extractor.signatures import action_signature
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+QUERIES = ["add to cart", "ad to crt", "iphone air 512", "sky blue", "conditions of use", "esim", "help", "sign in"]
+
+
+def _to_element(item: dict) -> InteractiveElement:
+    return InteractiveElement(
+        action_signature=item.get("action_signature")
+        or action_signature(item.get("visible_text"), item["role"], item.get("section_context")),
+        role=item["role"],
+        visible_text=item.get("visible_text"),
+        aria_label=item.get("aria_label"),
+        disabled=bool(item.get("disabled")),
+        section_context=item.get("section_context"),
+    )
+
+
+def _load_elements(copies: int) -> list[InteractiveElement]:
+    elements = []
+    for path in sorted(DATA_DIR.glob("out*.json")):
+        items = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(items, list):
+            elements.extend(_to_element(item) for item in items)
+    return elements * copies
+
+
+def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(args: argparse.Namespace) -> None:
+    elements = _load_elements(args.copies)
+    build_ms = _median_ms(lambda: ActionableIndex(elements), args.repeats)
+    index = ActionableIndex(elements)
+    linear = _median_ms(lambda: [rank_actionable_elements(elements, q) for q in QUERIES], args.repeats)
+    indexed = _median_ms(lambda: [index.rank(q, min_score=args.min_score) for q in QUERIES], args.repeats)
+    top_k = _median_ms(
+        lambda: [filter_actionable_elements(elements, q, min_score=args.min_score, max_results=5) for q in QUERIES],
+        args.repeats,
+    )
+    summary = PageSummary(
+        schema_version="1.0",
+        url="https://example.com",
+        title="Benchmark",
+        page_signature="bench",
+        headers=[],
+        forms=[],
+        interactive_elements=elements,
+    )
+    per_query = _median_ms(
+        lambda: [filter_actionable_from_summary(summary, q, min_score=args.min_score) for q in QUERIES], args.repeats
+    )
+    many = _median_ms(lambda: rank_many(summary, QUERIES, min_score=args.min_score), args.repeats)
+    print(
+        json.dumps(
+            {
+                "elements": len(elements),
+                "queries": len(QUERIES),
+                "min_score": args.min_score,
+                "index_build_ms": round(build_ms, 2),
+                "linear_ms": round(linear, 2),
+                "index_ms": round(indexed, 2),
+                "speedup": round(linear / indexed, 2),
+                "filter_top5_ms": round(top_k, 2),
+                "per_query_summary_ms": round(per_query, 2),
+                "rank_many_ms": round(many, 2),
+            },
+            indent=2,
+        )
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare linear intent ranking with ActionableIndex and rank_many")
+    parser.add_argument("--copies", type=int, default=1, help="Repeat the data/ actionables to grow the corpus")
+    parser.add_argument("--min-score", type=float, default=0.45, help="Score threshold passed to the index")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per measurement")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -0,0 +1,80 @@
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+from semantic_page_extractor import VectorizedScorer
+from semantic_page_extractor.intent import _score_element
+from semantic_page_extractor.models import InteractiveElement
+from semantic_page_extractor.signatures import action_signature
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+QUERIES = ["add to cart", "ad to crt", "iphone air 512", "sky blue", "conditions of use", "esim", "help", "sign in"]
+
+
+def _to_element(item: dict) -> InteractiveElement:
+    return InteractiveElement(
+        action_signature=item.get("action_signature")
+        or action_signature(item.get("visible_text"), item["role"], item.get("section_context")),
+        role=item["role"],
+        visible_text=item.get("visible_text"),
+        aria_label=item.get("aria_label"),
+        disabled=bool(item.get("disabled")),
+        section_context=item.get("section_context"),
+    )
+
+
+def _load_elements() -> list[InteractiveElement]:
+    elements = []
+    for path in sorted(DATA_DIR.glob("out*.json")):
+        items = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(items, list):
+            elements.extend(_to_element(item) for item in items)
+    return elements
+
+
+def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(args: argparse.Namespace) -> None:
+    elements = _load_elements()
+    queries = QUERIES * args.query_copies
+    scorer = VectorizedScorer(elements)
+    reference = np.array([[_score_element(element, query) for element in elements] for query in queries])
+    diff = np.abs(scorer.scores(queries) - reference)
+    print(
+        json.dumps(
+            {
+                "elements": len(elements),
+                "queries": len(queries),
+                "build_ms": round(_median_ms(lambda: VectorizedScorer(elements), args.repeats), 2),
+                "difflib_ms": round(
+                    _median_ms(lambda: [[_score_element(e, q) for e in elements] for q in queries], args.repeats), 2
+                ),
+                "vectorized_ms": round(_median_ms(lambda: scorer.scores(queries), args.repeats), 2),
+                "max_abs_diff": round(float(diff.max()), 6),
+                "mean_abs_diff": round(float(diff.mean()), 6),
+            },
+            indent=2,
+        )
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare difflib intent scoring with the vectorized backend")
+    parser.add_argument("--query-copies", type=int, default=4, help="Repeat the query list to grow the batch")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per measurement")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run(parse_args())
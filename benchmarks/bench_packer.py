@@ -0,0 +1,88 @@
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from semantic_page_extractor import InteractiveElement, compact_actionable_payload, decode_compact, pack_actionable_payload
+from semantic_page_extractor.intent import filter_actionable_elements
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _elements(path: Path) -> list[InteractiveElement]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    items = decode_compact(data) if isinstance(data, dict) else data
+    return [
+        InteractiveElement(
+            action_signature=item.get("action_signature") or f"{path.stem}-{i}",
+            role=item.get("role") or "button",
+            visible_text=item.get("visible_text"),
+            aria_label=item.get("aria_label"),
+            disabled=bool(item.get("disabled")),
+            section_context=item.get("section_context"),
+        )
+        for i, item in enumerate(items)
+    ]
+
+
+def _compact_bytes(elements: list[InteractiveElement]) -> int:
+    payload = compact_actionable_payload([element.model_dump(mode="json") for element in elements])
+    return len(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def run(args: argparse.Namespace) -> None:
+    results = []
+    for path in sorted(DATA_DIR.glob("*.json")):
+        elements = _elements(path)
+        top = filter_actionable_elements(elements, args.intent, min_score=args.min_score, max_results=args.max_results)
+        row = {
+            "fixture": path.name,
+            "elements": len(elements),
+            "compact_bytes": _compact_bytes(elements),
+            f"max_results_{args.max_results}_bytes": _compact_bytes(top),
+            "budgets": [],
+        }
+        for budget in args.budgets:
+            packed = pack_actionable_payload(elements, max_bytes=budget, intent=args.intent, min_score=args.min_score)
+            row["budgets"].append(
+                {
+                    "max_bytes": budget,
+                    "bytes": packed.size,
+                    "included": packed.included,
+                    "dropped": packed.dropped,
+                    "truncated": packed.truncated,
+                    "pack_ms": round(
+                        _median_ms(
+                            lambda: pack_actionable_payload(elements, max_bytes=budget, intent=args.intent, min_score=args.min_score),
+                            args.repeats,
+                        ),
+                        3,
+                    ),
+                }
+            )
+        results.append(row)
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pack data/ fixture actionables into byte budgets and compare with max_results capping")
+    parser.add_argument("--budgets", type=int, nargs="+", default=[512, 2048, 8192], help="Byte budgets to pack into")
+    parser.add_argument("--intent", default="add to cart", help="Intent query used for ranking")
+    parser.add_argument("--min-score", type=float, default=0.0, help="Minimum intent score to consider")
+    parser.add_argument("--max-results", type=int, default=20, help="max_results cap to compare against")
+    parser.add_argument("--repeats", type=int, default=10, help="Pack runs per fixture and budget")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run(parse_args())
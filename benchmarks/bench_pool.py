@@ -0,0 +1,67 @@
+import argparse
+import asyncio
+import functools
+import json
+import statistics
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from semantic_page_extractor import ExtractorPool, extract_from_url
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _serve(directory: Path) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(directory)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _timed(calls: int, extract) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await extract()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = _serve(FIXTURES_DIR)
+    url = f"http://127.0.0.1:{server.server_port}/sample-page.html"
+    try:
+        cold = await _timed(args.calls, lambda: extract_from_url(url))
+        async with ExtractorPool(max_uses_per_browser=args.max_uses) as pool:
+            pooled = await _timed(args.calls, lambda: extract_from_url(url, pool=pool))
+            launches = pool.launches
+    finally:
+        server.shutdown()
+    print(
+        json.dumps(
+            {
+                "calls": args.calls,
+                "cold_median_ms": round(statistics.median(cold), 2),
+                "pooled_median_ms": round(statistics.median(pooled), 2),
+                "pooled_browser_launches": launches,
+            },
+            indent=2,
+        )
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare per-call browser startup with ExtractorPool reuse")
+    parser.add_argument("--calls", type=int, default=20, help="Sequential extractions per mode")
+    parser.add_argument("--max-uses", type=int, default=100, help="Pages per browser before the pool recycles it")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from semantic_page_extractor import extract_page_semantics
+
+CHECKOUT = (
+    "<section id='checkout'><h2>Checkout</h2><form>"
+    "<label for='card'>Card number</label><input id='card'>"
+    "<label for='zip'>Zip</label><input id='zip'>"
+    "<button type='submit'>Pay now</button></form></section>"
+)
+
+
+def _catalog_page(cards: int) -> str:
+    rows = []
+    for i in range(cards):
+        rows.append(
+            f"<section><h2>Product {i}</h2><div><div><a href='/p/{i}'>View product {i}</a>"
+            f"<form><label for='q{i}'>Qty</label><input id='q{i}' type='number'>"
+            f"<button type='submit'>Add to cart</button></form></div></div></section>"
+        )
+    return f"<html><head><title>Catalog</title></head><body><h1>Catalog</h1><main>{''.join(rows)}</main>{CHECKOUT}</body></html>"
+
+
+async def _measure(page, repeats: int, root: str | None) -> tuple[float, int]:
+    timings = []
+    summary = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        summary = await extract_page_semantics(page, root=root)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(summary.interactive_elements)
+
+
+async def run(args: argparse.Namespace) -> None:
+    results = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for cards in args.sizes:
+            await page.set_content(_catalog_page(cards))
+            elements = await page.evaluate("document.querySelectorAll('*').length")
+            full_ms, full_count = await _measure(page, args.repeats, None)
+            scoped_ms, scoped_count = await _measure(page, args.repeats, args.root)
+            results.append(
+                {
+                    "cards": cards,
+                    "elements": elements,
+                    "full_median_ms": round(full_ms, 2),
+                    "full_interactive": full_count,
+                    "scoped_median_ms": round(scoped_ms, 2),
+                    "scoped_interactive": scoped_count,
+                    "speedup": round(full_ms / scoped_ms, 1) if scoped_ms else None,
+                }
+            )
+        await browser.close()
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare whole-page and root-scoped extraction on synthetic catalog pages")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000], help="Number of product cards per synthetic page")
+    parser.add_argument("--root", default="#checkout", help="CSS selector of the region to extract")
+    parser.add_argument("--repeats", type=int, default=5, help="Extraction runs per mode and page size")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from semantic_page_extractor.browser_script import EXTRACTION_SCRIPT
+
+
+def _catalog_page(cards: int) -> str:
+    rows = []
+    for i in range(cards):
+        rows.append(
+            f"<section><h2>Product {i}</h2><div><div><a href='/p/{i}'>View product {i}</a>"
+            f"<form><label for='q{i}'>Qty</label><input id='q{i}' type='number'>"
+            f"<button type='submit'>Add to cart</button></form></div></div></section>"
+        )
+    return f"<html><head><title>Catalog</title></head><body><h1>Catalog</h1><main>{''.join(rows)}</main></body></html>"
+
+
+async def _measure(page, repeats: int) -> list[float]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await page.evaluate(EXTRACTION_SCRIPT)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(args: argparse.Namespace) -> None:
+    results = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for cards in args.sizes:
+            await page.set_content(_catalog_page(cards))
+            elements = await page.evaluate("document.querySelectorAll('*').length")
+            timings = await _measure(page, args.repeats)
+            median = statistics.median(timings)
+            results.append(
+                {
+                    "cards": cards,
+                    "elements": elements,
+                    "median_ms": round(median, 2),
+                    "us_per_element": round(median * 1000 / elements, 2),
+                }
+            )
+        await browser.close()
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark EXTRACTION_SCRIPT cost as page size grows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 1000, 2000], help="Number of product cards per synthetic page")
+    parser.add_argument("--repeats", type=int, default=5, help="Extraction runs per page size")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from semantic_page_extractor import PageSummary, extract_sharded
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "sample-page.html"
+
+
+def _serve(body: bytes) -> ThreadingHTTPServer:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run_level(urls: list[str], processes: int, args: argparse.Namespace) -> tuple[dict, dict]:
+    start = time.perf_counter()
+    results = {}
+    async for url, result in extract_sharded(urls, processes=processes, concurrency=args.concurrency):
+        results[url] = result.page_signature if isinstance(result, PageSummary) else repr(result)
+    elapsed = time.perf_counter() - start
+    return (
+        {
+            "processes": processes,
+            "urls": len(urls),
+            "seconds": round(elapsed, 3),
+            "urls_per_second": round(len(urls) / elapsed, 2),
+        },
+        results,
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = _serve(SAMPLE_PAGE.read_bytes())
+    urls = [f"http://127.0.0.1:{server.server_port}/page/{i}" for i in range(args.urls)]
+    rows = []
+    baseline = None
+    try:
+        for processes in args.processes:
+            row, results = await _run_level(urls, processes, args)
+            baseline = results if baseline is None else baseline
+            row["matches_first_level"] = results == baseline
+            rows.append(row)
+    finally:
+        server.shutdown()
+    print(json.dumps(rows, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Measure extract_sharded scaling across worker processes")
+    parser.add_argument("--urls", type=int, default=128, help="URLs per level")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, max(1, cores // 2), cores}),
+        help="Worker process counts to measure",
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Pages in flight per worker")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
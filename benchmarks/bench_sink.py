@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from semantic_page_extractor import NdjsonSink
+from semantic_page_extractor.extractor import _to_summary
+
+
+def _summary(index: int, elements: int):
+    links = [{"role": "link", "visible_text": f"View product {index}-{i}", "section_context": f"Product {i}"} for i in range(elements)]
+    return _to_summary(
+        {"url": f"https://example.com/{index}", "title": f"Page {index}", "headers": ["Catalog"], "forms": [], "interactive_elements": links},
+        trusted=True,
+    )
+
+
+async def _results(pages: int, elements: int):
+    for index in range(pages):
+        yield f"https://example.com/{index}", _summary(index, elements)
+
+
+async def _in_memory(path: Path, pages: int, elements: int) -> None:
+    collected = [{"url": url, "result": summary.model_dump(mode="json")} async for url, summary in _results(pages, elements)]
+    path.write_text(json.dumps(collected), encoding="utf-8")
+
+
+async def _sink(path: Path, pages: int, elements: int, compression: str | None) -> None:
+    async with NdjsonSink(path, compression=compression) as sink:
+        await sink.write_results(_results(pages, elements))
+
+
+async def _measure(label: str, path: Path, run) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    await run
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"mode": label, "total_ms": round(elapsed, 2), "python_peak_kb": round(peak / 1024, 1), "output_bytes": path.stat().st_size}
+
+
+async def run(args: argparse.Namespace) -> None:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for pages in args.pages:
+            rows = [await _measure("json.dumps", Path(directory, "all.json"), _in_memory(Path(directory, "all.json"), pages, args.elements))]
+            for compression in args.compressions:
+                name = "none" if compression == "none" else compression
+                path = Path(directory, f"out-{name}.ndjson")
+                rows.append(await _measure(f"sink:{name}", path, _sink(path, pages, args.elements, None if compression == "none" else compression)))
+            results.append({"pages": pages, "elements_per_page": args.elements, "modes": rows})
+            for entry in os.scandir(directory):
+                os.unlink(entry.path)
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare collecting batch results for one json.dumps with streaming them through NdjsonSink")
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000, 5000], help="Number of synthetic page summaries to write")
+    parser.add_argument("--elements", type=int, default=200, help="Interactive elements per synthetic page")
+    parser.add_argument("--compressions", nargs="+", default=["none", "gzip", "xz"], help="Sink compressions to measure (none, gzip, bz2, xz, zstd)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
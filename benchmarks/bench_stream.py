@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from playwright.async_api import async_playwright
+
+from semantic_page_extractor import extract_page_semantics, stream_page_semantics
+
+
+def _catalog_page(cards: int) -> str:
+    rows = []
+    for i in range(cards):
+        rows.append(
+            f"<section><h2>Product {i}</h2><div><div><a href='/p/{i}'>View product {i}</a>"
+            f"<form><label for='q{i}'>Qty</label><input id='q{i}' type='number'>"
+            f"<button type='submit'>Add to cart</button></form></div></div></section>"
+        )
+    return f"<html><head><title>Catalog</title></head><body><h1>Catalog</h1><main>{''.join(rows)}</main></body></html>"
+
+
+async def _full(page) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    await extract_page_semantics(page)
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"total_ms": round(elapsed, 2), "python_peak_kb": round(peak / 1024, 1)}
+
+
+async def _streamed(page, chunk_size: int) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    batches = 0
+    async for _ in stream_page_semantics(page, chunk_size=chunk_size):
+        batches += 1
+        if first is None:
+            first = (time.perf_counter() - start) * 1000
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "first_batch_ms": round(first, 2),
+        "total_ms": round(elapsed, 2),
+        "batches": batches,
+        "python_peak_kb": round(peak / 1024, 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    results = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for cards in args.sizes:
+            await page.set_content(_catalog_page(cards))
+            results.append(
+                {
+                    "cards": cards,
+                    "full": await _full(page),
+                    "stream": await _streamed(page, args.chunk_size),
+                }
+            )
+        await browser.close()
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare single-shot extraction with stream_page_semantics")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000], help="Number of product cards per synthetic page")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Records per streamed batch")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
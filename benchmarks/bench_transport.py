@@ -0,0 +1,115 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from semantic_page_extractor.transport import decode_transport
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / "data"
+
+sys.path.insert(0, str(ROOT))
+from tests.transport_encoder import encode_transport  # noqa: E402
+
+
+def _items(data: dict | list) -> list[dict]:
+    if isinstance(data, list):
+        return data
+    return [
+        {
+            "role": data["r"][row[0]],
+            "visible_text": data["t"][row[1]] or None,
+            "section_context": data["c"][row[2]] or None,
+            "disabled": len(row) > 3,
+        }
+        for row in data["i"]
+    ]
+
+
+def _raw_payload(path: Path, scale: int) -> dict:
+    items = _items(json.loads(path.read_text(encoding="utf-8")))
+    actions = [
+        {
+            "role": item.get("role"),
+            "visible_text": item.get("visible_text"),
+            "aria_label": item.get("aria_label"),
+            "disabled": bool(item.get("disabled")),
+            "section_context": item.get("section_context"),
+        }
+        for item in items * scale
+    ]
+    return {"url": "https://example.com", "title": path.stem, "headers": [], "forms": [], "interactive_elements": actions}
+
+
+def _protocol_value(value):
+    # Mirrors the shape Playwright uses to ship evaluate() results node by node.
+    if value is None:
+        return {"v": "null"}
+    if isinstance(value, bool):
+        return {"b": value}
+    if isinstance(value, str):
+        return {"s": value}
+    if isinstance(value, (int, float)):
+        return {"n": value}
+    if isinstance(value, list):
+        return {"a": [_protocol_value(v) for v in value]}
+    return {"o": [{"k": k, "v": _protocol_value(v)} for k, v in value.items()]}
+
+
+def _parse_protocol(value):
+    if "s" in value:
+        return value["s"]
+    if "n" in value:
+        return value["n"]
+    if "b" in value:
+        return value["b"]
+    if "a" in value:
+        return [_parse_protocol(v) for v in value["a"]]
+    if "o" in value:
+        return {e["k"]: _parse_protocol(e["v"]) for e in value["o"]}
+    return None
+
+
+def _median_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(args: argparse.Namespace) -> None:
+    results = []
+    for path in sorted(DATA_DIR.glob("*.json")):
+        raw = _raw_payload(path, args.scale)
+        object_wire = json.dumps(_protocol_value(raw), separators=(",", ":"))
+        string_wire = json.dumps(_protocol_value(encode_transport(raw)), separators=(",", ":"))
+        results.append(
+            {
+                "fixture": path.name,
+                "elements": len(raw["interactive_elements"]),
+                "object_wire_bytes": len(object_wire),
+                "string_table_wire_bytes": len(string_wire),
+                "object_decode_ms": round(
+                    _median_ms(lambda: _parse_protocol(json.loads(object_wire)), args.repeats), 3
+                ),
+                "string_table_decode_ms": round(
+                    _median_ms(lambda: decode_transport(_parse_protocol(json.loads(string_wire))), args.repeats), 3
+                ),
+            }
+        )
+    print(json.dumps(results, indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare object-graph and string-table transport on data/ fixtures")
+    parser.add_argument("--scale", type=int, default=1, help="Repeat each fixture's elements to simulate larger pages")
+    parser.add_argument("--repeats", type=int, default=20, help="Decode runs per fixture")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run(parse_args())
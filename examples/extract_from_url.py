@@ -1,8 +1,10 @@
 import argparse
 import asyncio
 import json
+import sys
+from collections.abc import Iterator
 
-from semantic_page_extractor import extract_from_url
+from semantic_page_extractor import NdjsonSink, extract_from_url, extract_many
 
 
 def _serialize(payload, minify: bool) -> str:
@@ -11,7 +13,36 @@ def _serialize(payload, minify: bool) -> str:
     return json.dumps(payload, indent=2, sort_keys=True)
 
 
+def _read_urls(path: str) -> Iterator[str]:
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    with handle:
+        for line in handle:
+            url = line.strip()
+            if url and not url.startswith("#"):
+                yield url
+
+
+async def run_batch(args: argparse.Namespace) -> None:
+    results = extract_many(
+        _read_urls(args.urls_file),
+        concurrency=args.concurrency,
+        wait_until=args.wait_until,
+        actionable_only=args.actionable_only,
+        intent=args.intent,
+        min_score=args.min_score,
+        max_results=args.max_results,
+        output_format=args.output_format,
+    )
+    target = args.output if args.output != "-" else sys.stdout.buffer
+    async with NdjsonSink(target, compression=args.compression) as sink:
+        written = await sink.write_results(results)
+    print(f"wrote {written} results", file=sys.stderr)
+
+
 async def run(args: argparse.Namespace) -> None:
+    if args.urls_file:
+        await run_batch(args)
+        return
     result = await extract_from_url(
         args.url,
         wait_until=args.wait_until,
@@ -27,7 +58,7 @@ async def run(args: argparse.Namespace) -> None:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Extract semantic page summary for a URL")
-    parser.add_argument("url", help="Target URL to extract")
+    parser.add_argument("url", nargs="?", help="Target URL to extract")
     parser.add_argument("--wait-until", default="load", choices=["load", "domcontentloaded", "networkidle", "commit"], help="Playwright wait condition for page.goto")
     parser.add_argument("--actionable-only", action="store_true", help="Print only deduplicated actionable elements")
     parser.add_argument("--intent", default=None, help="Filter actionable elements by intent query (e.g. 'add to cart')")
@@ -35,7 +66,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--max-results", type=int, default=None, help="Optional max number of filtered results")
     parser.add_argument("--minify", action="store_true", help="Print compact minified JSON output")
     parser.add_argument("--output-format", choices=["json", "compact"], default=None, help="Optional output format override: json strips action_signature/disabled, compact emits compressed payload")
-    return parser.parse_args()
+    parser.add_argument("--urls-file", default=None, help="Batch mode: file with one URL per line ('-' for stdin), written as NDJSON")
+    parser.add_argument("--output", default="-", help="Batch mode: NDJSON output path ('-' for stdout); .gz/.bz2/.xz/.zst suffixes enable compression")
+    parser.add_argument("--compression", choices=["gzip", "bz2", "xz", "zstd"], default=None, help="Batch mode: compression override (zstd needs Python 3.14+)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Batch mode: URLs extracted in parallel")
+    args = parser.parse_args()
+    if not args.url and not args.urls_file:
+        parser.error("either url or --urls-file is required")
+    return args
 
 
 if __name__ == "__main__":
@@ -3,33 +3,80 @@ from semantic_page_extractor.actionable import (
     extract_actionable_elements,
     merge_actionable_elements,
 )
+from semantic_page_extractor.batch import extract_many
+from semantic_page_extractor.budget import ExtractionBudget
+from semantic_page_extractor.cache import SummaryCache
+from semantic_page_extractor.diff import SignatureDiff, SummaryDiff, diff_summaries
 from semantic_page_extractor.errors import ExtractionError
-from semantic_page_extractor.extractor import extract_from_url, extract_page_semantics
+from semantic_page_extractor.extractor import (
+    extract_from_url,
+    extract_page_semantics,
+    release_fingerprint,
+    release_incremental,
+)
 from semantic_page_extractor.intent import (
     RankedActionableElement,
     filter_actionable_elements,
     filter_actionable_from_summary,
     rank_actionable_elements,
 )
-from semantic_page_extractor.models import FieldSummary, FormSummary, InteractiveElement, PageSummary
-from semantic_page_extractor.output import build_output_payload, compact_actionable_payload, strip_fields
+from semantic_page_extractor.intent_index import ActionableIndex, rank_many
+from semantic_page_extractor.intent_vector import VECTOR_SCORE_TOLERANCE, VectorizedScorer
+from semantic_page_extractor.models import FieldSummary, FormSummary, InteractiveElement, PageSummary, TruncationReport
+from semantic_page_extractor.output import (
+    build_output_payload,
+    compact_actionable_binary,
+    compact_actionable_payload,
+    decode_compact,
+    strip_fields,
+)
+from semantic_page_extractor.packer import PackedPayload, pack_actionable_payload
+from semantic_page_extractor.pool import ExtractorPool
+from semantic_page_extractor.sharded import extract_sharded
+from semantic_page_extractor.sink import NdjsonSink
+from semantic_page_extractor.stream import FormBatch, HeaderBatch, InteractiveBatch, PageRecord, stream_page_semantics
 
 __all__ = [
+    "ActionableIndex",
     "extract_actionable_elements",
     "dedupe_actionable_elements",
+    "diff_summaries",
+    "ExtractionBudget",
     "ExtractionError",
+    "ExtractorPool",
     "FieldSummary",
+    "FormBatch",
     "FormSummary",
+    "HeaderBatch",
+    "InteractiveBatch",
     "InteractiveElement",
+    "NdjsonSink",
+    "PackedPayload",
+    "PageRecord",
     "PageSummary",
     "RankedActionableElement",
+    "SignatureDiff",
+    "SummaryCache",
+    "SummaryDiff",
+    "TruncationReport",
     "build_output_payload",
+    "compact_actionable_binary",
     "compact_actionable_payload",
+    "decode_compact",
     "extract_page_semantics",
     "extract_from_url",
+    "extract_many",
+    "extract_sharded",
     "filter_actionable_elements",
     "filter_actionable_from_summary",
     "merge_actionable_elements",
+    "pack_actionable_payload",
     "rank_actionable_elements",
+    "rank_many",
+    "release_fingerprint",
+    "release_incremental",
+    "stream_page_semantics",
     "strip_fields",
+    "VECTOR_SCORE_TOLERANCE",
+    "VectorizedScorer",
 ]
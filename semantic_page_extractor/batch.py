@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AsyncExitStack
+
+from semantic_page_extractor.cache import SummaryCache
+from semantic_page_extractor.errors import ExtractionError
+from semantic_page_extractor.extractor import _extract_at
+from semantic_page_extractor.models import PageSummary
+from semantic_page_extractor.pool import ExtractorPool
+
+BatchResult = tuple[str, PageSummary | dict | list | ExtractionError]
+
+_DONE = object()
+
+
+async def _extract_one(
+    pool: ExtractorPool,
+    url: str,
+    wait_until: str,
+    timeout: float | None,
+    cache: SummaryCache | None,
+    output_options: dict,
+) -> BatchResult:
+    try:
+        async with pool.page() as page:
+            result = await asyncio.wait_for(_extract_at(page, url, wait_until, cache, **output_options), timeout)
+    except asyncio.TimeoutError:
+        return url, ExtractionError(f"URL extraction timed out after {timeout}s", code="URL_TIMEOUT")
+    except ExtractionError as exc:
+        return url, exc
+    except Exception as exc:
+        return url, ExtractionError(f"URL extraction failed: {exc}", code="URL_EXTRACTION_FAILED")
+    return url, result
+
+
+async def extract_many(
+    urls: Iterable[str],
+    *,
+    concurrency: int = 4,
+    wait_until: str = "load",
+    timeout: float | None = 30.0,
+    pool: ExtractorPool | None = None,
+    cache: SummaryCache | None = None,
+    actionable_only: bool = False,
+    intent: str | None = None,
+    min_score: float = 0.45,
+    max_results: int | None = None,
+    output_format: str | None = None,
+) -> AsyncIterator[BatchResult]:
+    if concurrency < 1:
+        raise ExtractionError("concurrency must be at least 1", code="INVALID_CONCURRENCY")
+    output_options = {
+        "actionable_only": actionable_only,
+        "intent": intent,
+        "min_score": min_score,
+        "max_results": max_results,
+        "output_format": output_format,
+    }
+    pending = iter(urls)
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def _worker(active: ExtractorPool) -> None:
+        outcome: object = _DONE
+        try:
+            for url in pending:
+                await results.put(await _extract_one(active, url, wait_until, timeout, cache, output_options))
+        except Exception as exc:
+            outcome = exc
+        await results.put(outcome)
+
+    async with AsyncExitStack() as stack:
+        active = pool
+        if active is None:
+            active = await stack.enter_async_context(ExtractorPool(max_pages_per_browser=concurrency))
+        workers = [asyncio.create_task(_worker(active)) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                item = await results.get()
+                if item is _DONE:
+                    running -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
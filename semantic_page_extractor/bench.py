@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from html import escape
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from semantic_page_extractor.browser_script import EXTRACTION_SCRIPT
+from semantic_page_extractor.extractor import _to_summary
+from semantic_page_extractor.output import build_output_payload, decode_compact
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+SAMPLE_PAGE = Path("tests", "fixtures", "sample-page.html")
+DATA_DIR = Path("data")
+
+TARGET_TOTAL_MS = 200.0
+TARGET_OUTPUT_BYTES = 15 * 1024
+DEFAULT_SIZES = (100, 500, 1000, 5000, 10000, 50000)
+PERCENTILES = (0.5, 0.9, 0.99)
+
+_WORDS = (
+    "account", "add", "address", "billing", "cart", "checkout", "color", "compare", "delivery", "details",
+    "gift", "help", "home", "login", "offers", "orders", "payment", "phone", "price", "product",
+    "quantity", "review", "search", "settings", "shipping", "size", "sort", "store", "track", "wishlist",
+)
+_FIELD_TYPES = ("text", "email", "number", "tel", "password", "search", "date", "checkbox")
+
+_INSTALL_SCRIPT = "(source) => { window.__semanticPageExtractorBench = (0, eval)(source); }"
+_TIMED_SCRIPT = """
+(options) => {
+  const start = performance.now();
+  const payload = window.__semanticPageExtractorBench(options);
+  return { payload, ms: performance.now() - start };
+}
+"""
+_COUNT_SCRIPT = """
+() => {
+  let count = 0;
+  const visit = (root) => {
+    for (const el of root.querySelectorAll("*")) {
+      count += 1;
+      if (el.shadowRoot) visit(el.shadowRoot);
+    }
+  };
+  visit(document);
+  return count;
+}
+"""
+_ATTACH_SHADOW_ROOTS = (
+    "<script>for (const host of document.querySelectorAll('[data-shadow]')) {"
+    " host.attachShadow({ mode: 'open' }).innerHTML = host.querySelector('template').innerHTML; }</script>"
+)
+
+
+def _phrase(rng: random.Random, words: int = 3) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _nest(html: str, depth: int) -> str:
+    return "<div>" * depth + html + "</div>" * depth
+
+
+def _link(rng: random.Random, index: int) -> str:
+    text = escape(f"{_phrase(rng, 2)} {index}")
+    if index % 10 == 0:
+        return f"<a href='/p/{index}'><img src='/img/{index}.png' alt='{text}'></a>"
+    if index % 25 == 1:
+        return f"<span role='button' aria-label='{text}'>{text}</span>"
+    style = " style='display:none'" if index % 20 == 3 else ""
+    return f"<a href='/p/{index}'{style}>{text}</a>"
+
+
+def _radio_group(rng: random.Random, group: int, options: int) -> str:
+    radios = "".join(
+        f"<label><input type='radio' name='group-{group}' value='{option}'> {escape(_phrase(rng, 1))} {option}</label>"
+        for option in range(options)
+    )
+    return f"<fieldset><legend>{escape(_phrase(rng))}</legend>{radios}</fieldset>"
+
+
+def _form(rng: random.Random, index: int, fields: int, radio_groups: list[str]) -> str:
+    parts = []
+    for field in range(fields):
+        field_id = f"f{index}-{field}"
+        label = f"<label for='{field_id}'>{escape(_phrase(rng, 2))}</label>"
+        if field % 5 == 4:
+            options = "".join(f"<option>{escape(_phrase(rng, 1))}</option>" for _ in range(5))
+            parts.append(f"{label}<select id='{field_id}'>{options}</select>")
+        elif field % 7 == 6:
+            parts.append(f"{label}<textarea id='{field_id}' placeholder='{escape(_phrase(rng))}'></textarea>")
+        else:
+            field_type = rng.choice(_FIELD_TYPES)
+            required = " required" if field % 3 == 0 else ""
+            disabled = " disabled" if field % 11 == 10 else ""
+            parts.append(f"{label}<input id='{field_id}' type='{field_type}'{required}{disabled}>")
+    parts.extend(radio_groups)
+    parts.append(f"<button type='submit'>{escape(_phrase(rng, 2))}</button>")
+    return f"<form>{''.join(parts)}</form>"
+
+
+def _shadow_host(rng: random.Random, index: int, links: list[str]) -> str:
+    content = f"<section><h3>{escape(_phrase(rng))}</h3>{''.join(links)}<button>{escape(_phrase(rng, 1))}</button></section>"
+    return f"<div data-shadow='{index}'><template>{content}</template></div>"
+
+
+def generate_page(
+    *,
+    headings: int = 10,
+    forms: int = 2,
+    fields_per_form: int = 4,
+    radio_groups: int = 2,
+    radios_per_group: int = 4,
+    links: int = 50,
+    depth: int = 3,
+    shadow_roots: int = 0,
+    seed: int = 0,
+) -> str:
+    rng = random.Random(seed)
+    sections = max(headings, 1)
+    link_html = [_link(rng, index) for index in range(links)]
+    groups = [_radio_group(rng, group, radios_per_group) for group in range(radio_groups)]
+
+    shadow_links = link_html[: len(link_html) * shadow_roots // (shadow_roots + sections)] if shadow_roots else []
+    light_links = link_html[len(shadow_links) :]
+    hosts = [
+        _shadow_host(rng, index, shadow_links[index::shadow_roots])
+        for index in range(shadow_roots)
+    ]
+    form_html = [
+        _form(rng, index, fields_per_form, groups[index::forms] if forms else [])
+        for index in range(forms)
+    ]
+    if not forms and groups:
+        form_html.append(f"<form>{''.join(groups)}</form>")
+
+    body = []
+    for section in range(sections):
+        parts = [f"<h2>{escape(_phrase(rng))} {section}</h2>"] if section < headings else []
+        parts.extend(f"<p>{link}</p>" for link in light_links[section::sections])
+        parts.extend(form_html[section::sections])
+        parts.extend(hosts[section::sections])
+        body.append(_nest(f"<section>{''.join(parts)}</section>", depth))
+    script = _ATTACH_SHADOW_ROOTS if shadow_roots else ""
+    return (
+        f"<html><head><title>Synthetic page {seed}</title></head>"
+        f"<body><h1>Synthetic catalog</h1><main>{''.join(body)}</main>{script}</body></html>"
+    )
+
+
+def scaled_page(elements: int, *, seed: int = 0) -> str:
+    units = max(elements / 75, 1)
+    return generate_page(
+        headings=math.ceil(2 * units),
+        forms=math.ceil(units / 2),
+        fields_per_form=6,
+        radio_groups=math.ceil(units / 2),
+        radios_per_group=4,
+        links=math.ceil(24 * units),
+        depth=3,
+        shadow_roots=math.floor(units / 5),
+        seed=seed,
+    )
+
+
+def page_from_actionables(items: list[dict], *, title: str = "Reference workload") -> str:
+    sections: dict[str, list[str]] = {}
+    for index, item in enumerate(items):
+        text = escape(item.get("visible_text") or "")
+        aria = item.get("aria_label")
+        aria_attr = f" aria-label='{escape(aria)}'" if aria else ""
+        disabled = " disabled" if item.get("disabled") else ""
+        role = item.get("role")
+        if role == "button":
+            html = f"<button{aria_attr}{disabled}>{text}</button>"
+        elif role == "image_link":
+            html = f"<a href='/r/{index}'{aria_attr}><img src='/img/{index}.png' alt='{text}'></a>"
+        else:
+            html = f"<a href='/r/{index}'{aria_attr}>{text}</a>"
+        sections.setdefault(item.get("section_context") or "", []).append(f"<p>{html}</p>")
+    body = "".join(
+        f"<section>{f'<h2>{escape(context)}</h2>' if context else ''}{''.join(parts)}</section>"
+        for context, parts in sections.items()
+    )
+    return f"<html><head><title>{escape(title)}</title></head><body>{body}</body></html>"
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_stage(values: list[float]) -> dict[str, float]:
+    stats = {f"p{round(q * 100)}": round(_percentile(values, q), 3) for q in PERCENTILES}
+    stats["max"] = round(max(values), 3)
+    return stats
+
+
+async def measure_workload(page: Page, html: str, *, repeats: int = 5) -> dict:
+    await page.set_content(html)
+    await page.evaluate(_INSTALL_SCRIPT, EXTRACTION_SCRIPT)
+    elements = await page.evaluate(_COUNT_SCRIPT)
+    options = {"transport": "object", "incremental": False}
+    stages: dict[str, list[float]] = {name: [] for name in ("browser_ms", "transfer_ms", "convert_ms", "serialize_ms", "total_ms")}
+    output = b""
+    summary = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        timed = await page.evaluate(_TIMED_SCRIPT, options)
+        evaluated = time.perf_counter()
+        summary = _to_summary(timed["payload"])
+        converted = time.perf_counter()
+        output = summary.model_dump_json().encode("utf-8")
+        serialized = time.perf_counter()
+
+        wall_ms = (evaluated - start) * 1000
+        stages["browser_ms"].append(timed["ms"])
+        stages["transfer_ms"].append(max(wall_ms - timed["ms"], 0.0))
+        stages["convert_ms"].append((converted - evaluated) * 1000)
+        stages["serialize_ms"].append((serialized - converted) * 1000)
+        stages["total_ms"].append((converted - start) * 1000)
+
+    compact = json.dumps(build_output_payload(summary, actionable_only=True, output_format="compact"), separators=(",", ":"))
+    total_p50 = _percentile(stages["total_ms"], 0.5)
+    return {
+        "elements": elements,
+        "html_bytes": len(html.encode("utf-8")),
+        "interactive_elements": len(summary.interactive_elements),
+        "forms": len(summary.forms),
+        "stages": {name: summarize_stage(values) for name, values in stages.items()},
+        "us_per_element": round(total_p50 * 1000 / max(elements, 1), 3),
+        "output_bytes": len(output),
+        "compact_bytes": len(compact.encode("utf-8")),
+        "meets_targets": {
+            "total_ms": total_p50 < TARGET_TOTAL_MS,
+            "output_bytes": len(output) < TARGET_OUTPUT_BYTES,
+        },
+    }
+
+
+def reference_workloads(
+    sample_page: str | os.PathLike[str] | None = SAMPLE_PAGE,
+    data_dir: str | os.PathLike[str] | None = DATA_DIR,
+) -> list[tuple[str, str]]:
+    sample_page = Path(sample_page) if sample_page is not None else None
+    data_dir = Path(data_dir) if data_dir is not None else None
+    workloads = []
+    if sample_page is not None and sample_page.is_file():
+        workloads.append((sample_page.name, sample_page.read_text(encoding="utf-8", errors="replace")))
+    for path in sorted(data_dir.glob("out*.json")) if data_dir is not None and data_dir.is_dir() else []:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        items = decode_compact(data) if isinstance(data, dict) else data
+        workloads.append((f"data/{path.name}", page_from_actionables(items, title=path.stem)))
+    return workloads
+
+
+async def run_benchmark(
+    *,
+    sizes: tuple[int, ...] | list[int] = DEFAULT_SIZES,
+    repeats: int = 5,
+    seed: int = 0,
+    sample_page: str | os.PathLike[str] | None = SAMPLE_PAGE,
+    data_dir: str | os.PathLike[str] | None = DATA_DIR,
+    launch_options: dict | None = None,
+) -> dict:
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(**(launch_options or {}))
+        try:
+            page = await browser.new_page()
+            reference = []
+            for name, html in reference_workloads(sample_page, data_dir):
+                reference.append({"workload": name, **await measure_workload(page, html, repeats=repeats)})
+            scaling = []
+            for size in sizes:
+                scaling.append({"target_elements": size, **await measure_workload(page, scaled_page(size, seed=seed), repeats=repeats)})
+            version = browser.version
+        finally:
+            await browser.close()
+
+    return {
+        "meta": {
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "chromium": version,
+            "repeats": repeats,
+            "seed": seed,
+            "targets": {"total_ms": TARGET_TOTAL_MS, "output_bytes": TARGET_OUTPUT_BYTES},
+        },
+        "reference": reference,
+        "scaling": scaling,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark extraction stages on reference and synthetic pages in local Chromium")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Approximate element counts for synthetic pages")
+    parser.add_argument("--repeats", type=int, default=5, help="Extraction runs per workload")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic page generator")
+    parser.add_argument("--sample-page", default=str(SAMPLE_PAGE), help="HTML reference page, skipped if missing")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="Directory of out*.json reference outputs, skipped if missing")
+    parser.add_argument("--output", default=None, help="Write JSON results to this path instead of stdout")
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    results = await run_benchmark(
+        sizes=args.sizes,
+        repeats=args.repeats,
+        seed=args.seed,
+        sample_page=args.sample_page,
+        data_dir=args.data_dir,
+    )
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,49 @@
 EXTRACTION_SCRIPT = r"""
-(() => {
+(options) => {
+  const opts = options || {};
+  const scopeRoot = typeof opts.root === "string" ? document.querySelector(opts.root) : opts.root || null;
+  if (opts.root && !(scopeRoot && scopeRoot.isConnected)) return null;
+  const startedAt = performance.now();
+  const budget = opts.budget || null;
+  const limit = (key) => (budget && budget[key] != null ? budget[key] : Infinity);
+  const maxElements = limit("max_elements");
+  const maxOptions = limit("max_options");
+  const maxTextLength = limit("max_text_length");
+  const deadline = startedAt + limit("deadline_ms");
+  const truncation = {
+    elements_limit_reached: false,
+    deadline_exceeded: false,
+    skipped_candidates: 0,
+    truncated_option_lists: 0,
+    truncated_texts: 0,
+  };
+  const overDeadline = () => {
+    if (!truncation.deadline_exceeded && deadline !== Infinity && performance.now() > deadline) {
+      truncation.deadline_exceeded = true;
+    }
+    return truncation.deadline_exceeded;
+  };
+  const clip = (value) => {
+    if (value == null || value.length <= maxTextLength) return value;
+    const chars = Array.from(value);
+    if (chars.length <= maxTextLength) return value;
+    truncation.truncated_texts += 1;
+    return chars.slice(0, maxTextLength).join("");
+  };
+  const collectOptions = (items, toValue) => {
+    const values = [];
+    for (const item of items) {
+      const value = toValue(item);
+      if (!value) continue;
+      if (values.length >= maxOptions) {
+        truncation.truncated_option_lists += 1;
+        break;
+      }
+      values.push(clip(value));
+    }
+    return values;
+  };
+
   const normalize = (v) => {
     if (v == null) return null;
     const s = String(v).replace(/\s+/g, " ").trim();
@@ -34,65 +78,446 @@ EXTRACTION_SCRIPT = r"""
       el.getAttribute("value")
     );
 
-  const isVisible = (el) => {
-    if (!el || !document.contains(el)) return false;
-    if (el.tagName && el.tagName.toLowerCase() === "area") {
-      const href = el.getAttribute("href");
-      const map = el.parentElement;
-      if (!href || !map || map.tagName.toLowerCase() !== "map") return false;
-      const mapName = map.getAttribute("name");
-      if (!mapName) return false;
-      const mappedImg = document.querySelector(`img[usemap="#${CSS.escape(mapName)}"]`);
-      return Boolean(mappedImg && isVisible(mappedImg));
+  const composedParent = (el) => el.parentElement || (el.parentNode && el.parentNode.host) || null;
+  const scopeBoundary = scopeRoot && composedParent(scopeRoot);
+
+  const forEachComposed = (root, callback) => {
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+    for (let el = root.nodeType === 1 ? root : walker.nextNode(); el; el = walker.nextNode()) {
+      callback(el);
+      if (el.shadowRoot) forEachComposed(el.shadowRoot, callback);
     }
-    const style = window.getComputedStyle(el);
-    if (style.display === "none" || style.visibility === "hidden") return false;
-    if (el.offsetParent === null) return false;
-    return true;
   };
 
-  const visibleText = (el) =>
-    normalize(el.innerText || el.textContent || el.getAttribute("value") || contextFromAttributes(el));
+  const INCREMENTAL_KEY = "__semanticPageExtractorIncremental";
+  const STREAM_KEY = "__semanticPageExtractorStreams";
+  const OBSERVER_OPTIONS = { subtree: true, childList: true, attributes: true, characterData: true };
+  const MAX_PENDING = 10000;
+  const PSEUDO_CLASSES = {
+    has: /:has\(/,
+    hover: /:hover/,
+    focus: /:focus/,
+    state: /:(checked|indeterminate|default|placeholder-shown|valid|invalid|user-valid|user-invalid|in-range|out-of-range|autofill|popover-open)/,
+  };
+  const STYLE_SELECTOR = "style,link[rel~='stylesheet']";
+  const CONTROL_TAGS = ["input", "select", "textarea", "option"];
+  const LISTENER_OPTIONS = { capture: true, passive: true };
+  const STRUCTURAL_ATTRIBUTES = new Set(["for", "type", "name", "href", "role"]);
+
+  const isStyleNode = (node) =>
+    node.nodeType === 1 && (node.matches(STYLE_SELECTOR) || Boolean(node.querySelector(STYLE_SELECTOR)));
 
-  const findSectionContext = (el) => {
-    const lastHeadingIn = (root) => {
-      const nodes = root.querySelectorAll("h1,h2,h3,legend");
-      for (let i = nodes.length - 1; i >= 0; i -= 1) {
-        const txt = visibleText(nodes[i]);
-        if (txt && isVisible(nodes[i])) return txt;
+  const createIncrementalState = () => {
+    const state = {
+      root: document.documentElement,
+      visibility: new WeakMap(),
+      text: new WeakMap(),
+      actions: new WeakMap(),
+      structure: null,
+      observed: new WeakSet(),
+      roots: new Set(),
+      pending: [],
+      running: new Set(),
+      pseudo: null,
+      reset: false,
+      runs: 0,
+      hash: location.hash,
+      styles: new Map(),
+      sheetIds: new WeakMap(),
+      sheets: 0,
+      controls: new WeakMap(),
+      documentControls: CONTROL_TAGS.map((tag) => document.getElementsByTagName(tag)),
+      undefinedElements: new Set(),
+    };
+    const queue = (item) => {
+      if (state.pending.length < MAX_PENDING) state.pending.push(item);
+      else state.reset = true;
+    };
+    state.observer = new MutationObserver((records) => {
+      for (const record of records) queue(record);
+    });
+    state.observer.observe(document, OBSERVER_OPTIONS);
+    const target = (event) => (event.composedPath ? event.composedPath()[0] : event.target);
+    const listeners = [];
+    const listen = (types, handler) => {
+      for (const type of types) {
+        window.addEventListener(type, handler, LISTENER_OPTIONS);
+        listeners.push([type, handler]);
       }
-      return null;
     };
+    const nativeAttachShadow = Element.prototype.attachShadow;
+    const attachShadow = function (init) {
+      const root = nativeAttachShadow.call(this, init);
+      queue({ subtree: this });
+      return root;
+    };
+    Element.prototype.attachShadow = attachShadow;
+    state.release = () => {
+      state.observer.disconnect();
+      for (const [type, handler] of listeners) window.removeEventListener(type, handler, LISTENER_OPTIONS);
+      if (Element.prototype.attachShadow === attachShadow) Element.prototype.attachShadow = nativeAttachShadow;
+    };
+    listen(["resize"], () => {
+      state.reset = true;
+    });
+    listen(["load", "error"], (event) => {
+      if (event.target && event.target.nodeType === 1 && event.target.matches(STYLE_SELECTOR)) state.reset = true;
+    });
+    listen(["mouseover"], (event) => queue({ pseudo: "hover", a: target(event), b: event.relatedTarget }));
+    listen(["focusin", "focusout"], (event) => queue({ pseudo: "focus", a: target(event), b: event.relatedTarget }));
+    listen(["change", "input"], (event) => queue({ pseudo: "state", el: target(event) }));
+    listen(["toggle"], (event) => queue({ sibling: target(event) }));
+    listen(["animationstart", "transitionrun"], (event) => state.running.add(target(event)));
+    listen(["animationend", "animationcancel", "transitionend", "transitioncancel"], (event) => {
+      state.running.delete(target(event));
+      queue({ subtree: target(event) });
+    });
+    return state;
+  };
 
-    let current = el;
-    while (current) {
-      if (current.matches && current.matches("fieldset")) {
-        const legend = current.querySelector(":scope > legend");
-        if (legend && isVisible(legend)) {
-          const txt = visibleText(legend);
-          if (txt) return txt;
+  const scanPseudoClasses = (state) => {
+    const found = { has: false, hover: false, focus: false, state: false };
+    const visitSheet = (sheet) => {
+      let rules;
+      try {
+        rules = sheet.cssRules;
+      } catch (error) {
+        for (const key of Object.keys(found)) found[key] = true;
+        return;
+      }
+      for (const rule of rules) {
+        if (rule.selectorText) {
+          for (const key of Object.keys(found)) {
+            if (PSEUDO_CLASSES[key].test(rule.selectorText)) found[key] = true;
+          }
+        }
+        if (rule.styleSheet) visitSheet(rule.styleSheet);
+        if (rule.cssRules) visitSheet(rule);
+      }
+    };
+    for (const scope of [document, ...state.roots]) {
+      for (const sheet of scope.styleSheets) visitSheet(sheet);
+      for (const sheet of scope.adoptedStyleSheets || []) visitSheet(sheet);
+    }
+    return found;
+  };
+
+  const styleSignatures = (state) => {
+    const signatures = new Map();
+    for (const scope of [document, ...state.roots]) {
+      const parts = [];
+      for (const sheet of [...scope.styleSheets, ...(scope.adoptedStyleSheets || [])]) {
+        if (!state.sheetIds.has(sheet)) state.sheetIds.set(sheet, state.sheets++);
+        let rules = -1;
+        try {
+          rules = sheet.cssRules.length;
+        } catch (error) {
+          rules = -1;
+        }
+        parts.push(`${state.sheetIds.get(sheet)}:${sheet.disabled ? 1 : 0}:${rules}`);
+      }
+      signatures.set(scope, parts.join(","));
+    }
+    return signatures;
+  };
+
+  const controlState = (el) =>
+    el.localName === "option" ? (el.selected ? "s" : "") : `${el.checked ? "c" : ""}${el.indeterminate ? "i" : ""}:${el.value}`;
+
+  const queueControlChanges = (state) => {
+    const lists = [...state.documentControls];
+    for (const root of state.roots) lists.push(root.querySelectorAll(CONTROL_TAGS.join(",")));
+    for (const list of lists) {
+      for (const el of list) {
+        const value = controlState(el);
+        const previous = state.controls.get(el);
+        if (previous !== undefined && previous !== value) state.pending.push({ pseudo: "state", el });
+        state.controls.set(el, value);
+      }
+    }
+  };
+
+  const discoverShadowRoots = (state, base, bases) => {
+    forEachComposed(base, (el) => {
+      if (el.localName.includes("-") && el.matches(":not(:defined)")) state.undefinedElements.add(el);
+      const root = el.shadowRoot;
+      if (!root || state.observed.has(root)) return;
+      state.observer.observe(root, OBSERVER_OPTIONS);
+      state.observed.add(root);
+      state.roots.add(root);
+      state.pseudo = null;
+      state.structure = null;
+      bases.add(el);
+    });
+  };
+
+  const rootElement = (node) => {
+    const root = node.getRootNode();
+    return root.host || document.documentElement;
+  };
+
+  const commonAncestor = (a, b) => {
+    if (!a || !b || a.nodeType !== 1 || b.nodeType !== 1 || !a.isConnected || !b.isConnected) {
+      return document.documentElement;
+    }
+    const ancestors = new Set();
+    for (let node = a; node; node = composedParent(node)) ancestors.add(node);
+    for (let node = b; node; node = composedParent(node)) {
+      if (ancestors.has(node)) return node;
+    }
+    return document.documentElement;
+  };
+
+  const recordBase = (record) => {
+    const node = record.type === "characterData" ? record.target.parentNode : record.target;
+    if (!node) return null;
+    const changed = [...record.addedNodes, ...record.removedNodes];
+    if (isStyleNode(node) || changed.some(isStyleNode)) return document.documentElement;
+    if (node === document || node === document.documentElement) return document.documentElement;
+    if (node.nodeType !== 1 && !node.host) return null;
+    if (document.head && document.head.contains(node)) return null;
+    if (node.getRootNode().host) return node.getRootNode().host;
+    return record.type === "attributes" ? composedParent(node) || node : node;
+  };
+
+  const changesStructure = (item) => {
+    if (item.type === "attributes") return STRUCTURAL_ATTRIBUTES.has(item.attributeName);
+    if (item.type !== "childList") return false;
+    return [...item.addedNodes, ...item.removedNodes].some((node) => node.nodeType === 1);
+  };
+
+  const pendingBase = (item, pseudo) => {
+    if (item.type) return recordBase(item);
+    if (item.subtree) return item.subtree.nodeType === 1 ? item.subtree : null;
+    if (item.sibling) return item.sibling.nodeType === 1 ? composedParent(item.sibling) || item.sibling : null;
+    if (!pseudo[item.pseudo] && !pseudo.has) return null;
+    if (item.pseudo === "state") {
+      const el = item.el;
+      if (!el || el.nodeType !== 1) return null;
+      if (el.type === "radio") return el.form || rootElement(el);
+      return composedParent(el) || el;
+    }
+    return commonAncestor(item.a, item.b);
+  };
+
+  const invalidate = (state, bases) => {
+    for (const base of bases) {
+      if (!base.isConnected) continue;
+      let covered = false;
+      for (let node = composedParent(base); node && !covered; node = composedParent(node)) covered = bases.has(node);
+      if (covered) continue;
+      for (let node = base; node; node = composedParent(node)) {
+        state.text.delete(node);
+        state.actions.delete(node);
+      }
+      forEachComposed(base, (el) => {
+        state.visibility.delete(el);
+        state.text.delete(el);
+        state.actions.delete(el);
+      });
+    }
+  };
+
+  const prepareIncremental = () => {
+    let state = window[INCREMENTAL_KEY];
+    if (!state || state.root !== document.documentElement) {
+      if (state) state.release();
+      state = createIncrementalState();
+      window[INCREMENTAL_KEY] = state;
+    }
+    for (const record of state.observer.takeRecords()) state.pending.push(record);
+    if (location.hash !== state.hash) {
+      state.hash = location.hash;
+      state.reset = true;
+    }
+
+    const bases = new Set();
+    if (state.reset || !state.runs) {
+      state.undefinedElements = new Set();
+      discoverShadowRoots(state, document, bases);
+    } else {
+      for (const item of state.pending) {
+        const added = item.type === "childList" ? item.addedNodes : item.subtree ? [item.subtree] : [];
+        for (const node of added) {
+          if (node.nodeType === 1 && node.isConnected) discoverShadowRoots(state, node, bases);
+        }
+      }
+      for (const el of state.undefinedElements) {
+        if (el.isConnected && !el.matches(":defined")) continue;
+        state.undefinedElements.delete(el);
+        if (!el.isConnected) continue;
+        bases.add(el);
+        discoverShadowRoots(state, el, bases);
+      }
+    }
+    for (const root of state.roots) {
+      if (!root.host.isConnected) state.roots.delete(root);
+    }
+    const styles = styleSignatures(state);
+    for (const [scope, signature] of styles) {
+      if (state.styles.has(scope) && state.styles.get(scope) !== signature) state.reset = true;
+    }
+    state.styles = styles;
+    queueControlChanges(state);
+
+    if (!state.reset) {
+      if (!state.pseudo) state.pseudo = scanPseudoClasses(state);
+      for (const item of state.pending) {
+        if (item.type && changesStructure(item)) state.structure = null;
+        const base = pendingBase(item, state.pseudo);
+        if (base === document.documentElement) {
+          state.reset = true;
+          break;
         }
+        if (base) bases.add(base);
+      }
+      for (const el of state.running) {
+        if (el.nodeType === 1 && el.isConnected) bases.add(el);
+        else state.running.delete(el);
+      }
+      if (state.pseudo.has && bases.size && state.runs) state.reset = true;
+    }
+    state.pending = [];
+
+    if (state.reset || !state.runs) {
+      state.visibility = new WeakMap();
+      state.text = new WeakMap();
+      state.actions = new WeakMap();
+      state.structure = null;
+      state.pseudo = null;
+      state.reset = false;
+    } else {
+      invalidate(state, bases);
+    }
+    state.runs += 1;
+    return state;
+  };
+
+  const incremental = opts.incremental ? prepareIncremental() : null;
+  const structure = incremental && incremental.structure && incremental.structure.scope === scopeRoot ? incremental.structure : null;
+
+  const supportsCheckVisibility = typeof Element.prototype.checkVisibility === "function";
+  const visibilityCache = incremental ? incremental.visibility : new WeakMap();
+  const textCache = incremental ? incremental.text : new WeakMap();
+  const actionPartsCache = incremental ? incremental.actions : new WeakMap();
+  const areaVisibilityCache = new WeakMap();
+  const mapVisibilityCache = new WeakMap();
+  const usemapImages = new Map();
+
+  const mappedImage = (root, usemap) => {
+    if (!usemapImages.has(root)) {
+      const images = new Map();
+      for (const img of root.querySelectorAll("img[usemap]")) {
+        const key = img.getAttribute("usemap");
+        if (!images.has(key)) images.set(key, img);
       }
+      usemapImages.set(root, images);
+    }
+    return usemapImages.get(root).get(usemap) || null;
+  };
+
+  const isRendered = (el) => {
+    if (supportsCheckVisibility && el.checkVisibility({ checkVisibilityCSS: true, visibilityProperty: true })) {
+      return el.offsetParent !== null;
+    }
+    const style = window.getComputedStyle(el);
+    if (style.display === "none" || style.visibility === "hidden") return false;
+    return el.offsetParent !== null;
+  };
+
+  const isMapVisible = (map) => {
+    if (!mapVisibilityCache.has(map)) {
+      const mapName = map.getAttribute("name");
+      const mappedImg = mapName ? mappedImage(map.getRootNode(), `#${mapName}`) : null;
+      mapVisibilityCache.set(map, Boolean(mappedImg && isVisible(mappedImg)));
+    }
+    return mapVisibilityCache.get(map);
+  };
+
+  const computeVisibility = (el) => {
+    if (!el.isConnected) return false;
+    if (el.tagName && el.tagName.toLowerCase() === "area") {
+      const map = el.parentElement;
+      if (!el.getAttribute("href") || !map || map.tagName.toLowerCase() !== "map") return false;
+      return isMapVisible(map);
+    }
+    return isRendered(el);
+  };
+
+  const isVisible = (el) => {
+    if (!el) return false;
+    const cache = el.localName === "area" ? areaVisibilityCache : visibilityCache;
+    if (!cache.has(el)) cache.set(el, computeVisibility(el));
+    return cache.get(el);
+  };
+
+  const visibleText = (el) => {
+    if (!textCache.has(el)) {
+      textCache.set(el, normalize(el.innerText || el.textContent || el.getAttribute("value") || contextFromAttributes(el)));
+    }
+    return textCache.get(el);
+  };
+
+  const documentOrder = structure ? structure.documentOrder : new Map();
+  const headingIndex = [];
+
+  const lastHeadingBefore = (el) => {
+    const parent = composedParent(el);
+    if (!parent) return null;
+    const order = documentOrder.get(el);
+    const parentOrder = documentOrder.get(parent);
+    let lo = 0;
+    let hi = headingIndex.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (headingIndex[mid].order < order) lo = mid + 1;
+      else hi = mid;
+    }
+    for (let i = lo - 1; i >= 0 && headingIndex[i].order > parentOrder; i -= 1) {
+      if (headingIndex[i].parent !== parent) return headingIndex[i].text;
+    }
+    return null;
+  };
+
+  const fieldsetLegend = (el) => {
+    if (!el.matches || !el.matches("fieldset")) return null;
+    const legend = el.querySelector(":scope > legend");
+    return legend && isVisible(legend) ? visibleText(legend) : null;
+  };
 
-      let prev = current.previousElementSibling;
-      while (prev) {
-        const found = lastHeadingIn(prev);
-        if (found) return found;
-        prev = prev.previousElementSibling;
+  const sectionCache = new Map();
+  const nearestHeading = (el) => {
+    const path = [];
+    let found = null;
+    let current = el;
+    while (current) {
+      if (sectionCache.has(current)) {
+        found = sectionCache.get(current);
+        break;
       }
-      current = current.parentElement;
+      path.push(current);
+      found = fieldsetLegend(current) || lastHeadingBefore(current);
+      if (found || current === scopeRoot) break;
+      current = composedParent(current);
     }
+    for (const node of path) sectionCache.set(node, found);
+    return found;
+  };
 
-    const globalHeader = document.querySelector("h1,h2,h3");
-    if (globalHeader && isVisible(globalHeader)) return visibleText(globalHeader);
+  let globalContext = null;
+
+  const findSectionContext = (el) => {
+    const found = nearestHeading(el);
+    if (found) return found;
+    if (globalContext) return globalContext.text;
 
     let node = el;
-    while (node && node !== document.body) {
+    while (node && node !== document.body && node !== scopeBoundary) {
       const fromId = normalize(node.getAttribute && node.getAttribute("id"));
       if (fromId) return fromId.replace(/[_-]+/g, " ");
       const fromClass = normalize(node.getAttribute && node.getAttribute("class"));
       if (fromClass) return fromClass.split(" ").filter(Boolean)[0].replace(/[_-]+/g, " ");
-      node = node.parentElement;
+      node = composedParent(node);
     }
     return null;
   };
@@ -105,26 +530,38 @@ EXTRACTION_SCRIPT = r"""
     return tag;
   };
 
+  const labelsFor = structure ? structure.labelsFor : new Map();
+  const radioGroups = structure ? structure.radioGroups : new Map();
+  const scopedTable = (tables, root) => {
+    if (!tables.has(root)) tables.set(root, new Map());
+    return tables.get(root);
+  };
+
+  const radioOptionsCache = new Map();
+  const radioGroupOptions = (el, name) => {
+    const root = el.getRootNode();
+    const group = scopedTable(radioGroups, root).get(name) || [];
+    if (!radioOptionsCache.has(group)) {
+      const labels = scopedTable(labelsFor, root);
+      const opts = collectOptions(group, (r) => {
+        if (!isVisible(r)) return null;
+        const id = r.getAttribute("id");
+        const forLabel = id ? labels.get(id) : null;
+        return normalize((forLabel && forLabel.textContent) || r.getAttribute("value") || r.getAttribute("aria-label"));
+      });
+      radioOptionsCache.set(group, opts.length ? opts : null);
+    }
+    return radioOptionsCache.get(group);
+  };
+
   const fieldOptions = (el) => {
     const t = fieldType(el);
     if (t === "select") {
-      return Array.from(el.querySelectorAll("option"))
-        .map((o) => normalize(o.textContent))
-        .filter(Boolean);
+      return collectOptions(el.querySelectorAll("option"), (o) => normalize(o.textContent));
     }
     if (t === "radio") {
       const name = el.getAttribute("name");
-      if (!name) return null;
-      const radios = document.querySelectorAll(`input[type=\"radio\"][name=\"${CSS.escape(name)}\"]`);
-      const opts = Array.from(radios)
-        .filter(isVisible)
-        .map((r) => {
-          const id = r.getAttribute("id");
-          const forLabel = id ? document.querySelector(`label[for=\"${CSS.escape(id)}\"]`) : null;
-          return normalize((forLabel && forLabel.textContent) || r.getAttribute("value") || r.getAttribute("aria-label"));
-        })
-        .filter(Boolean);
-      return opts.length ? opts : null;
+      return name ? radioGroupOptions(el, name) : null;
     }
     return null;
   };
@@ -132,7 +569,7 @@ EXTRACTION_SCRIPT = r"""
   const resolveLabelParts = (el) => {
     const id = el.getAttribute("id");
     const forLabel = id
-      ? normalize((document.querySelector(`label[for=\"${CSS.escape(id)}\"]`) || {}).textContent)
+      ? normalize((scopedTable(labelsFor, el.getRootNode()).get(id) || {}).textContent)
       : null;
     const wrappingLabel = el.closest("label");
     const wrapped = wrappingLabel ? normalize(wrappingLabel.textContent) : null;
@@ -144,7 +581,7 @@ EXTRACTION_SCRIPT = r"""
     };
   };
 
-  const toAction = (el) => {
+  const buildActionParts = (el) => {
     const tag = el.tagName.toLowerCase();
     const isAnchor = el.tagName.toLowerCase() === "a";
     const hasImg = isAnchor && el.querySelector("img");
@@ -169,63 +606,484 @@ EXTRACTION_SCRIPT = r"""
       visible_text: computedText,
       aria_label: normalize(el.getAttribute("aria-label")),
       disabled: Boolean(el.disabled || el.getAttribute("aria-disabled") === "true"),
-      section_context: findSectionContext(el),
     };
   };
 
+  const actionCache = new Map();
+  const toAction = (el) => {
+    if (!actionCache.has(el)) {
+      if (!actionPartsCache.has(el)) actionPartsCache.set(el, buildActionParts(el));
+      const parts = actionPartsCache.get(el);
+      actionCache.set(el, {
+        ...parts,
+        visible_text: clip(parts.visible_text),
+        aria_label: clip(parts.aria_label),
+        section_context: clip(findSectionContext(el)),
+      });
+    }
+    return actionCache.get(el);
+  };
+
+  const fieldCache = new Map();
   const toField = (el) => {
-    const parts = resolveLabelParts(el);
-    return {
-      ...parts,
-      type: fieldType(el),
-      required: Boolean(el.required || el.getAttribute("aria-required") === "true"),
-      options: fieldOptions(el),
-      disabled: Boolean(el.disabled || el.getAttribute("aria-disabled") === "true"),
-      section_context: findSectionContext(el),
-    };
+    if (!fieldCache.has(el)) {
+      const parts = resolveLabelParts(el);
+      fieldCache.set(el, {
+        label_for: clip(parts.label_for),
+        label_wrapped: clip(parts.label_wrapped),
+        aria_label: clip(parts.aria_label),
+        placeholder: clip(parts.placeholder),
+        type: fieldType(el),
+        required: Boolean(el.required || el.getAttribute("aria-required") === "true"),
+        options: fieldOptions(el),
+        disabled: Boolean(el.disabled || el.getAttribute("aria-disabled") === "true"),
+        section_context: clip(findSectionContext(el)),
+      });
+    }
+    return fieldCache.get(el);
   };
 
-  const headers = Array.from(document.querySelectorAll("h1,h2,h3"))
-    .filter(isVisible)
-    .map((h) => visibleText(h))
-    .filter(Boolean);
+  const FIELD_SELECTOR = "input,textarea,select";
+  const SUBMIT_SELECTOR = "button,input[type='submit'],input[type='button'],input[type='reset'],input[type='image'],[role='button']";
+  const INTERACTIVE_SELECTOR = "button,a[href],area[href],[role='button'],input[type='submit'],input[type='button'],input[type='reset'],input[type='image']";
+  const TRACKED_TAGS = new Set(["h1", "h2", "h3", "legend", "label", "form", "input", "textarea", "select", "button", "a", "area"]);
+  const NON_FIELD_TYPES = ["hidden", "submit", "button", "reset", "image"];
 
-  const forms = Array.from(document.querySelectorAll("form")).map((form) => {
-    const fields = Array.from(form.querySelectorAll("input,textarea,select"))
-      .filter(isVisible)
-      .filter((el) => {
-        const t = (el.getAttribute("type") || "").toLowerCase();
-        return !["hidden", "submit", "button", "reset", "image"].includes(t);
-      })
-      .map(toField);
+  const headers = [];
+  const headingElements = structure ? structure.headingElements : [];
+  const formRecords = structure ? structure.formRecords : [];
+  const candidates = structure ? structure.candidates : [];
+  let firstHeader = null;
 
-    const submits = Array.from(form.querySelectorAll("button,input[type='submit'],input[type='button'],input[type='reset'],input[type='image'],[role='button']"))
-      .filter(isVisible)
-      .map(toAction);
+  const indexHeading = (el) => {
+    const isHeader = el.matches("h1,h2,h3");
+    if (isHeader && !firstHeader) firstHeader = el;
+    const text = visibleText(el);
+    if (!text || !isVisible(el)) return;
+    headingIndex.push({ el, order: documentOrder.get(el), parent: composedParent(el), text });
+    if (isHeader) headers.push(text);
+  };
 
-    return {
-      section_context: findSectionContext(form),
-      fields,
-      submit_buttons: submits,
-    };
-  });
-
-  const seen = new Set();
-  const interactive = [];
-  const candidates = document.querySelectorAll("button,a[href],area[href],[role='button'],input[type='submit'],input[type='button'],input[type='reset'],input[type='image']");
-  for (const el of candidates) {
-    if (!isVisible(el)) continue;
-    if (seen.has(el)) continue;
-    seen.add(el);
-    interactive.push(toAction(el));
+  const visit = (el, root, forms) => {
+    documentOrder.set(el, documentOrder.size);
+    if (!TRACKED_TAGS.has(el.localName) && !el.hasAttribute("role")) return forms;
+    if (el.matches("h1,h2,h3,legend")) headingElements.push(el);
+    if (el.matches("label[for]")) {
+      const labels = scopedTable(labelsFor, root);
+      const id = el.getAttribute("for");
+      if (!labels.has(id)) labels.set(id, el);
+    }
+    if (el.matches("input[type='radio'][name]")) {
+      const groups = scopedTable(radioGroups, root);
+      const name = el.getAttribute("name");
+      if (!groups.has(name)) groups.set(name, []);
+      groups.get(name).push(el);
+    }
+    if (forms.length && el.matches(FIELD_SELECTOR)) {
+      for (const form of forms) form.fields.push(el);
+    }
+    if (el.matches(INTERACTIVE_SELECTOR)) {
+      candidates.push(el);
+      if (forms.length && el.matches(SUBMIT_SELECTOR)) {
+        for (const form of forms) form.submits.push(el);
+      }
+    }
+    if (el.matches("form")) {
+      const record = { el, fields: [], submits: [] };
+      formRecords.push(record);
+      return forms.concat([record]);
+    }
+    return forms;
+  };
+
+  let walked = 0;
+  const walkComposed = (root, owner = root, outerForms = []) => {
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+    const finish = (el) => {
+      if (el.shadowRoot) walkComposed(el.shadowRoot);
+    };
+    const stack = [];
+    let forms = outerForms;
+    let el = walker.firstChild();
+    while (el) {
+      if (truncation.deadline_exceeded || ((++walked & 255) === 0 && overDeadline())) return;
+      const childForms = visit(el, owner, forms);
+      if (walker.firstChild()) {
+        stack.push({ el, forms });
+        forms = childForms;
+        el = walker.currentNode;
+        continue;
+      }
+      finish(el);
+      while (!walker.nextSibling()) {
+        if (!stack.length) return;
+        const frame = stack.pop();
+        walker.currentNode = frame.el;
+        forms = frame.forms;
+        finish(frame.el);
+      }
+      el = walker.currentNode;
+    }
+  };
+
+  const walkScope = (el) => {
+    const owner = el.getRootNode();
+    const outerForms = [];
+    for (let node = el.parentElement; node; node = node.parentElement) {
+      if (node.localName === "form") outerForms.unshift({ el, fields: [], submits: [], outer: true });
+    }
+    formRecords.push(...outerForms);
+    walkComposed(el, owner, visit(el, owner, outerForms));
+    if (el.shadowRoot && !truncation.deadline_exceeded) walkComposed(el.shadowRoot);
+  };
+
+  if (!structure) {
+    if (scopeRoot) walkScope(scopeRoot);
+    else walkComposed(document);
   }
+  if (incremental && !truncation.deadline_exceeded) {
+    incremental.structure = { scope: scopeRoot, documentOrder, headingElements, labelsFor, radioGroups, formRecords, candidates };
+  }
+  for (const el of headingElements) {
+    if (overDeadline()) break;
+    indexHeading(el);
+  }
+  if (firstHeader && isVisible(firstHeader)) globalContext = { text: visibleText(firstHeader) };
+
+  const isFieldCandidate = (el) => !NON_FIELD_TYPES.includes((el.getAttribute("type") || "").toLowerCase());
+
+  const viewportDistance = (el) => {
+    const rect = el.getBoundingClientRect();
+    const dx = Math.max(0, rect.left - window.innerWidth, -rect.right);
+    const dy = Math.max(0, rect.top - window.innerHeight, -rect.bottom);
+    return dx + dy;
+  };
+
+  const selectWithinBudget = () => {
+    const fieldElements = new Set();
+    for (const record of formRecords) {
+      for (const el of record.fields) if (isFieldCandidate(el)) fieldElements.add(el);
+    }
+    const actionElements = new Set(candidates);
+    const ranked = [...new Set([...fieldElements, ...actionElements])].map((el) => ({
+      el,
+      distance: overDeadline() ? Infinity : viewportDistance(el),
+      order: documentOrder.get(el),
+    }));
+    ranked.sort((a, b) => a.distance - b.distance || a.order - b.order);
+
+    const selected = new Set();
+    for (let i = 0; i < ranked.length; i++) {
+      if (overDeadline()) {
+        truncation.skipped_candidates += ranked.length - i;
+        break;
+      }
+      const el = ranked[i].el;
+      if (!isVisible(el)) continue;
+      if (selected.size >= maxElements) {
+        truncation.elements_limit_reached = true;
+        truncation.skipped_candidates += 1;
+        continue;
+      }
+      selected.add(el);
+      if (fieldElements.has(el)) toField(el);
+      if (actionElements.has(el)) toAction(el);
+    }
+    return (el) => selected.has(el);
+  };
+
+  const allowed = budget ? selectWithinBudget() : isVisible;
+
+  const forms = formRecords
+    .filter((record) => !record.outer || record.fields.length || record.submits.length)
+    .map((record) => ({
+      section_context: clip(findSectionContext(record.el)),
+      fields: record.fields
+        .filter(allowed)
+        .filter(isFieldCandidate)
+        .map(toField),
+      submit_buttons: record.submits.filter(allowed).map(toAction),
+    }));
+
+  const interactive = candidates.filter(allowed).map(toAction);
+
+  const encodeTransport = (payload) => {
+    const strings = [];
+    const stringIds = new Map();
+    const str = (value) => {
+      if (value == null) return -1;
+      if (!stringIds.has(value)) {
+        stringIds.set(value, strings.length);
+        strings.push(value);
+      }
+      return stringIds.get(value);
+    };
+    const flag = (value) => (value ? 1 : 0);
+
+    const actions = [[], [], [], [], []];
+    const actionIds = new Map();
+    const action = (record) => {
+      if (!actionIds.has(record)) {
+        actionIds.set(record, actions[0].length);
+        actions[0].push(str(record.role));
+        actions[1].push(str(record.visible_text));
+        actions[2].push(str(record.aria_label));
+        actions[3].push(str(record.section_context));
+        actions[4].push(flag(record.disabled));
+      }
+      return actionIds.get(record);
+    };
+
+    const optionLists = [];
+    const optionIds = new Map();
+    const optionList = (values) => {
+      if (!values) return -1;
+      if (!optionIds.has(values)) {
+        optionIds.set(values, optionLists.length);
+        optionLists.push(values.map(str));
+      }
+      return optionIds.get(values);
+    };
+
+    const fields = [[], [], [], [], [], [], [], [], []];
+    const field = (record) => {
+      fields[0].push(str(record.label_for));
+      fields[1].push(str(record.label_wrapped));
+      fields[2].push(str(record.aria_label));
+      fields[3].push(str(record.placeholder));
+      fields[4].push(str(record.type));
+      fields[5].push(str(record.section_context));
+      fields[6].push(flag(record.required));
+      fields[7].push(flag(record.disabled));
+      fields[8].push(optionList(record.options));
+      return fields[0].length - 1;
+    };
+
+    const formColumns = [[], [], []];
+    for (const form of payload.forms) {
+      formColumns[0].push(str(form.section_context));
+      formColumns[1].push(form.fields.map(field));
+      formColumns[2].push(form.submit_buttons.map(action));
+    }
+    const interactiveIds = payload.interactive_elements.map(action);
+
+    return JSON.stringify({
+      v: 1,
+      u: str(payload.url),
+      t: str(payload.title),
+      h: payload.headers.map(str),
+      a: actions,
+      f: fields,
+      o: optionLists,
+      F: formColumns,
+      i: interactiveIds,
+      s: strings,
+      ...(payload.truncation ? { x: payload.truncation } : {}),
+    });
+  };
 
-  return {
+  const payload = {
     url: window.location.href,
-    title: document.title || "",
-    headers,
+    title: clip(document.title || ""),
+    headers: headers.map(clip),
     forms,
     interactive_elements: interactive,
   };
-})();
+  if (Object.values(truncation).some(Boolean)) payload.truncation = truncation;
+  if (opts.stream) {
+    const streams = window[STREAM_KEY] || (window[STREAM_KEY] = { next: 0, open: {} });
+    const id = ++streams.next;
+    streams.open[id] = payload;
+    return {
+      id,
+      url: payload.url,
+      title: payload.title,
+      counts: { headers: headers.length, forms: forms.length, interactive_elements: interactive.length },
+      truncation: payload.truncation || null,
+    };
+  }
+  return opts.transport === "json" ? encodeTransport(payload) : payload;
+}
+"""
+
+SCOPE_SCRIPT = r"""
+(el) => {
+  const step = (node) => {
+    const tag = node.localName;
+    if (node.id) return `${tag}#${CSS.escape(node.id)}`;
+    const siblings = node.parentNode ? [...node.parentNode.children].filter((child) => child.localName === tag) : [node];
+    return siblings.length > 1 ? `${tag}:nth-of-type(${siblings.indexOf(node) + 1})` : tag;
+  };
+  const path = (node) => {
+    const steps = [];
+    for (; node; node = node.parentElement) {
+      steps.unshift(step(node));
+      if (node.id) break;
+    }
+    return steps.join(" > ");
+  };
+  const parts = [];
+  for (let node = el; node; node = node.getRootNode().host || null) parts.unshift(path(node));
+  return parts.join(" >> ");
+}
+"""
+
+STREAM_CHUNK_SCRIPT = r"""
+({ id, section, offset, limit }) => {
+  const streams = window.__semanticPageExtractorStreams;
+  const payload = streams && streams.open[id];
+  if (!payload) return null;
+  const items = payload[section];
+  const end = Math.min(items.length, offset + limit);
+  const chunk = [];
+  for (let i = offset; i < end; i++) {
+    chunk.push(items[i]);
+    items[i] = null;
+  }
+  return chunk;
+}
+"""
+
+STREAM_RELEASE_SCRIPT = r"""
+(id) => {
+  const streams = window.__semanticPageExtractorStreams;
+  if (streams) delete streams.open[id];
+}
+"""
+
+INCREMENTAL_RELEASE_SCRIPT = r"""
+() => {
+  const state = window.__semanticPageExtractorIncremental;
+  if (!state) return false;
+  state.release();
+  delete window.__semanticPageExtractorIncremental;
+  return true;
+}
+"""
+
+FINGERPRINT_RELEASE_SCRIPT = r"""
+() => {
+  const state = window.__semanticPageExtractorFingerprint;
+  if (!state) return false;
+  state.release();
+  delete window.__semanticPageExtractorFingerprint;
+  return true;
+}
+"""
+
+FINGERPRINT_SCRIPT = r"""
+(options) => {
+  const opts = options || {};
+  const FINGERPRINT_KEY = "__semanticPageExtractorFingerprint";
+  const OBSERVER_OPTIONS = { subtree: true, childList: true, attributes: true, characterData: true };
+  const CONTROL_TAGS = new Set(["input", "select", "textarea", "option"]);
+  const DIRTY_EVENTS = [
+    "resize", "load", "error", "toggle", "animationend", "transitionend",
+    "change", "input", "focusin", "focusout", "hashchange", "popstate",
+  ];
+
+  const LISTENER_OPTIONS = { capture: true, passive: true };
+
+  let state = window[FINGERPRINT_KEY];
+  if (!state || state.root !== document.documentElement) {
+    if (state) state.release();
+    state = { root: document.documentElement, roots: [document], controls: [], observed: new WeakSet(), dirty: true, value: null, pending: 0 };
+    const markDirty = () => {
+      state.dirty = true;
+    };
+    state.observer = new MutationObserver(markDirty);
+    state.observer.observe(document, OBSERVER_OPTIONS);
+    for (const type of DIRTY_EVENTS) window.addEventListener(type, markDirty, LISTENER_OPTIONS);
+    const nativeAttachShadow = Element.prototype.attachShadow;
+    const attachShadow = function (init) {
+      const root = nativeAttachShadow.call(this, init);
+      markDirty();
+      return root;
+    };
+    Element.prototype.attachShadow = attachShadow;
+    state.release = () => {
+      state.observer.disconnect();
+      for (const type of DIRTY_EVENTS) window.removeEventListener(type, markDirty, LISTENER_OPTIONS);
+      if (Element.prototype.attachShadow === attachShadow) Element.prototype.attachShadow = nativeAttachShadow;
+    };
+    window[FINGERPRINT_KEY] = state;
+  }
+
+  const hex = (h) => (h >>> 0).toString(16).padStart(8, "0");
+  const undefinedElements = () => state.roots.reduce((total, root) => total + root.querySelectorAll(":not(:defined)").length, 0);
+
+  const viewport = `${window.innerWidth}x${window.innerHeight}`;
+  if (state.observer.takeRecords().length) state.dirty = true;
+  if (state.dirty || !state.value || state.value.viewport !== viewport || state.pending !== undefinedElements()) {
+    let h1 = 0x811c9dc5;
+    let h2 = 0x9747b28c;
+    let elements = 0;
+    let textLength = 0;
+    const mix = (value) => {
+      for (let i = 0; i < value.length; i++) {
+        const c = value.charCodeAt(i);
+        h1 = Math.imul(h1 ^ c, 0x01000193);
+        h2 = Math.imul(h2 ^ c, 0x5bd1e995);
+      }
+      h1 = Math.imul(h1 ^ 0xffff, 0x01000193);
+      h2 = Math.imul(h2 ^ 0xffff, 0x5bd1e995);
+    };
+
+    const roots = [document];
+    const controls = [];
+    const nodes = [document];
+    const depths = [0];
+    while (nodes.length) {
+      const node = nodes.pop();
+      const depth = depths.pop();
+      if (node.nodeType === 3) {
+        textLength += node.data.length;
+        mix(node.data);
+        continue;
+      }
+      if (node.nodeType === 1) {
+        elements += 1;
+        if (CONTROL_TAGS.has(node.localName)) controls.push(node);
+        mix(`<${depth}:${node.localName}`);
+        for (const attr of node.attributes) {
+          mix(attr.name);
+          mix(attr.value);
+        }
+        const root = node.shadowRoot;
+        if (root) {
+          if (!state.observed.has(root)) {
+            state.observer.observe(root, OBSERVER_OPTIONS);
+            state.observed.add(root);
+          }
+          roots.push(root);
+          nodes.push(root);
+          depths.push(depth + 1);
+        }
+      }
+      for (let child = node.lastChild; child; child = child.previousSibling) {
+        nodes.push(child);
+        depths.push(depth + 1);
+      }
+    }
+
+    state.value = { viewport, elements, text_length: textLength, hash: hex(h1) + hex(h2) };
+    state.roots = roots;
+    state.controls = controls;
+    state.pending = undefinedElements();
+    state.dirty = false;
+  }
+
+  let controlHash = 0x811c9dc5;
+  const mixControl = (value) => {
+    for (let i = 0; i < value.length; i++) controlHash = Math.imul(controlHash ^ value.charCodeAt(i), 0x01000193);
+    controlHash = Math.imul(controlHash ^ 0xffff, 0x01000193);
+  };
+  for (const el of state.controls) {
+    if (el.localName === "option") mixControl(el.selected ? "s" : "");
+    else mixControl(`${el.checked ? "c" : ""}${el.indeterminate ? "i" : ""}:${el.value}`);
+  }
+  const fingerprint = { url: location.href, title: document.title, ...state.value, controls: hex(controlHash) };
+  if (opts.scroll) fingerprint.scroll = `${window.scrollX},${window.scrollY}`;
+  return fingerprint;
+}
 """
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+from semantic_page_extractor.errors import ExtractionError
+
+
+@dataclass(frozen=True)
+class ExtractionBudget:
+    max_elements: int | None = None
+    max_options: int | None = None
+    max_text_length: int | None = None
+    deadline_ms: float | None = None
+
+    def __post_init__(self) -> None:
+        for name, value in asdict(self).items():
+            if value is not None and value < 0:
+                raise ExtractionError(f"Budget {name} must not be negative", code="INVALID_BUDGET")
+        if self.max_text_length == 0:
+            raise ExtractionError("Budget max_text_length must be at least 1", code="INVALID_BUDGET")
+
+    def to_script(self) -> dict:
+        return asdict(self)
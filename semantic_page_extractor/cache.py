@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from semantic_page_extractor.errors import ExtractionError
+from semantic_page_extractor.models import PageSummary
+from semantic_page_extractor.signatures import sha256_canonical
+
+_SUFFIX = ".spe-cache.json"
+
+
+def fingerprint_key(fingerprint: dict) -> str:
+    return sha256_canonical(fingerprint)
+
+
+class SummaryCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        directory: str | os.PathLike[str] | None = None,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        if max_entries < 1 or max_disk_bytes < 1:
+            raise ExtractionError("Cache sizes must be at least 1", code="INVALID_CACHE_CONFIG")
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, PageSummary] = OrderedDict()
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_bytes
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._memory),
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _load_disk_index(self) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, entry.name[: -len(_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def _forget_disk(self, key: str) -> None:
+        self._disk_bytes -= self._disk.pop(key, 0)
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            key = next(iter(self._disk))
+            self._forget_disk(key)
+            self._path(key).unlink(missing_ok=True)
+
+    def _read_disk(self, key: str) -> PageSummary | None:
+        if key not in self._disk:
+            return None
+        path = self._path(key)
+        try:
+            summary = PageSummary.model_validate_json(path.read_bytes())
+            os.utime(path)
+        except (OSError, ValueError):
+            self._forget_disk(key)
+            path.unlink(missing_ok=True)
+            return None
+        self._disk.move_to_end(key)
+        return summary
+
+    def _write_disk(self, key: str, summary: PageSummary) -> None:
+        data = summary.model_dump_json().encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".spe-cache.tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._forget_disk(key)
+        self._disk[key] = len(data)
+        self._disk_bytes += len(data)
+        self._evict_disk()
+
+    def _remember(self, key: str, summary: PageSummary) -> None:
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> PageSummary | None:
+        summary = self._memory.get(key)
+        if summary is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return summary
+        if self.directory is not None:
+            summary = self._read_disk(key)
+            if summary is not None:
+                self._remember(key, summary)
+                self.hits += 1
+                self.disk_hits += 1
+                return summary
+        self.misses += 1
+        return None
+
+    def put(self, key: str, summary: PageSummary) -> None:
+        self._remember(key, summary)
+        if self.directory is not None:
+            self._write_disk(key, summary)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.directory is not None:
+            for key in list(self._disk):
+                self._path(key).unlink(missing_ok=True)
+            self._disk.clear()
+            self._disk_bytes = 0
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+from semantic_page_extractor.models import FieldSummary, FormSummary, InteractiveElement, PageSummary
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class SignatureDiff(Generic[T]):
+    added: list[T] = field(default_factory=list)
+    removed: list[T] = field(default_factory=list)
+    changed: list[tuple[T, T]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self, signature: Callable[[T], str]) -> dict:
+        return {
+            "added": [item.model_dump(mode="json") for item in self.added],
+            "removed": [signature(item) for item in self.removed],
+            "changed": [new.model_dump(mode="json") for _, new in self.changed],
+        }
+
+
+@dataclass(frozen=True)
+class SummaryDiff:
+    page_signature_changed: bool
+    forms: SignatureDiff[FormSummary]
+    fields: SignatureDiff[FieldSummary]
+    interactive_elements: SignatureDiff[InteractiveElement]
+
+    def __bool__(self) -> bool:
+        return bool(self.page_signature_changed or self.forms or self.fields or self.interactive_elements)
+
+    def to_dict(self) -> dict:
+        return {
+            "page_signature_changed": self.page_signature_changed,
+            "forms": self.forms.to_dict(_form_key),
+            "fields": self.fields.to_dict(_field_key),
+            "interactive_elements": self.interactive_elements.to_dict(_action_key),
+        }
+
+
+def _form_key(form: FormSummary) -> str:
+    return form.form_signature
+
+
+def _field_key(field_summary: FieldSummary) -> str:
+    return field_summary.field_signature
+
+
+def _action_key(element: InteractiveElement) -> str:
+    return element.action_signature
+
+
+def _same(old: BaseModel, new: BaseModel) -> bool:
+    return old is new or old.__dict__ == new.__dict__
+
+
+def _same_items(old: list[BaseModel], new: list[BaseModel]) -> bool:
+    return len(old) == len(new) and all(_same(a, b) for a, b in zip(old, new))
+
+
+def _same_form(old: FormSummary, new: FormSummary) -> bool:
+    return old is new or (
+        old.form_signature == new.form_signature
+        and old.section_context == new.section_context
+        and _same_items(old.fields, new.fields)
+        and _same_items(old.submit_buttons, new.submit_buttons)
+    )
+
+
+def _diff_by_signature(
+    old: Sequence[T],
+    new: Sequence[T],
+    signature: Callable[[T], str],
+    same: Callable[[T, T], bool],
+) -> SignatureDiff[T]:
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and same(old[start], new[start]):
+        start += 1
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and same(old[old_end - 1], new[new_end - 1]):
+        old_end -= 1
+        new_end -= 1
+    if start == old_end == new_end:
+        return SignatureDiff()
+
+    pending: dict[str, deque[int]] = {}
+    for position in range(start, old_end):
+        pending.setdefault(signature(old[position]), deque()).append(position)
+
+    matched = [False] * len(old)
+    added: list[T] = []
+    changed: list[tuple[T, T]] = []
+    for item in new[start:new_end]:
+        positions = pending.get(signature(item))
+        if not positions:
+            added.append(item)
+            continue
+        position = positions.popleft()
+        matched[position] = True
+        if not same(old[position], item):
+            changed.append((old[position], item))
+
+    removed = [old[position] for position in range(start, old_end) if not matched[position]]
+    return SignatureDiff(added=added, removed=removed, changed=changed)
+
+
+def _fields(summary: PageSummary) -> list[FieldSummary]:
+    return [field_summary for form in summary.forms for field_summary in form.fields]
+
+
+def diff_summaries(old: PageSummary, new: PageSummary) -> SummaryDiff:
+    return SummaryDiff(
+        page_signature_changed=old.page_signature != new.page_signature,
+        forms=_diff_by_signature(old.forms, new.forms, _form_key, _same_form),
+        fields=_diff_by_signature(_fields(old), _fields(new), _field_key, _same),
+        interactive_elements=_diff_by_signature(old.interactive_elements, new.interactive_elements, _action_key, _same),
+    )
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
-from semantic_page_extractor.browser_script import EXTRACTION_SCRIPT
+from semantic_page_extractor.browser_script import (
+    EXTRACTION_SCRIPT,
+    FINGERPRINT_RELEASE_SCRIPT,
+    FINGERPRINT_SCRIPT,
+    INCREMENTAL_RELEASE_SCRIPT,
+    SCOPE_SCRIPT,
+)
+from semantic_page_extractor.budget import ExtractionBudget
+from semantic_page_extractor.cache import SummaryCache, fingerprint_key
 from semantic_page_extractor.errors import ExtractionError
-from semantic_page_extractor.models import FieldSummary, FormSummary, InteractiveElement, PageSummary
+from semantic_page_extractor.models import FieldSummary, FormSummary, InteractiveElement, PageSummary, TruncationReport
 from semantic_page_extractor.normalize import normalize_text, resolve_field_label, sort_key
 from semantic_page_extractor.output import build_output_payload
 from semantic_page_extractor.signatures import (
@@ -15,18 +23,43 @@ from semantic_page_extractor.signatures import (
     form_signature,
     page_signature,
 )
+from semantic_page_extractor.transport import decode_transport
 
 if TYPE_CHECKING:
-    from playwright.async_api import Page
+    from playwright.async_api import ElementHandle, Page
+
+    from semantic_page_extractor.pool import ExtractorPool
 
 SCHEMA_VERSION = "1.0"
+TRANSPORTS = ("object", "json")
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+
+def _build(model: type[_Model], trusted: bool, **values: object) -> _Model:
+    if not trusted:
+        return model(**values)
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
 
 
-def _to_interactive(raw: dict) -> InteractiveElement:
+def _to_interactive(
+    raw: dict,
+    actions: dict[int, InteractiveElement] | None = None,
+    trusted: bool = False,
+) -> InteractiveElement:
+    if actions is not None and id(raw) in actions:
+        return actions[id(raw)]
     text = normalize_text(raw.get("visible_text"))
     role = normalize_text(raw.get("role")) or "button"
     section_context = normalize_text(raw.get("section_context"))
-    return InteractiveElement(
+    element = _build(
+        InteractiveElement,
+        trusted,
         action_signature=action_signature(text, role, section_context),
         role=role,
         visible_text=text,
@@ -34,9 +67,12 @@ def _to_interactive(raw: dict) -> InteractiveElement:
         disabled=bool(raw.get("disabled", False)),
         section_context=section_context,
     )
+    if actions is not None:
+        actions[id(raw)] = element
+    return element
 
 
-def _to_field(raw: dict) -> FieldSummary:
+def _to_field(raw: dict, trusted: bool = False) -> FieldSummary:
     label = resolve_field_label(
         raw.get("label_for"),
         raw.get("label_wrapped"),
@@ -49,7 +85,9 @@ def _to_field(raw: dict) -> FieldSummary:
     normalized_options = (
         sorted(filter(None, (normalize_text(v) for v in options))) if isinstance(options, list) else None
     )
-    return FieldSummary(
+    return _build(
+        FieldSummary,
+        trusted,
         field_signature=field_signature(label, field_type, section_context),
         label=label,
         type=field_type,
@@ -60,13 +98,19 @@ def _to_field(raw: dict) -> FieldSummary:
     )
 
 
-def _to_form(raw: dict) -> FormSummary:
-    fields = [_to_field(item) for item in raw.get("fields", [])]
-    submits = [_to_interactive(item) for item in raw.get("submit_buttons", [])]
+def _to_form(
+    raw: dict,
+    actions: dict[int, InteractiveElement] | None = None,
+    trusted: bool = False,
+) -> FormSummary:
+    fields = [_to_field(item, trusted) for item in raw.get("fields", [])]
+    submits = [_to_interactive(item, actions, trusted) for item in raw.get("submit_buttons", [])]
     fields.sort(key=lambda f: sort_key(f.field_signature, f.label, f.type))
     submits.sort(key=lambda a: sort_key(a.action_signature, a.role, a.visible_text))
     section_context = normalize_text(raw.get("section_context"))
-    return FormSummary(
+    return _build(
+        FormSummary,
+        trusted,
         form_signature=form_signature(
             [f.field_signature for f in fields],
             [s.action_signature for s in submits],
@@ -78,70 +122,189 @@ def _to_form(raw: dict) -> FormSummary:
     )
 
 
-async def extract_page_semantics(page: "Page") -> PageSummary:
+def _to_truncation(raw: dict | None, trusted: bool = False) -> TruncationReport | None:
+    if not raw:
+        return None
+    return _build(
+        TruncationReport,
+        trusted,
+        elements_limit_reached=bool(raw.get("elements_limit_reached")),
+        deadline_exceeded=bool(raw.get("deadline_exceeded")),
+        skipped_candidates=int(raw.get("skipped_candidates", 0)),
+        truncated_option_lists=int(raw.get("truncated_option_lists", 0)),
+        truncated_texts=int(raw.get("truncated_texts", 0)),
+    )
+
+
+def _to_summary(raw: dict, trusted: bool = False, scope: str | None = None) -> PageSummary:
+    headers = sorted(
+        filter(None, (normalize_text(h) for h in raw.get("headers", []))),
+        key=lambda h: h.lower(),
+    )
+    actions: dict[int, InteractiveElement] = {}
+    forms = [_to_form(item, actions, trusted) for item in raw.get("forms", [])]
+    interactive = [_to_interactive(item, actions, trusted) for item in raw.get("interactive_elements", [])]
+
+    forms.sort(key=lambda f: sort_key(f.form_signature, f.section_context))
+    interactive.sort(key=lambda a: sort_key(a.action_signature, a.role, a.visible_text))
+
+    return _build(
+        PageSummary,
+        trusted,
+        schema_version=SCHEMA_VERSION,
+        url=str(raw.get("url") or ""),
+        title=normalize_text(raw.get("title")) or "",
+        page_signature=page_signature(
+            title=raw.get("title") or "",
+            headers=headers,
+            forms_count=len(forms),
+            interactive_count=len(interactive),
+        ),
+        headers=headers,
+        forms=forms,
+        interactive_elements=interactive,
+        scope=scope,
+        truncation=_to_truncation(raw.get("truncation"), trusted),
+    )
+
+
+def _script_options(
+    transport: str,
+    incremental: bool,
+    budget: ExtractionBudget | None,
+    root: str | ElementHandle | None = None,
+) -> dict:
+    options: dict = {"transport": transport, "incremental": incremental}
+    if budget is not None:
+        options["budget"] = budget.to_script()
+    if root is not None:
+        options["root"] = root
+    return options
+
+
+async def _resolve_scope(page: Page, root: str | ElementHandle | None) -> str | None:
+    if isinstance(root, str):
+        if not root.strip():
+            raise ExtractionError("root selector must not be empty", code="INVALID_ROOT")
+        return root
+    if root is None:
+        return None
     try:
-        raw = await page.evaluate(EXTRACTION_SCRIPT)
+        return await page.evaluate(SCOPE_SCRIPT, root)
+    except Exception as exc:  # pragma: no cover
+        raise ExtractionError(f"Browser scope resolution failed: {exc}") from exc
+
+
+async def extract_page_semantics(
+    page: "Page",
+    *,
+    transport: str = "object",
+    trusted: bool = False,
+    incremental: bool = False,
+    cache: SummaryCache | None = None,
+    budget: ExtractionBudget | None = None,
+    root: str | ElementHandle | None = None,
+) -> PageSummary:
+    if transport not in TRANSPORTS:
+        raise ExtractionError(f"Unsupported transport: {transport}", code="INVALID_TRANSPORT")
+    scope = await _resolve_scope(page, root)
+    key = None
+    if cache is not None:
+        try:
+            fingerprint = await page.evaluate(FINGERPRINT_SCRIPT, {"scroll": budget is not None})
+        except Exception as exc:  # pragma: no cover
+            raise ExtractionError(f"Browser fingerprint failed: {exc}") from exc
+        if budget is not None:
+            fingerprint = {**fingerprint, "budget": budget.to_script()}
+        if scope is not None:
+            fingerprint = {**fingerprint, "scope": scope}
+        key = fingerprint_key(fingerprint)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    try:
+        raw = await page.evaluate(EXTRACTION_SCRIPT, _script_options(transport, incremental, budget, root))
     except Exception as exc:  # pragma: no cover
         raise ExtractionError(f"Browser extraction failed: {exc}") from exc
+    if raw is None:
+        raise ExtractionError(f"Extraction root not found: {scope}", code="ROOT_NOT_FOUND")
 
     try:
-        headers = sorted(
-            filter(None, (normalize_text(h) for h in raw.get("headers", []))),
-            key=lambda h: h.lower(),
-        )
-        forms = [_to_form(item) for item in raw.get("forms", [])]
-        interactive = [_to_interactive(item) for item in raw.get("interactive_elements", [])]
-
-        forms.sort(key=lambda f: sort_key(f.form_signature, f.section_context))
-        interactive.sort(key=lambda a: sort_key(a.action_signature, a.role, a.visible_text))
-
-        return PageSummary(
-            schema_version=SCHEMA_VERSION,
-            url=str(raw.get("url") or ""),
-            title=normalize_text(raw.get("title")) or "",
-            page_signature=page_signature(
-                title=raw.get("title") or "",
-                headers=headers,
-                forms_count=len(forms),
-                interactive_count=len(interactive),
-            ),
-            headers=headers,
-            forms=forms,
-            interactive_elements=interactive,
-        )
+        if transport == "json":
+            raw = decode_transport(raw)
+        summary = _to_summary(raw, trusted, scope)
     except ValidationError as exc:
         raise ExtractionError(f"Schema validation failed: {exc}", code="SCHEMA_VALIDATION_FAILED") from exc
     except Exception as exc:
         raise ExtractionError(f"Semantic extraction failed: {exc}") from exc
+    if cache is not None and not (summary.truncation and summary.truncation.deadline_exceeded):
+        cache.put(key, summary)
+    return summary
+
+
+async def release_incremental(page: "Page") -> bool:
+    try:
+        return bool(await page.evaluate(INCREMENTAL_RELEASE_SCRIPT))
+    except Exception as exc:  # pragma: no cover
+        raise ExtractionError(f"Browser release failed: {exc}") from exc
+
+
+async def release_fingerprint(page: "Page") -> bool:
+    try:
+        return bool(await page.evaluate(FINGERPRINT_RELEASE_SCRIPT))
+    except Exception as exc:  # pragma: no cover
+        raise ExtractionError(f"Browser release failed: {exc}") from exc
+
+
+async def _extract_at(
+    page: Page,
+    url: str,
+    wait_until: str,
+    cache: SummaryCache | None = None,
+    **output_options: object,
+) -> PageSummary | dict | list:
+    await page.goto(url, wait_until=wait_until)
+    result: PageSummary | dict | list = await extract_page_semantics(page, cache=cache)
+    if (
+        output_options["actionable_only"]
+        or output_options["intent"]
+        or output_options["max_results"] is not None
+        or output_options["output_format"]
+    ):
+        result = build_output_payload(result, **output_options)
+    return result
 
 
 async def extract_from_url(
     url: str,
     wait_until: str = "load",
     *,
+    pool: ExtractorPool | None = None,
+    cache: SummaryCache | None = None,
     actionable_only: bool = False,
     intent: str | None = None,
     min_score: float = 0.45,
     max_results: int | None = None,
     output_format: str | None = None,
 ) -> PageSummary | dict | list:
+    output_options = {
+        "actionable_only": actionable_only,
+        "intent": intent,
+        "min_score": min_score,
+        "max_results": max_results,
+        "output_format": output_format,
+    }
     try:
+        if pool is not None:
+            async with pool.page() as page:
+                return await _extract_at(page, url, wait_until, cache, **output_options)
+
         from playwright.async_api import async_playwright
 
         async with async_playwright() as p:
             browser = await p.chromium.launch()
             page = await browser.new_page()
-            await page.goto(url, wait_until=wait_until)
-            result: PageSummary | dict | list = await extract_page_semantics(page)
-            if actionable_only or intent or max_results is not None or output_format:
-                result = build_output_payload(
-                    result,
-                    actionable_only=actionable_only,
-                    intent=intent,
-                    min_score=min_score,
-                    max_results=max_results,
-                    output_format=output_format,
-                )
+            result = await _extract_at(page, url, wait_until, cache, **output_options)
             await browser.close()
             return result
     except Exception as exc:
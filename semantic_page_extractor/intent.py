@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import heapq
 import re
+from collections import Counter
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 
@@ -37,24 +39,55 @@ def _search_text(element: InteractiveElement) -> str:
     return " ".join(part for part in _search_fields(element) if part).strip().lower()
 
 
-def _score_element(element: InteractiveElement, query: str) -> float:
+@dataclass(frozen=True)
+class _PreparedElement:
+    element: InteractiveElement
+    fields: tuple[str, ...]
+    haystack: str
+
+
+def _prepare_element(element: InteractiveElement) -> _PreparedElement:
+    return _PreparedElement(
+        element=element,
+        fields=tuple(field.lower() for field in _search_fields(element) if field),
+        haystack=_search_text(element),
+    )
+
+
+def _prepare_query(query: str) -> tuple[str, list[str]]:
     q = (normalize_text(query) or "").lower()
-    if not q:
-        return 0.0
+    return q, _tokens(q)
 
-    fields = _search_fields(element)
-    haystack = _search_text(element)
-    q_tokens = _tokens(q)
-    if not haystack:
+
+def _score_prepared(prepared: _PreparedElement, q: str, q_tokens: list[str]) -> float:
+    if not q or not prepared.haystack:
         return 0.0
 
-    exact = 1.0 if any(q in field.lower() for field in fields if field) else 0.0
-    token_hits = sum(1 for token in q_tokens if token in haystack) if q_tokens else 0
+    exact = 1.0 if any(q in field for field in prepared.fields) else 0.0
+    token_hits = sum(1 for token in q_tokens if token in prepared.haystack) if q_tokens else 0
     token_coverage = (token_hits / len(q_tokens)) if q_tokens else 0.0
-    fuzzy = max(SequenceMatcher(None, q, field.lower()).ratio() for field in fields + [haystack] if field)
+    fuzzy = max(SequenceMatcher(None, q, field).ratio() for field in (*prepared.fields, prepared.haystack))
     return round((0.5 * exact) + (0.3 * token_coverage) + (0.2 * fuzzy), 6)
 
 
+def _score_element(element: InteractiveElement, query: str) -> float:
+    q, q_tokens = _prepare_query(query)
+    return _score_prepared(_prepare_element(element), q, q_tokens)
+
+
+def _rank_key(item: RankedActionableElement) -> tuple:
+    return (
+        -item.score,
+        *sort_key(
+            item.element.action_signature,
+            item.element.role,
+            item.element.visible_text,
+            item.element.aria_label,
+            item.element.section_context,
+        ),
+    )
+
+
 def rank_actionable_elements(
     elements: list[InteractiveElement],
     query: str,
@@ -63,30 +96,111 @@ def rank_actionable_elements(
         RankedActionableElement(element=element, score=_score_element(element, query))
         for element in elements
     ]
-    ranked.sort(
-        key=lambda item: (
-            -item.score,
-            *sort_key(
-                item.element.action_signature,
-                item.element.role,
-                item.element.visible_text,
-                item.element.aria_label,
-                item.element.section_context,
-            ),
-        )
-    )
+    ranked.sort(key=_rank_key)
     return ranked
 
 
+@dataclass(frozen=True)
+class _WorstFirst:
+    key: tuple
+    element: InteractiveElement
+
+    def __lt__(self, other: _WorstFirst) -> bool:
+        return self.key > other.key
+
+
+def _element_key(element: InteractiveElement, score: float, position: int) -> tuple:
+    return (
+        -score,
+        *sort_key(
+            element.action_signature,
+            element.role,
+            element.visible_text,
+            element.aria_label,
+            element.section_context,
+        ),
+        position,
+    )
+
+
+def _common_chars(q_counts: Counter, value: str) -> int:
+    counts = Counter(value)
+    return sum(min(n, counts[char]) for char, n in q_counts.items())
+
+
+def _pruned_score(
+    prepared: _PreparedElement,
+    position: int,
+    q: str,
+    q_tokens: list[str],
+    q_counts: Counter,
+    min_score: float,
+    worst: tuple | None,
+) -> float | None:
+    if not q or not prepared.haystack:
+        base = 0.0
+        candidates: tuple[str, ...] = ()
+    else:
+        exact = 1.0 if any(q in field for field in prepared.fields) else 0.0
+        token_hits = sum(1 for token in q_tokens if token in prepared.haystack) if q_tokens else 0
+        token_coverage = (token_hits / len(q_tokens)) if q_tokens else 0.0
+        base = (0.5 * exact) + (0.3 * token_coverage)
+        candidates = (*prepared.fields, prepared.haystack)
+
+    def _beaten(fuzzy: float) -> bool:
+        bound = round(base + (0.2 * fuzzy), 6) if candidates else 0.0
+        return bound < min_score or (worst is not None and _element_key(prepared.element, bound, position) > worst)
+
+    if not candidates:
+        return None if _beaten(0.0) else 0.0
+
+    total = [len(q) + len(field) for field in candidates]
+    if _beaten(max(2.0 * min(len(q), len(field)) / size for field, size in zip(candidates, total))):
+        return None
+    quick = [2.0 * _common_chars(q_counts, field) / size for field, size in zip(candidates, total)]
+    if _beaten(max(quick)):
+        return None
+
+    fuzzy = 0.0
+    for bound, field in sorted(zip(quick, candidates), key=lambda item: -item[0]):
+        if bound <= fuzzy:
+            break
+        fuzzy = max(fuzzy, SequenceMatcher(None, q, field).ratio())
+    if _beaten(fuzzy):
+        return None
+    return round(base + (0.2 * fuzzy), 6)
+
+
 def filter_actionable_elements(
     elements: list[InteractiveElement],
     query: str,
     min_score: float = 0.45,
     max_results: int | None = None,
 ) -> list[InteractiveElement]:
-    ranked = rank_actionable_elements(elements, query)
-    filtered = [item.element for item in ranked if item.score >= min_score]
-    return filtered[:max_results] if max_results is not None else filtered
+    if max_results is not None and max_results < 0:
+        ranked = rank_actionable_elements(elements, query)
+        return [item.element for item in ranked if item.score >= min_score][:max_results]
+    if max_results == 0:
+        return []
+
+    q, q_tokens = _prepare_query(query)
+    q_counts = Counter(q)
+    kept: list[_WorstFirst] = []
+    for position, element in enumerate(elements):
+        full = max_results is not None and len(kept) >= max_results
+        score = _pruned_score(
+            _prepare_element(element), position, q, q_tokens, q_counts, min_score, kept[0].key if full else None
+        )
+        if score is None:
+            continue
+        item = _WorstFirst(key=_element_key(element, score, position), element=element)
+        if max_results is None:
+            kept.append(item)
+        elif full:
+            heapq.heapreplace(kept, item)
+        else:
+            heapq.heappush(kept, item)
+    return [item.element for item in sorted(kept, key=lambda item: item.key)]
 
 
 def filter_actionable_from_summary(
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+
+from semantic_page_extractor.actionable import extract_actionable_elements
+from semantic_page_extractor.intent import (
+    RankedActionableElement,
+    _element_key,
+    _prepare_element,
+    _prepare_query,
+    _pruned_score,
+    _rank_key,
+    _score_prepared,
+    _TOKEN_RE,
+    _WorstFirst,
+)
+from semantic_page_extractor.models import InteractiveElement, PageSummary
+
+# Without an exact or token match an element can only score 0.2 * fuzzy.
+_FUZZY_ONLY_CEILING = 0.2
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[i : i + 3] for i in range(len(value) - 2)}
+
+
+class ActionableIndex:
+    def __init__(self, elements: list[InteractiveElement]) -> None:
+        self._prepared = [_prepare_element(element) for element in elements]
+        self._postings: dict[str, list[int]] = {}
+        for idx, prepared in enumerate(self._prepared):
+            for token in dict.fromkeys(_TOKEN_RE.findall(prepared.haystack)):
+                self._postings.setdefault(token, []).append(idx)
+        self._trigram_tokens: dict[str, set[str]] = {}
+        for token in self._postings:
+            for trigram in _trigrams(token):
+                self._trigram_tokens.setdefault(trigram, set()).add(token)
+
+    @classmethod
+    def from_summary(cls, summary: PageSummary) -> ActionableIndex:
+        return cls(extract_actionable_elements(summary))
+
+    def __len__(self) -> int:
+        return len(self._prepared)
+
+    def _vocabulary_matches(self, token: str) -> set[str]:
+        if len(token) < 3:
+            return {candidate for candidate in self._postings if token in candidate}
+        buckets = [self._trigram_tokens.get(trigram) for trigram in _trigrams(token)]
+        if not all(buckets):
+            return set()
+        shared = set.intersection(*buckets)
+        return {candidate for candidate in shared if token in candidate}
+
+    def _candidates(self, q_tokens: list[str], min_score: float) -> list[int]:
+        if not q_tokens or min_score <= _FUZZY_ONLY_CEILING:
+            return list(range(len(self._prepared)))
+        hits: set[int] = set()
+        for token in dict.fromkeys(q_tokens):
+            for candidate in self._vocabulary_matches(token):
+                hits.update(self._postings[candidate])
+        return sorted(hits)
+
+    def rank(self, query: str, min_score: float = 0.45) -> list[RankedActionableElement]:
+        q, q_tokens = _prepare_query(query)
+        ranked = []
+        for idx in self._candidates(q_tokens, min_score):
+            prepared = self._prepared[idx]
+            score = _score_prepared(prepared, q, q_tokens)
+            if score >= min_score:
+                ranked.append(RankedActionableElement(element=prepared.element, score=score))
+        ranked.sort(key=_rank_key)
+        return ranked
+
+    def top(self, query: str, min_score: float = 0.45, max_results: int | None = None) -> list[RankedActionableElement]:
+        if max_results is not None and max_results < 0:
+            return self.rank(query, min_score=min_score)[:max_results]
+        if max_results == 0:
+            return []
+        q, q_tokens = _prepare_query(query)
+        q_counts = Counter(q)
+        kept: list[_WorstFirst] = []
+        for idx in self._candidates(q_tokens, min_score):
+            prepared = self._prepared[idx]
+            full = max_results is not None and len(kept) >= max_results
+            score = _pruned_score(prepared, idx, q, q_tokens, q_counts, min_score, kept[0].key if full else None)
+            if score is None:
+                continue
+            item = _WorstFirst(key=_element_key(prepared.element, score, idx), element=prepared.element)
+            if max_results is None:
+                kept.append(item)
+            elif full:
+                heapq.heapreplace(kept, item)
+            else:
+                heapq.heappush(kept, item)
+        return [
+            RankedActionableElement(element=item.element, score=-item.key[0])
+            for item in sorted(kept, key=lambda item: item.key)
+        ]
+
+    def filter(
+        self,
+        query: str,
+        min_score: float = 0.45,
+        max_results: int | None = None,
+    ) -> list[InteractiveElement]:
+        return [item.element for item in self.top(query, min_score=min_score, max_results=max_results)]
+
+
+def rank_many(
+    summary: PageSummary,
+    queries: list[str],
+    min_score: float = 0.45,
+    max_results: int | None = None,
+) -> list[list[RankedActionableElement]]:
+    index = ActionableIndex.from_summary(summary)
+    results: dict[str, list[RankedActionableElement]] = {}
+    for query in queries:
+        if query not in results:
+            results[query] = index.top(query, min_score=min_score, max_results=max_results)
+    return [list(results[query]) for query in queries]
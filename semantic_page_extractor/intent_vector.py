@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from semantic_page_extractor.intent import (
+    RankedActionableElement,
+    _prepare_element,
+    _prepare_query,
+    _rank_key,
+)
+from semantic_page_extractor.models import InteractiveElement, PageSummary
+
+from .actionable import extract_actionable_elements
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Exact and token components are computed exactly; only the 0.2-weighted fuzzy part
+# is estimated, so scores can never differ by more than 0.2. On data/out*.json the
+# observed maximum is about 0.06.
+VECTOR_SCORE_TOLERANCE = 0.1
+
+_SEPARATOR = "\n"
+_BLOCK_CELLS = 1 << 22
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for the vectorized intent backend: pip install 'semantic-page-extractor[vector]'")
+
+
+def _ngrams(value: str, n: int) -> list[tuple[str, int]]:
+    padded = f" {value} " if n == 2 else value
+    seen: dict[str, int] = {}
+    grams = []
+    for i in range(len(padded) - n + 1):
+        gram = padded[i : i + n]
+        seen[gram] = seen.get(gram, 0) + 1
+        grams.append((gram, seen[gram]))
+    return grams
+
+
+class _GramMatrix:
+    def __init__(self, strings: list[str], n: int) -> None:
+        self.n = n
+        self.vocab: dict[tuple[str, int], int] = {}
+        feature_ids: list[int] = []
+        string_ids: list[int] = []
+        for sid, value in enumerate(strings):
+            for gram in _ngrams(value, n):
+                feature_ids.append(self.vocab.setdefault(gram, len(self.vocab)))
+                string_ids.append(sid)
+        features = np.asarray(feature_ids, dtype=np.int64)
+        order = np.argsort(features, kind="stable")
+        self.postings = np.asarray(string_ids, dtype=np.int64)[order]
+        self.indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(features, minlength=len(self.vocab)), out=self.indptr[1:])
+        self.sizes = np.asarray([len(v) + (1 if n == 2 else 0) for v in strings], dtype=np.float64)
+        self.count = len(strings)
+
+    def dice(self, queries: list[str]) -> np.ndarray:
+        rows: list[np.ndarray] = []
+        sizes = np.zeros(len(queries), dtype=np.float64)
+        for row, query in enumerate(queries):
+            grams = _ngrams(query, self.n)
+            sizes[row] = len(grams)
+            parts = [
+                self.postings[self.indptr[fid] : self.indptr[fid + 1]]
+                for fid in (self.vocab.get(gram) for gram in grams)
+                if fid is not None
+            ]
+            if parts:
+                rows.append(np.concatenate(parts) + row * self.count)
+        flat = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        common = np.bincount(flat, minlength=len(queries) * self.count).reshape(len(queries), self.count)
+        total = sizes[:, None] + self.sizes[None, :]
+        return np.divide(2.0 * common, total, out=np.zeros_like(total), where=total > 0)
+
+
+def _occurrences(text: str, starts: np.ndarray, needle: str) -> np.ndarray:
+    offsets = [match.start() for match in re.finditer(re.escape(needle), text)]
+    if not offsets:
+        return np.zeros(0, dtype=np.int64)
+    return np.unique(np.searchsorted(starts, np.asarray(offsets, dtype=np.int64), side="right") - 1)
+
+
+class VectorizedScorer:
+    def __init__(self, elements: list[InteractiveElement]) -> None:
+        _require_numpy()
+        self._prepared = [_prepare_element(element) for element in elements]
+        self._active = np.asarray([i for i, p in enumerate(self._prepared) if p.haystack], dtype=np.int64)
+
+        strings: list[str] = []
+        owners: list[int] = []
+        fields: list[str] = []
+        field_owners: list[int] = []
+        for position, idx in enumerate(self._active.tolist()):
+            prepared = self._prepared[idx]
+            strings.extend((*prepared.fields, prepared.haystack))
+            owners.extend([position] * (len(prepared.fields) + 1))
+            fields.extend(prepared.fields)
+            field_owners.extend([position] * len(prepared.fields))
+        owner_array = np.asarray(owners, dtype=np.int64)
+        self._group_starts = np.flatnonzero(np.r_[True, owner_array[1:] != owner_array[:-1]]) if owners else owner_array
+        self._unigrams = _GramMatrix(strings, 1)
+        self._bigrams = _GramMatrix(strings, 2)
+
+        self._field_text, self._field_starts = self._joined(fields)
+        self._field_owners = np.asarray(field_owners, dtype=np.int64)
+        haystacks = [self._prepared[idx].haystack for idx in self._active.tolist()]
+        self._haystack_text, self._haystack_starts = self._joined(haystacks)
+        self._token_hits: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_summary(cls, summary: PageSummary) -> VectorizedScorer:
+        return cls(extract_actionable_elements(summary))
+
+    def __len__(self) -> int:
+        return len(self._prepared)
+
+    @staticmethod
+    def _joined(values: list[str]) -> tuple[str, np.ndarray]:
+        lengths = np.asarray([len(v) + len(_SEPARATOR) for v in values], dtype=np.int64)
+        starts = np.zeros(len(values), dtype=np.int64)
+        if len(values) > 1:
+            np.cumsum(lengths[:-1], out=starts[1:])
+        return _SEPARATOR.join(values), starts
+
+    def _token_row(self, token: str) -> np.ndarray:
+        if token not in self._token_hits:
+            row = np.zeros(len(self._active), dtype=np.int64)
+            row[_occurrences(self._haystack_text, self._haystack_starts, token)] = 1
+            self._token_hits[token] = row
+        return self._token_hits[token]
+
+    def _score_block(self, queries: list[tuple[str, list[str]]]) -> np.ndarray:
+        texts = [q for q, _ in queries]
+        active = len(self._active)
+        exact = np.zeros((len(queries), active), dtype=np.float64)
+        coverage = np.zeros((len(queries), active), dtype=np.float64)
+        for row, (q, q_tokens) in enumerate(queries):
+            if not q:
+                continue
+            hits = _occurrences(self._field_text, self._field_starts, q)
+            exact[row, self._field_owners[hits]] = 1.0
+            if q_tokens:
+                counts = sum(self._token_row(token) for token in q_tokens)
+                coverage[row] = counts / len(q_tokens)
+
+        fuzzy = (self._unigrams.dice(texts) + self._bigrams.dice(texts)) / 2.0
+        fuzzy = np.maximum.reduceat(fuzzy, self._group_starts, axis=1)
+        scores = np.round(0.5 * exact + 0.3 * coverage + 0.2 * fuzzy, 6)
+        scores[[row for row, (q, _) in enumerate(queries) if not q]] = 0.0
+        return scores
+
+    def scores(self, queries: Iterable[str]) -> np.ndarray:
+        prepared = [_prepare_query(query) for query in queries]
+        result = np.zeros((len(prepared), len(self._prepared)), dtype=np.float64)
+        if not len(self._active) or not prepared:
+            return result
+        block = max(1, _BLOCK_CELLS // max(1, self._unigrams.count))
+        for start in range(0, len(prepared), block):
+            chunk = prepared[start : start + block]
+            result[start : start + len(chunk), self._active] = self._score_block(chunk)
+        return result
+
+    def rank_many(
+        self,
+        queries: list[str],
+        min_score: float = 0.45,
+        max_results: int | None = None,
+    ) -> list[list[RankedActionableElement]]:
+        results = []
+        for row in self.scores(queries):
+            ranked = [
+                RankedActionableElement(element=self._prepared[idx].element, score=float(row[idx]))
+                for idx in np.flatnonzero(row >= min_score).tolist()
+            ]
+            ranked.sort(key=_rank_key)
+            results.append(ranked[:max_results] if max_results is not None else ranked)
+        return results
+
+    def rank(self, query: str, min_score: float = 0.45) -> list[RankedActionableElement]:
+        return self.rank_many([query], min_score=min_score)[0]
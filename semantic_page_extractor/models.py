@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, SerializerFunctionWrapHandler, model_serializer
 
 
 class InteractiveElement(BaseModel):
@@ -35,6 +37,16 @@ class FormSummary(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class TruncationReport(BaseModel):
+    elements_limit_reached: bool
+    deadline_exceeded: bool
+    skipped_candidates: int
+    truncated_option_lists: int
+    truncated_texts: int
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class PageSummary(BaseModel):
     schema_version: str
     url: str
@@ -43,5 +55,15 @@ class PageSummary(BaseModel):
     headers: list[str]
     forms: list[FormSummary]
     interactive_elements: list[InteractiveElement]
+    scope: str | None = None
+    truncation: TruncationReport | None = None
 
     model_config = ConfigDict(extra="forbid")
+
+    @model_serializer(mode="wrap")
+    def _drop_empty_optionals(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        data = handler(self)
+        for key in ("scope", "truncation"):
+            if data.get(key, True) is None:
+                del data[key]
+        return data
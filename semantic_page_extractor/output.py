@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import json
+import struct
+from itertools import chain
+
 from semantic_page_extractor.actionable import (
     dedupe_actionable_elements,
     extract_actionable_elements,
@@ -8,12 +12,17 @@ from semantic_page_extractor.actionable import (
 from semantic_page_extractor.intent import filter_actionable_elements
 from semantic_page_extractor.models import PageSummary
 
+COMPACT_VERSION = 1
+COMPACT_BINARY_VERSION = 1
+
+_FLAG_BITS = [tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)]
+
 
 def compact_actionable_payload(payload: dict | list) -> dict | list:
     if not isinstance(payload, list):
         return payload
     if not payload:
-        return {"v": 1, "r": [], "t": [], "c": [], "i": []}
+        return {"v": COMPACT_VERSION, "r": [], "t": [], "c": [], "i": []}
     if not all(isinstance(item, dict) and "role" in item for item in payload):
         return payload
 
@@ -34,7 +43,127 @@ def compact_actionable_payload(payload: dict | list) -> dict | list:
         if item.get("disabled"):
             row.append(1)
         items.append(row)
-    return {"v": 1, "r": roles, "t": texts, "c": contexts, "i": items}
+    return {"v": COMPACT_VERSION, "r": roles, "t": texts, "c": contexts, "i": items}
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _read_table(data: bytes, offset: int) -> tuple[list[str], int]:
+    count, offset = _read_varint(data, offset)
+    table = []
+    for _ in range(count):
+        length = data[offset]
+        if length < 0x80:
+            offset += 1
+        else:
+            length, offset = _read_varint(data, offset)
+        end = offset + length
+        if end > len(data):
+            raise IndexError("string table")
+        table.append(data[offset:end].decode("utf-8"))
+        offset = end
+    return table, offset
+
+
+def _index_code(table_size: int) -> str:
+    if table_size <= 0x100:
+        return "B"
+    if table_size <= 0x10000:
+        return "H"
+    return "I"
+
+
+def compact_actionable_binary(payload: dict | list) -> bytes:
+    compact = compact_actionable_payload(payload)
+    if not isinstance(compact, dict) or compact.get("v") != COMPACT_VERSION:
+        raise ValueError("Payload is not an actionable list or compact actionable payload")
+
+    out = bytearray([COMPACT_BINARY_VERSION])
+    tables = (compact["r"], compact["t"], compact["c"])
+    for table in tables:
+        _write_varint(out, len(table))
+        for encoded in [value.encode("utf-8") for value in table]:
+            _write_varint(out, len(encoded))
+            out += encoded
+
+    rows = compact["i"]
+    _write_varint(out, len(rows))
+    if rows:
+        bits = "".join(["1" if len(row) > 3 and row[3] else "0" for row in reversed(rows)])
+        out += int(bits, 2).to_bytes((len(rows) + 7) // 8, "little")
+        row_struct = struct.Struct("<" + "".join(_index_code(len(table)) for table in tables))
+        out += b"".join([row_struct.pack(row[0], row[1], row[2]) for row in rows])
+    return bytes(out)
+
+
+def _expand(tables: list[list[str]], rows, flags) -> list[dict]:
+    roles = tables[0]
+    texts = [value or None for value in tables[1]]
+    contexts = [value or None for value in tables[2]]
+    return [
+        {
+            "role": roles[row[0]],
+            "visible_text": texts[row[1]],
+            "section_context": contexts[row[2]],
+            "disabled": disabled,
+        }
+        for row, disabled in zip(rows, flags)
+    ]
+
+
+def _decode_compact_binary(payload: bytes) -> list[dict]:
+    if not payload or payload[0] != COMPACT_BINARY_VERSION:
+        raise ValueError(f"Unsupported compact binary version: {payload[0] if payload else None!r}")
+    try:
+        offset = 1
+        tables: list[list[str]] = []
+        for _ in range(3):
+            table, offset = _read_table(payload, offset)
+            tables.append(table)
+
+        count, offset = _read_varint(payload, offset)
+        flags_end = offset + (count + 7) // 8
+        flags = list(chain.from_iterable(_FLAG_BITS[byte] for byte in payload[offset:flags_end]))
+        row_struct = struct.Struct("<" + "".join(_index_code(len(table)) for table in tables))
+        rows_end = flags_end + row_struct.size * count
+        if rows_end != len(payload):
+            raise IndexError("rows")
+        rows = row_struct.iter_unpack(memoryview(payload)[flags_end:rows_end]) if count else ()
+    except (IndexError, struct.error) as exc:
+        raise ValueError("Truncated compact binary payload") from exc
+    return _expand(tables, rows, flags)
+
+
+def decode_compact(payload: bytes | str | dict) -> list[dict]:
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        if payload[:1] != b"{":
+            return _decode_compact_binary(bytes(payload))
+        payload = bytes(payload).decode("utf-8")
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+    if not isinstance(payload, dict):
+        raise ValueError(f"Compact payload must be an object, not {type(payload).__name__}")
+    if payload.get("v") != COMPACT_VERSION:
+        raise ValueError(f"Unsupported compact version: {payload.get('v')!r}")
+    rows = payload["i"]
+    return _expand([payload["r"], payload["t"], payload["c"]], rows, [len(row) > 3 and bool(row[3]) for row in rows])
 
 
 def strip_fields(payload: dict | list, blocked_keys: set[str]) -> dict | list:
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from semantic_page_extractor.actionable import extract_actionable_elements
+from semantic_page_extractor.errors import ExtractionError
+from semantic_page_extractor.intent import rank_actionable_elements
+from semantic_page_extractor.models import InteractiveElement, PageSummary
+from semantic_page_extractor.output import COMPACT_VERSION
+
+ELLIPSIS = "…"
+MIN_CLIP_LENGTH = 8
+_MIN_ROW_SIZE = len(",[0,0,0]")
+
+
+@dataclass(frozen=True)
+class PackedPayload:
+    payload: dict
+    text: str
+    size: int
+    included: int
+    dropped: int
+    truncated: int
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _utf8_size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _clip(value: str, limit: int | None) -> str:
+    if limit is None or len(value) <= limit:
+        return value
+    return value[: limit - 1].rstrip() + ELLIPSIS
+
+
+class _Packer:
+    def __init__(self, measure: Callable[[str], int], limit: int) -> None:
+        self.measure = measure
+        self.limit = limit
+        self.tables: tuple[list[str], list[str], list[str]] = ([], [], [])
+        self.ids: tuple[dict[str, int], dict[str, int], dict[str, int]] = ({}, {}, {})
+        self.rows: list[list[int]] = []
+        self.size = measure(_dumps(self.payload()))
+
+    def payload(self) -> dict:
+        roles, texts, contexts = self.tables
+        return {"v": COMPACT_VERSION, "r": roles, "t": texts, "c": contexts, "i": self.rows}
+
+    def _row(self, values: tuple[str, str, str], disabled: bool) -> list[int]:
+        row = [ids.get(value, len(table)) for value, ids, table in zip(values, self.ids, self.tables)]
+        if disabled:
+            row.append(1)
+        return row
+
+    def cost(self, values: tuple[str, str, str], disabled: bool) -> int:
+        total = self.measure(_dumps(self._row(values, disabled))) + (1 if self.rows else 0)
+        for value, ids, table in zip(values, self.ids, self.tables):
+            if value not in ids:
+                total += self.measure(_dumps(value)) + (1 if table else 0)
+        return total
+
+    def fits(self, values: tuple[str, str, str], disabled: bool) -> bool:
+        return self.size + self.cost(values, disabled) <= self.limit
+
+    def add(self, values: tuple[str, str, str], disabled: bool) -> None:
+        self.size += self.cost(values, disabled)
+        self.rows.append(self._row(values, disabled))
+        for value, ids, table in zip(values, self.ids, self.tables):
+            if value not in ids:
+                ids[value] = len(table)
+                table.append(value)
+
+    def shrink(self, role: str, text: str, context: str, disabled: bool) -> tuple[str, str, str] | None:
+        clip_context = context not in self.ids[2]
+
+        def values(length: int) -> tuple[str, str, str]:
+            return role, _clip(text, length), _clip(context, length) if clip_context else context
+
+        lo, hi = MIN_CLIP_LENGTH, max(len(text), len(context) if clip_context else 0) - 1
+        best = None
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if self.fits(values(mid), disabled):
+                best = values(mid)
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return best
+
+
+def pack_actionable_payload(
+    source: PageSummary | list[InteractiveElement],
+    *,
+    max_bytes: int | None = None,
+    max_tokens: int | None = None,
+    intent: str | None = None,
+    min_score: float = 0.45,
+    max_text_length: int | None = 120,
+    chars_per_token: float = 4.0,
+) -> PackedPayload:
+    if (max_bytes is None) == (max_tokens is None):
+        raise ExtractionError("Pass exactly one of max_bytes or max_tokens", code="INVALID_PACK_BUDGET")
+    if (max_bytes or max_tokens or 0) < 1 or chars_per_token <= 0:
+        raise ExtractionError("Pack budgets must be positive", code="INVALID_PACK_BUDGET")
+    if max_text_length is not None and max_text_length < MIN_CLIP_LENGTH:
+        raise ExtractionError(f"max_text_length must be at least {MIN_CLIP_LENGTH}", code="INVALID_PACK_BUDGET")
+
+    if max_bytes is not None:
+        packer = _Packer(_utf8_size, max_bytes)
+    else:
+        packer = _Packer(len, math.floor(max_tokens * chars_per_token))
+    if packer.size > packer.limit:
+        raise ExtractionError("Budget is smaller than an empty payload", code="PACK_BUDGET_TOO_SMALL")
+
+    elements = extract_actionable_elements(source) if isinstance(source, PageSummary) else source
+    if intent:
+        elements = [item.element for item in rank_actionable_elements(elements, intent) if item.score >= min_score]
+
+    dropped = 0
+    truncated = 0
+    for position, element in enumerate(elements):
+        if packer.limit - packer.size < _MIN_ROW_SIZE:
+            dropped += len(elements) - position
+            break
+        text = element.visible_text or element.aria_label or ""
+        context = element.section_context or ""
+        values = (element.role or "", _clip(text, max_text_length), _clip(context, max_text_length))
+        clipped = values[1] != text or values[2] != context
+        if not packer.fits(values, element.disabled):
+            values = packer.shrink(*values, element.disabled)
+            clipped = True
+        if values is None:
+            dropped += 1
+            continue
+        packer.add(values, element.disabled)
+        truncated += clipped
+
+    payload = packer.payload()
+    text = _dumps(payload)
+    size = _utf8_size(text) if max_bytes is not None else math.ceil(len(text) / chars_per_token)
+    return PackedPayload(
+        payload=payload,
+        text=text,
+        size=size,
+        included=len(packer.rows),
+        dropped=dropped,
+        truncated=truncated,
+    )
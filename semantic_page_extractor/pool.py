@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from semantic_page_extractor.errors import ExtractionError
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+
+
+@dataclass
+class _BrowserSlot:
+    browser: Browser
+    active: int = 0
+    uses: int = 0
+    retiring: bool = False
+
+
+class ExtractorPool:
+    def __init__(
+        self,
+        *,
+        browsers: int = 1,
+        max_pages_per_browser: int = 4,
+        max_uses_per_browser: int = 100,
+        launch_options: dict[str, Any] | None = None,
+        context_options: dict[str, Any] | None = None,
+    ) -> None:
+        if browsers < 1 or max_pages_per_browser < 1 or max_uses_per_browser < 1:
+            raise ExtractionError("Pool sizes must be at least 1", code="INVALID_POOL_CONFIG")
+        self.browsers = browsers
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_uses_per_browser = max_uses_per_browser
+        self.launch_options = dict(launch_options or {})
+        self.context_options = dict(context_options or {})
+        self._playwright: Any = None
+        self._slots: list[_BrowserSlot] = []
+        self._launches = 0
+        self._relaunch_error: BaseException | None = None
+        self._condition = asyncio.Condition()
+        self._closed = True
+
+    @property
+    def capacity(self) -> int:
+        return self.browsers * self.max_pages_per_browser
+
+    @property
+    def launches(self) -> int:
+        return self._launches
+
+    @property
+    def relaunch_error(self) -> BaseException | None:
+        return self._relaunch_error
+
+    async def __aenter__(self) -> ExtractorPool:
+        await self._start_driver()
+        try:
+            self._slots = [_BrowserSlot(browser=await self._launch()) for _ in range(self.browsers)]
+        except BaseException:
+            await self._close_all()
+            raise
+        self._closed = False
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        await self._close_all()
+
+    async def _start_driver(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+
+    async def _stop_driver(self) -> None:
+        await self._playwright.stop()
+
+    async def _launch(self) -> Browser:
+        self._launches += 1
+        return await self._playwright.chromium.launch(**self.launch_options)
+
+    async def _close_all(self) -> None:
+        slots, self._slots = self._slots, []
+        for slot in slots:
+            await slot.browser.close()
+        if self._playwright is not None:
+            await self._stop_driver()
+            self._playwright = None
+
+    def _available_slot(self) -> _BrowserSlot | None:
+        ready = [
+            slot for slot in self._slots if not slot.retiring and slot.active < self.max_pages_per_browser
+        ]
+        return min(ready, key=lambda slot: slot.active) if ready else None
+
+    async def _acquire(self) -> _BrowserSlot:
+        async with self._condition:
+            while True:
+                if self._closed:
+                    raise ExtractionError("ExtractorPool is not open", code="POOL_CLOSED")
+                if not self._slots:
+                    error = self._relaunch_error
+                    detail = f": browser relaunch failed: {error}" if error is not None else ""
+                    raise ExtractionError(f"ExtractorPool has no browsers left{detail}", code="POOL_EXHAUSTED") from error
+                slot = self._available_slot()
+                if slot is not None:
+                    break
+                await self._condition.wait()
+            slot.active += 1
+            slot.uses += 1
+            if slot.uses >= self.max_uses_per_browser:
+                slot.retiring = True
+            return slot
+
+    async def _release(self, slot: _BrowserSlot) -> None:
+        async with self._condition:
+            slot.active -= 1
+            if not slot.browser.is_connected():
+                slot.retiring = True
+            recycle = slot.retiring and slot.active == 0 and not self._closed
+        try:
+            if recycle:
+                await slot.browser.close()
+                browser = await self._launch()
+                if self._closed:
+                    await browser.close()
+                slot.browser, slot.uses, slot.retiring = browser, 0, False
+        except Exception as exc:
+            async with self._condition:
+                if slot in self._slots:
+                    self._slots.remove(slot)
+                self._relaunch_error = exc
+        finally:
+            async with self._condition:
+                self._condition.notify_all()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        slot = await self._acquire()
+        try:
+            context = await slot.browser.new_context(**self.context_options)
+            try:
+                yield await context.new_page()
+            finally:
+                await context.close()
+        finally:
+            await self._release(slot)
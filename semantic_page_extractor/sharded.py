@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from semantic_page_extractor.batch import BatchResult, extract_many
+from semantic_page_extractor.errors import ExtractionError
+from semantic_page_extractor.models import PageSummary
+from semantic_page_extractor.pool import ExtractorPool
+
+_POLL_SECONDS = 0.2
+
+
+def _encode_result(url: str, result: PageSummary | dict | list | ExtractionError) -> tuple[str, str, str]:
+    if isinstance(result, ExtractionError):
+        return url, "error", json.dumps(result.to_dict(), separators=(",", ":"))
+    if isinstance(result, PageSummary):
+        return url, "summary", result.model_dump_json()
+    return url, "payload", json.dumps(result, separators=(",", ":"))
+
+
+def _decode_result(message: tuple[str, str, str]) -> BatchResult:
+    url, kind, data = message
+    if kind == "summary":
+        return url, PageSummary.model_validate_json(data)
+    if kind == "error":
+        error = json.loads(data)
+        return url, ExtractionError(error["message"], code=error["code"])
+    return url, json.loads(data)
+
+
+async def _run_worker(tasks: Any, results: Any, options: dict) -> None:
+    pool_options = options.pop("pool")
+    async with ExtractorPool(**pool_options) as pool:
+        async for url, result in extract_many(iter(tasks.get, None), pool=pool, **options):
+            results.put(_encode_result(url, result))
+
+
+def _worker_main(tasks: Any, results: Any, options: dict) -> None:
+    try:
+        asyncio.run(_run_worker(tasks, results, options))
+    except Exception as exc:
+        results.put((None, "worker_error", f"{type(exc).__name__}: {exc}"))
+    results.put((None, "done", ""))
+
+
+async def extract_sharded(
+    urls: Iterable[str],
+    *,
+    processes: int | None = None,
+    concurrency: int = 4,
+    browsers: int = 1,
+    wait_until: str = "load",
+    timeout: float | None = 30.0,
+    launch_options: dict[str, Any] | None = None,
+    actionable_only: bool = False,
+    intent: str | None = None,
+    min_score: float = 0.45,
+    max_results: int | None = None,
+    output_format: str | None = None,
+) -> AsyncIterator[BatchResult]:
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1 or concurrency < 1:
+        raise ExtractionError("processes and concurrency must be at least 1", code="INVALID_CONCURRENCY")
+    options = {
+        "concurrency": concurrency,
+        "wait_until": wait_until,
+        "timeout": timeout,
+        "actionable_only": actionable_only,
+        "intent": intent,
+        "min_score": min_score,
+        "max_results": max_results,
+        "output_format": output_format,
+        "pool": {
+            "browsers": browsers,
+            "max_pages_per_browser": max(1, -(-concurrency // browsers)),
+            "launch_options": launch_options,
+        },
+    }
+
+    context = multiprocessing.get_context("spawn")
+    tasks = context.Queue()
+    results = context.Queue()
+    outstanding: Counter[str] = Counter()
+    for url in urls:
+        outstanding[url] += 1
+        tasks.put(url)
+    for _ in range(processes):
+        tasks.put(None)
+
+    workers = [
+        context.Process(target=_worker_main, args=(tasks, results, dict(options)), daemon=True)
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    loop = asyncio.get_running_loop()
+    running = len(workers)
+    worker_errors: list[str] = []
+    try:
+        while running:
+            try:
+                message = await loop.run_in_executor(None, results.get, True, _POLL_SECONDS)
+            except queue.Empty:
+                if all(not worker.is_alive() for worker in workers) and results.empty():
+                    break
+                continue
+            url, kind, data = message
+            if kind == "done":
+                running -= 1
+            elif kind == "worker_error":
+                worker_errors.append(data)
+            else:
+                outstanding[url] -= 1
+                yield _decode_result(message)
+
+        reason = "; ".join(dict.fromkeys(worker_errors)) or "worker exited before reporting"
+        for url, count in outstanding.items():
+            for _ in range(count):
+                yield url, ExtractionError(f"Shard worker failed: {reason}", code="WORKER_FAILED")
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        tasks.cancel_join_thread()
+        tasks.close()
+        results.close()
@@ -2,51 +2,82 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Iterable
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
 
 from semantic_page_extractor.normalize import normalize_text
 
+SIGNATURE_CACHE_SIZE = 16384
+
 
 def sha256_canonical(payload: dict | list) -> str:
     encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
     return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
 
+def _sha256_text(encoded: str) -> str:
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _json_str(value: str | None) -> str:
+    return "null" if value is None else encode_basestring_ascii(value)
+
+
+def _json_str_list(values: Iterable[str]) -> str:
+    return "[" + ",".join(encode_basestring_ascii(v) for v in values) + "]"
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
 def field_signature(label: str | None, input_type: str, section_context: str | None) -> str:
-    return sha256_canonical(
-        {
-            "label": normalize_text(label),
-            "type": normalize_text(input_type) or "text",
-            "section_context": normalize_text(section_context),
-        }
+    return _sha256_text(
+        '{"label":%s,"section_context":%s,"type":%s}'
+        % (
+            _json_str(normalize_text(label)),
+            _json_str(normalize_text(section_context)),
+            _json_str(normalize_text(input_type) or "text"),
+        )
     )
 
 
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
 def action_signature(visible_text: str | None, role: str, section_context: str | None) -> str:
-    return sha256_canonical(
-        {
-            "visible_text": normalize_text(visible_text),
-            "role": normalize_text(role) or "",
-            "section_context": normalize_text(section_context),
-        }
+    return _sha256_text(
+        '{"role":%s,"section_context":%s,"visible_text":%s}'
+        % (
+            _json_str(normalize_text(role) or ""),
+            _json_str(normalize_text(section_context)),
+            _json_str(normalize_text(visible_text)),
+        )
     )
 
 
+def batch_field_signatures(items: Iterable[tuple[str | None, str, str | None]]) -> list[str]:
+    return [field_signature(label, input_type, section_context) for label, input_type, section_context in items]
+
+
+def batch_action_signatures(items: Iterable[tuple[str | None, str, str | None]]) -> list[str]:
+    return [action_signature(text, role, section_context) for text, role, section_context in items]
+
+
 def form_signature(field_signatures: list[str], submit_signatures: list[str], section_context: str | None) -> str:
-    return sha256_canonical(
-        {
-            "section_context": normalize_text(section_context),
-            "field_signatures": sorted(field_signatures),
-            "submit_signatures": sorted(submit_signatures),
-        }
+    return _sha256_text(
+        '{"field_signatures":%s,"section_context":%s,"submit_signatures":%s}'
+        % (
+            _json_str_list(sorted(field_signatures)),
+            _json_str(normalize_text(section_context)),
+            _json_str_list(sorted(submit_signatures)),
+        )
     )
 
 
 def page_signature(title: str, headers: list[str], forms_count: int, interactive_count: int) -> str:
-    return sha256_canonical(
-        {
-            "title": normalize_text(title),
-            "headers": sorted((normalize_text(h) or "") for h in headers),
-            "forms_count": forms_count,
-            "interactive_count": interactive_count,
-        }
+    return _sha256_text(
+        '{"forms_count":%d,"headers":%s,"interactive_count":%d,"title":%s}'
+        % (
+            forms_count,
+            _json_str_list(sorted((normalize_text(h) or "") for h in headers)),
+            interactive_count,
+            _json_str(normalize_text(title)),
+        )
     )
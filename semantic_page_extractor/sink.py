@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import bz2
+import gzip
+import json
+import lzma
+import os
+from collections.abc import AsyncIterable, Callable
+from pathlib import Path
+from typing import IO
+
+from pydantic import BaseModel
+
+from semantic_page_extractor.errors import ExtractionError
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+_OPENERS: dict[str, Callable[..., IO[bytes]] | None] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+    "zstd": zstd.open if zstd is not None else None,
+}
+_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+
+COMPRESSIONS = tuple(_OPENERS)
+
+
+def _dumps(record: BaseModel | dict | list | str) -> bytes:
+    if isinstance(record, BaseModel):
+        return record.model_dump_json().encode("utf-8")
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class NdjsonSink:
+    def __init__(
+        self,
+        target: str | os.PathLike[str] | IO[bytes],
+        *,
+        compression: str | None = None,
+        flush_bytes: int = 1024 * 1024,
+    ) -> None:
+        if flush_bytes < 1:
+            raise ExtractionError("flush_bytes must be at least 1", code="INVALID_SINK_CONFIG")
+        is_path = isinstance(target, (str, os.PathLike))
+        if compression is None and is_path:
+            compression = _SUFFIXES.get(Path(target).suffix.lower())
+        if compression is not None and compression not in _OPENERS:
+            raise ExtractionError(f"Unsupported compression: {compression}", code="INVALID_COMPRESSION")
+        if compression is not None and _OPENERS[compression] is None:
+            raise ExtractionError(f"{compression} compression is not available in this Python", code="INVALID_COMPRESSION")
+        self.target = target
+        self.compression = compression
+        self.flush_bytes = flush_bytes
+        self.records = 0
+        self.bytes_written = 0
+        self.flushes = 0
+        self._is_path = is_path
+        self._handle: IO[bytes] | None = None
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> NdjsonSink:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def _open(self) -> IO[bytes]:
+        if self.compression is not None:
+            return _OPENERS[self.compression](self.target, "wb")
+        if self._is_path:
+            return open(self.target, "wb")
+        return self.target
+
+    async def open(self) -> None:
+        if self._handle is None:
+            self._handle = await asyncio.to_thread(self._open)
+
+    def _write_chunk(self, chunk: bytes) -> None:
+        self._handle.write(chunk)
+        self._handle.flush()
+
+    async def _append(self, line: bytes) -> None:
+        self._buffer.append(line)
+        self._buffered += len(line)
+        self.records += 1
+        if self._buffered >= self.flush_bytes:
+            await self.flush()
+
+    async def write(self, record: BaseModel | dict | list) -> None:
+        await self._append(_dumps(record) + b"\n")
+
+    async def write_results(self, results: AsyncIterable[tuple[str, BaseModel | dict | list | ExtractionError]]) -> int:
+        written = 0
+        async for url, result in results:
+            key, payload = ("error", result.to_dict()) if isinstance(result, ExtractionError) else ("result", result)
+            await self._append(b'{"url":%s,"%s":%s}\n' % (_dumps(url), key.encode(), _dumps(payload)))
+            written += 1
+        return written
+
+    async def flush(self) -> None:
+        chunk = b"".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        async with self._lock:
+            await self.open()
+            if chunk:
+                await asyncio.to_thread(self._write_chunk, chunk)
+                self.bytes_written += len(chunk)
+                self.flushes += 1
+
+    async def close(self) -> None:
+        await self.flush()
+        async with self._lock:
+            handle, self._handle = self._handle, None
+            if handle is not None and (self.compression is not None or self._is_path):
+                await asyncio.to_thread(handle.close)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar, Union
+
+from pydantic import ValidationError
+
+from semantic_page_extractor.browser_script import EXTRACTION_SCRIPT, STREAM_CHUNK_SCRIPT, STREAM_RELEASE_SCRIPT
+from semantic_page_extractor.budget import ExtractionBudget
+from semantic_page_extractor.errors import ExtractionError
+from semantic_page_extractor.extractor import SCHEMA_VERSION, _resolve_scope, _script_options, _to_form, _to_interactive, _to_truncation
+from semantic_page_extractor.models import FormSummary, InteractiveElement, TruncationReport
+from semantic_page_extractor.normalize import normalize_text
+from semantic_page_extractor.signatures import page_signature
+
+if TYPE_CHECKING:
+    from playwright.async_api import ElementHandle, Page
+
+
+@dataclass(frozen=True)
+class HeaderBatch:
+    headers: list[str]
+
+
+@dataclass(frozen=True)
+class FormBatch:
+    forms: list[FormSummary]
+
+
+@dataclass(frozen=True)
+class InteractiveBatch:
+    elements: list[InteractiveElement]
+
+
+@dataclass(frozen=True)
+class PageRecord:
+    schema_version: str
+    url: str
+    title: str
+    page_signature: str
+    headers_count: int
+    forms_count: int
+    interactive_count: int
+    scope: str | None = None
+    truncation: TruncationReport | None = None
+
+
+StreamRecord = Union[HeaderBatch, FormBatch, InteractiveBatch, PageRecord]
+
+_Item = TypeVar("_Item")
+
+
+def _convert(build: Callable[[dict], _Item], chunk: list[dict]) -> list[_Item]:
+    try:
+        return [build(item) for item in chunk]
+    except ValidationError as exc:
+        raise ExtractionError(f"Schema validation failed: {exc}", code="SCHEMA_VALIDATION_FAILED") from exc
+
+
+async def _chunks(page: Page, stream_id: int, section: str, total: int, chunk_size: int) -> AsyncIterator[list]:
+    for offset in range(0, total, chunk_size):
+        chunk = await page.evaluate(
+            STREAM_CHUNK_SCRIPT,
+            {"id": stream_id, "section": section, "offset": offset, "limit": chunk_size},
+        )
+        if chunk is None:
+            raise ExtractionError("Stream cursor was lost, the page navigated or reloaded", code="STREAM_CURSOR_LOST")
+        yield chunk
+
+
+async def stream_page_semantics(
+    page: "Page",
+    *,
+    chunk_size: int = 500,
+    trusted: bool = False,
+    budget: ExtractionBudget | None = None,
+    root: str | ElementHandle | None = None,
+) -> AsyncIterator[StreamRecord]:
+    if chunk_size < 1:
+        raise ExtractionError("chunk_size must be at least 1", code="INVALID_CHUNK_SIZE")
+    scope = await _resolve_scope(page, root)
+    try:
+        cursor = await page.evaluate(EXTRACTION_SCRIPT, {**_script_options("object", False, budget, root), "stream": True})
+    except Exception as exc:  # pragma: no cover
+        raise ExtractionError(f"Browser extraction failed: {exc}") from exc
+    if cursor is None:
+        raise ExtractionError(f"Extraction root not found: {scope}", code="ROOT_NOT_FOUND")
+
+    stream_id = cursor["id"]
+    counts = cursor["counts"]
+    headers: list[str] = []
+    try:
+        async for chunk in _chunks(page, stream_id, "headers", counts["headers"], chunk_size):
+            batch = [header for header in (normalize_text(item) for item in chunk) if header]
+            headers.extend(batch)
+            if batch:
+                yield HeaderBatch(headers=batch)
+        async for chunk in _chunks(page, stream_id, "forms", counts["forms"], chunk_size):
+            yield FormBatch(forms=_convert(lambda item: _to_form(item, trusted=trusted), chunk))
+        async for chunk in _chunks(page, stream_id, "interactive_elements", counts["interactive_elements"], chunk_size):
+            yield InteractiveBatch(elements=_convert(lambda item: _to_interactive(item, trusted=trusted), chunk))
+    finally:
+        with suppress(Exception):
+            await page.evaluate(STREAM_RELEASE_SCRIPT, stream_id)
+
+    yield PageRecord(
+        schema_version=SCHEMA_VERSION,
+        url=str(cursor.get("url") or ""),
+        title=normalize_text(cursor.get("title")) or "",
+        page_signature=page_signature(
+            title=cursor.get("title") or "",
+            headers=headers,
+            forms_count=counts["forms"],
+            interactive_count=counts["interactive_elements"],
+        ),
+        headers_count=len(headers),
+        forms_count=counts["forms"],
+        interactive_count=counts["interactive_elements"],
+        scope=scope,
+        truncation=_to_truncation(cursor.get("truncation"), trusted),
+    )
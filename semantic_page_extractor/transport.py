@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+TRANSPORT_VERSION = 1
+
+
+def decode_transport(payload: str) -> dict:
+    data = json.loads(payload)
+    if data.get("v") != TRANSPORT_VERSION:
+        raise ValueError(f"Unsupported transport version: {data.get('v')!r}")
+    strings = data["s"]
+
+    def _str(index: int) -> str | None:
+        return strings[index] if index >= 0 else None
+
+    options = [[strings[i] for i in values] for values in data["o"]]
+
+    action_columns = data["a"]
+    actions = [
+        {
+            "role": _str(role),
+            "visible_text": _str(text),
+            "aria_label": _str(aria),
+            "disabled": bool(disabled),
+            "section_context": _str(context),
+        }
+        for role, text, aria, context, disabled in zip(*action_columns)
+    ]
+
+    fields = [
+        {
+            "label_for": _str(label_for),
+            "label_wrapped": _str(label_wrapped),
+            "aria_label": _str(aria),
+            "placeholder": _str(placeholder),
+            "type": _str(field_type),
+            "required": bool(required),
+            "options": options[option_id] if option_id >= 0 else None,
+            "disabled": bool(disabled),
+            "section_context": _str(context),
+        }
+        for label_for, label_wrapped, aria, placeholder, field_type, context, required, disabled, option_id in zip(
+            *data["f"]
+        )
+    ]
+
+    forms = [
+        {
+            "section_context": _str(context),
+            "fields": [fields[i] for i in field_ids],
+            "submit_buttons": [actions[i] for i in action_ids],
+        }
+        for context, field_ids, action_ids in zip(*data["F"])
+    ]
+
+    raw = {
+        "url": _str(data["u"]),
+        "title": _str(data["t"]),
+        "headers": [strings[i] for i in data["h"]],
+        "forms": forms,
+        "interactive_elements": [actions[i] for i in data["i"]],
+    }
+    if "x" in data:
+        raw["truncation"] = data["x"]
+    return raw
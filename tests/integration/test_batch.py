@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from semantic_page_extractor import PageSummary, extract_many, extract_sharded
+
+pytest.importorskip("playwright.async_api")
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def sample_urls():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(FIXTURES_DIR)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield [f"http://127.0.0.1:{server.server_port}/sample-page.html?copy={i}" for i in range(4)]
+    finally:
+        server.shutdown()
+
+
+async def test_sharded_results_match_single_process(sample_urls: list[str]) -> None:
+    single = dict([item async for item in extract_many(sample_urls, concurrency=2)])
+    sharded = dict([item async for item in extract_sharded(sample_urls, processes=2, concurrency=2)])
+
+    assert set(sharded) == set(sample_urls)
+    assert all(isinstance(result, PageSummary) for result in sharded.values())
+    assert sharded == single
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from semantic_page_extractor.bench import TARGET_OUTPUT_BYTES, generate_page, measure_workload
+
+pytest.importorskip("playwright.async_api")
+
+
+async def test_measure_workload_reports_stages_and_sizes(page) -> None:
+    result = await measure_workload(page, generate_page(headings=3, forms=1, radio_groups=1, links=12, shadow_roots=2), repeats=3)
+
+    assert set(result["stages"]) == {"browser_ms", "transfer_ms", "convert_ms", "serialize_ms", "total_ms"}
+    assert all(set(stats) == {"p50", "p90", "p99", "max"} for stats in result["stages"].values())
+    assert result["forms"] == 1
+    assert result["interactive_elements"] >= 12
+    assert result["output_bytes"] > result["compact_bytes"] > 0
+
+
+async def test_sample_page_report_covers_every_stage(page) -> None:
+    sample_page = Path(__file__).resolve().parents[1] / "fixtures" / "sample-page.html"
+    result = await measure_workload(page, sample_page.read_text(encoding="utf-8"), repeats=3)
+
+    assert all(stats["max"] >= stats["p50"] >= 0 for stats in result["stages"].values())
+    assert result["stages"]["total_ms"]["max"] > 0
+    assert result["output_bytes"] < TARGET_OUTPUT_BYTES
+    assert set(result["meets_targets"]) == {"total_ms", "output_bytes"}
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import ExtractionBudget, extract_page_semantics
+
+pytest.importorskip("playwright.async_api")
+
+
+def _fixture_long_page() -> str:
+    links = "".join(f"<p style='height:40px'><a href='/l{i}'>Link {i}</a></p>" for i in range(300))
+    options = "".join(f"<option>Option {i}</option>" for i in range(500))
+    return f"""
+    <html><head><title>Long</title></head><body>
+      <h1>{'Very long heading ' * 20}</h1>
+      <form><label for='s'>Pick</label><select id='s'>{options}</select><button>Go</button></form>
+      {links}
+    </body></html>
+    """
+
+
+async def test_element_budget_prefers_viewport(page) -> None:
+    await page.set_content(_fixture_long_page())
+    await page.evaluate("window.scrollTo(0, 6000)")
+    summary = await extract_page_semantics(page, budget=ExtractionBudget(max_elements=10))
+
+    offsets = await page.evaluate(
+        "(texts) => texts.map((t) => [...document.querySelectorAll('a')].find((a) => a.textContent === t).getBoundingClientRect().top)",
+        [e.visible_text for e in summary.interactive_elements],
+    )
+    assert len(summary.interactive_elements) == 10
+    assert all(-100 < top < 900 for top in offsets)
+    assert summary.truncation.elements_limit_reached
+    assert summary.truncation.skipped_candidates > 250
+
+
+async def test_element_budget_ignores_invisible_candidates(page) -> None:
+    hidden = "".join(f"<a href='/h{i}' style='display:none'>Hidden {i}</a>" for i in range(50))
+    await page.set_content(f"<html><body><a href='/a'>A</a><a href='/b'>B</a>{hidden}<button>C</button></body></html>")
+    exact = await extract_page_semantics(page, budget=ExtractionBudget(max_elements=3))
+    tight = await extract_page_semantics(page, budget=ExtractionBudget(max_elements=2))
+
+    assert [e.visible_text for e in exact.interactive_elements] == ["A", "B", "C"]
+    assert exact.truncation is None
+    assert tight.truncation.elements_limit_reached
+    assert tight.truncation.skipped_candidates == 1
+
+
+async def test_option_and_text_budgets_truncate(page) -> None:
+    await page.set_content(_fixture_long_page())
+    summary = await extract_page_semantics(page, budget=ExtractionBudget(max_options=10, max_text_length=40))
+
+    field = summary.forms[0].fields[0]
+    assert len(field.options) == 10
+    assert len(field.field_signature) == 64
+    assert all(len(e.section_context or "") <= 40 for e in summary.interactive_elements)
+    assert summary.truncation.truncated_option_lists == 1
+    assert summary.truncation.truncated_texts > 0
+
+
+async def test_zero_deadline_returns_flagged_partial_result(page) -> None:
+    await page.set_content(_fixture_long_page())
+    summary = await extract_page_semantics(page, budget=ExtractionBudget(deadline_ms=0))
+
+    assert summary.truncation.deadline_exceeded
+    assert summary.interactive_elements == []
+
+
+async def test_generous_budget_matches_unbudgeted_extraction(page) -> None:
+    await page.set_content(_fixture_long_page())
+    budget = ExtractionBudget(max_elements=100_000, max_options=100_000, max_text_length=100_000, deadline_ms=60_000)
+
+    assert await extract_page_semantics(page, budget=budget) == await extract_page_semantics(page)
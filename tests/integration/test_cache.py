@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import SummaryCache, extract_page_semantics, release_fingerprint
+
+pytest.importorskip("playwright.async_api")
+
+
+def _fixture_cart() -> str:
+    return """
+    <html><head><title>Cart</title></head><body>
+      <h1>Cart</h1>
+      <a id='badge' href='/cart'>Cart (0)</a>
+      <x-card></x-card>
+    </body></html>
+    """
+
+
+async def test_cache_hits_until_the_dom_changes(page) -> None:
+    await page.set_content(_fixture_cart())
+    cache = SummaryCache()
+    first = await extract_page_semantics(page, cache=cache)
+    assert await extract_page_semantics(page, cache=cache) is first
+
+    await page.evaluate("document.getElementById('badge').textContent = 'Cart (1)'")
+    changed = await extract_page_semantics(page, cache=cache)
+
+    assert [e.visible_text for e in changed.interactive_elements] == ["Cart (1)"]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_cache_misses_after_checked_property_change(page) -> None:
+    await page.set_content(
+        """
+        <html><head><title>Tabs</title><style>#details { display: none } #tab:checked ~ #details { display: block }</style></head>
+        <body><input type='checkbox' id='tab'><label for='tab'>Details</label><div id='details'><button>Buy</button></div></body></html>
+        """
+    )
+    cache = SummaryCache()
+    closed = await extract_page_semantics(page, cache=cache)
+    await page.evaluate("document.getElementById('tab').checked = true")
+    opened = await extract_page_semantics(page, cache=cache)
+
+    assert "Buy" not in [e.visible_text for e in closed.interactive_elements]
+    assert "Buy" in [e.visible_text for e in opened.interactive_elements]
+    assert cache.misses == 2
+
+
+async def test_cache_misses_after_custom_element_upgrade(page) -> None:
+    await page.set_content(_fixture_cart())
+    cache = SummaryCache()
+    await extract_page_semantics(page, cache=cache)
+    await page.evaluate(
+        """customElements.define('x-card', class extends HTMLElement {
+            constructor() { super(); this.attachShadow({mode: 'open'}).innerHTML = '<button>Buy</button>'; }
+        })"""
+    )
+    upgraded = await extract_page_semantics(page, cache=cache)
+
+    assert upgraded == await extract_page_semantics(page)
+    assert "Buy" in [e.visible_text for e in upgraded.interactive_elements]
+
+
+async def test_cache_misses_after_attach_shadow_on_defined_element(page) -> None:
+    await page.set_content(_fixture_cart())
+    cache = SummaryCache()
+    await extract_page_semantics(page, cache=cache)
+    await page.evaluate("document.querySelector('h1').attachShadow({mode: 'open'}).innerHTML = '<button>Buy</button>'")
+    attached = await extract_page_semantics(page, cache=cache)
+
+    assert attached == await extract_page_semantics(page)
+    assert "Buy" in [e.visible_text for e in attached.interactive_elements]
+    assert cache.misses == 2
+
+
+async def test_release_fingerprint_removes_page_state(page) -> None:
+    await page.set_content(_fixture_cart())
+    cache = SummaryCache()
+    await extract_page_semantics(page, cache=cache)
+
+    assert await release_fingerprint(page) is True
+    assert await page.evaluate("window.__semanticPageExtractorFingerprint === undefined")
+    assert await page.evaluate("Element.prototype.attachShadow.toString().includes('[native code]')")
+    assert await release_fingerprint(page) is False
+    await page.evaluate("document.getElementById('badge').textContent = 'Cart (1)'")
+    changed = await extract_page_semantics(page, cache=cache)
+
+    assert [e.visible_text for e in changed.interactive_elements] == ["Cart (1)"]
+
+
+async def test_revisited_page_hits_disk_tier(page, tmp_path) -> None:
+    await page.set_content(_fixture_cart())
+    await extract_page_semantics(page, cache=SummaryCache(directory=tmp_path))
+    await page.set_content(_fixture_cart())
+    cache = SummaryCache(directory=tmp_path)
+    await extract_page_semantics(page, cache=cache)
+
+    assert (cache.hits, cache.disk_hits) == (1, 1)
@@ -5,6 +5,7 @@ import pytest
 import time
 
 from semantic_page_extractor import extract_page_semantics
+from semantic_page_extractor.signatures import field_signature
 
 pytest.importorskip("playwright.async_api")
 
@@ -71,6 +72,54 @@ def _fixture_image_and_map_context() -> str:
     """
 
 
+def _fixture_nested_sections() -> str:
+    return """
+    <html><head><title>Sections</title></head><body>
+      <h1>Store</h1>
+      <div><section><h2>Shipping</h2></section><div><a href='/ship'>Edit shipping</a></div></div>
+      <form>
+        <fieldset>
+          <legend>Payment</legend>
+          <label for='card'>Card</label><input id='card' type='text'>
+        </fieldset>
+      </form>
+      <div><h3 style='display:none'>Hidden</h3></div>
+      <div><a href='/more'>More</a></div>
+    </body></html>
+    """
+
+
+def _fixture_radio_group() -> str:
+    return """
+    <html><head><title>Survey</title></head><body>
+      <h1>Survey</h1>
+      <form>
+        <input id='r1' type='radio' name='size' value='s'><label for='r1'>Small</label>
+        <input id='r2' type='radio' name='size' value='m'><label for='r2'>Medium</label>
+        <input id='r3' type='radio' name='size' value='Large'>
+        <input id='r4' type='radio' name='size' value='x' style='display:none'><label for='r4'>Hidden</label>
+      </form>
+    </body></html>
+    """
+
+
+def _fixture_shadow_component() -> str:
+    return """
+    <html><head><title>Components</title></head><body>
+      <h1>Shop</h1>
+      <product-card><a href='/light'>Light link</a></product-card>
+      <script>
+        const root = document.querySelector('product-card').attachShadow({ mode: 'open' });
+        root.innerHTML = `
+          <h2>Card Title</h2>
+          <form><label for='qty'>Qty</label><input id='qty' type='number'><button>Add to cart</button></form>
+          <slot></slot>`;
+      </script>
+      <div><a href='/after'>After</a></div>
+    </body></html>
+    """
+
+
 async def test_extract_simple_login_page(page) -> None:
     await page.set_content(_fixture_login_page())
     summary = await extract_page_semantics(page)
@@ -116,6 +165,39 @@ async def test_image_links_and_map_areas_have_context(page) -> None:
     assert any((e.section_context or "").lower() == "quicklinks" for e in image_links)
 
 
+async def test_section_context_uses_nearest_visible_heading(page) -> None:
+    await page.set_content(_fixture_nested_sections())
+    summary = await extract_page_semantics(page)
+
+    contexts = {e.visible_text: e.section_context for e in summary.interactive_elements}
+    assert contexts["Edit shipping"] == "Shipping"
+    assert contexts["More"] == "Payment"
+    assert summary.forms[0].section_context == "Shipping"
+    assert summary.forms[0].fields[0].field_signature == field_signature("Card", "text", "Payment")
+
+
+async def test_radio_group_options_shared_by_members(page) -> None:
+    await page.set_content(_fixture_radio_group())
+    summary = await extract_page_semantics(page)
+
+    radios = [f for f in summary.forms[0].fields if f.type == "radio"]
+    assert len(radios) == 3
+    assert {f.label for f in radios} == {"Small", "Medium", None}
+    assert all(f.options == ["Large", "Medium", "Small"] for f in radios)
+
+
+async def test_open_shadow_roots_are_traversed(page) -> None:
+    await page.set_content(_fixture_shadow_component())
+    summary = await extract_page_semantics(page)
+
+    assert summary.headers == ["Card Title", "Shop"]
+    assert [f.label for f in summary.forms[0].fields] == ["Qty"]
+    assert [b.visible_text for b in summary.forms[0].submit_buttons] == ["Add to cart"]
+    contexts = {e.visible_text: e.section_context for e in summary.interactive_elements}
+    assert {"Light link", "Add to cart", "After"} == set(contexts)
+    assert contexts["After"] == "Card Title"
+
+
 async def test_determinism_across_reload(page) -> None:
     html = _fixture_multiple_forms()
     await page.set_content(html)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import extract_page_semantics, release_incremental
+
+pytest.importorskip("playwright.async_api")
+
+
+def _fixture_store() -> str:
+    return """
+    <html><head><title>Store</title></head><body>
+      <h1>Store</h1>
+      <section id='cart'>
+        <h2>Cart</h2>
+        <form>
+          <label for='qty'>Qty</label><input id='qty' type='number'>
+          <button id='pay' type='submit'>Pay</button>
+        </form>
+      </section>
+      <section id='help'><h2>Help</h2><a id='faq' href='/faq'>FAQ</a></section>
+      <div id='host'></div>
+    </body></html>
+    """
+
+
+MUTATIONS = [
+    "document.querySelector('#pay').textContent = 'Pay now'",
+    "document.querySelector('#faq').style.display = 'none'",
+    "document.querySelector('#help').insertAdjacentHTML('beforeend', \"<button type='button'>Chat</button>\")",
+    "document.querySelector('#cart h2').remove()",
+    "document.querySelector('#qty').setAttribute('type', 'email')",
+    "document.querySelector('#host').attachShadow({mode: 'open'}).innerHTML = \"<h3>Card</h3><a href='/x'>Open</a>\"",
+    "document.head.insertAdjacentHTML('beforeend', '<style>button { visibility: hidden; }</style>')",
+    "document.title = 'Store (1)'",
+]
+
+
+async def _assert_matches_full(page) -> None:
+    incremental = await extract_page_semantics(page, incremental=True)
+    full = await extract_page_semantics(page)
+    assert incremental.model_dump(mode="json") == full.model_dump(mode="json")
+
+
+async def test_incremental_matches_full_extraction_after_mutations(page) -> None:
+    await page.set_content(_fixture_store())
+    await _assert_matches_full(page)
+    for mutation in MUTATIONS:
+        await page.evaluate(mutation)
+        await _assert_matches_full(page)
+
+
+async def test_incremental_without_changes_is_stable(page) -> None:
+    await page.set_content(_fixture_store())
+    first = await extract_page_semantics(page, incremental=True)
+    second = await extract_page_semantics(page, incremental=True)
+
+    assert first.page_signature == second.page_signature
+
+
+async def test_incremental_state_resets_on_navigation(page) -> None:
+    await page.set_content(_fixture_store())
+    await extract_page_semantics(page, incremental=True)
+    await page.set_content("<html><head><title>Other</title></head><body><h1>Other</h1><a href='/a'>A</a></body></html>")
+    await _assert_matches_full(page)
+
+
+async def test_incremental_tracks_changes_the_observer_cannot_see(page) -> None:
+    await page.set_content(_fixture_store())
+    await page.evaluate(
+        """document.head.insertAdjacentHTML('beforeend', '<style>#faq { display: none } #more:checked ~ #faq { display: inline }</style>');
+        document.querySelector('#help').insertAdjacentHTML('afterbegin', "<input type='checkbox' id='more'>")"""
+    )
+    await _assert_matches_full(page)
+    for change in [
+        "document.querySelector('#more').checked = true",
+        "document.styleSheets[0].insertRule('button { display: none }', 0)",
+        "document.adoptedStyleSheets = [new CSSStyleSheet()]; document.adoptedStyleSheets[0].replaceSync('h2 { display: none }')",
+        "location.hash = '#cart'",
+    ]:
+        await page.evaluate(change)
+        await _assert_matches_full(page)
+
+
+async def test_release_incremental_removes_page_state(page) -> None:
+    await page.set_content(_fixture_store())
+    await extract_page_semantics(page, incremental=True)
+
+    assert await release_incremental(page) is True
+    assert await page.evaluate("window.__semanticPageExtractorIncremental === undefined")
+    assert await page.evaluate("Element.prototype.attachShadow.toString().includes('[native code]')")
+    assert await release_incremental(page) is False
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import ExtractionError, extract_page_semantics
+
+pytest.importorskip("playwright.async_api")
+
+
+def _fixture_scoped_page() -> str:
+    return """
+    <html><head><title>Shop</title></head><body>
+      <form id='aspnetForm'>
+        <h1>Shop</h1>
+        <h2>Search</h2>
+        <input aria-label='Search'><button>Go</button>
+        <div id='panel'>
+          <h3>Shipping</h3>
+          <label for='zip'>Zip</label><input id='zip'>
+          <button>Save address</button>
+        </div>
+        <h2>Promotions</h2>
+        <div id='bare'><div><a href='/terms'>Terms</a></div></div>
+      </form>
+    </body></html>
+    """
+
+
+async def test_root_selector_limits_collectors_to_subtree(page) -> None:
+    await page.set_content(_fixture_scoped_page())
+    summary = await extract_page_semantics(page, root="#panel")
+
+    assert summary.scope == "#panel"
+    assert summary.headers == ["Shipping"]
+    assert [e.visible_text for e in summary.interactive_elements] == ["Save address"]
+    assert len(summary.forms) == 1
+    assert [f.label for f in summary.forms[0].fields] == ["Zip"]
+    assert summary.forms[0].section_context == "Shipping"
+
+
+async def test_section_context_fallback_stops_at_root(page) -> None:
+    await page.set_content(_fixture_scoped_page())
+    full = await extract_page_semantics(page)
+    scoped = await extract_page_semantics(page, root="#bare")
+
+    assert [e.section_context for e in full.interactive_elements if e.visible_text == "Terms"] == ["Shipping"]
+    assert [e.section_context for e in scoped.interactive_elements] == ["bare"]
+
+
+async def test_element_handle_root_and_missing_root(page) -> None:
+    await page.set_content(_fixture_scoped_page())
+    handle = await page.query_selector("#panel button")
+    summary = await extract_page_semantics(page, root=handle)
+
+    assert summary.scope == "div#panel > button"
+    assert [e.visible_text for e in summary.interactive_elements] == ["Save address"]
+    with pytest.raises(ExtractionError) as exc_info:
+        await extract_page_semantics(page, root="#missing")
+    assert exc_info.value.code == "ROOT_NOT_FOUND"
+
+
+async def test_document_root_matches_unscoped_extraction(page) -> None:
+    await page.set_content(_fixture_scoped_page())
+    scoped = await extract_page_semantics(page, root="html")
+    full = await extract_page_semantics(page)
+
+    assert scoped.model_copy(update={"scope": None}) == full
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import FormBatch, InteractiveBatch, PageRecord, extract_page_semantics, stream_page_semantics
+from semantic_page_extractor.normalize import sort_key
+
+pytest.importorskip("playwright.async_api")
+
+
+def _fixture_catalog(cards: int) -> str:
+    rows = "".join(
+        f"<section><h2>Product {i}</h2><a href='/p/{i}'>View {i}</a>"
+        f"<form><label for='q{i}'>Qty</label><input id='q{i}' type='number'><button>Add</button></form></section>"
+        for i in range(cards)
+    )
+    return f"<html><head><title>Catalog</title></head><body><h1>Catalog</h1>{rows}</body></html>"
+
+
+async def test_stream_matches_full_extraction(page) -> None:
+    await page.set_content(_fixture_catalog(25))
+    records = [record async for record in stream_page_semantics(page, chunk_size=10)]
+    summary = await extract_page_semantics(page)
+
+    forms = sorted(
+        (f for r in records if isinstance(r, FormBatch) for f in r.forms),
+        key=lambda f: sort_key(f.form_signature, f.section_context),
+    )
+    elements = sorted(
+        (e for r in records if isinstance(r, InteractiveBatch) for e in r.elements),
+        key=lambda a: sort_key(a.action_signature, a.role, a.visible_text),
+    )
+    assert isinstance(records[-1], PageRecord)
+    assert records[-1].page_signature == summary.page_signature
+    assert forms == summary.forms
+    assert elements == summary.interactive_elements
+    assert await page.evaluate("Object.keys(window.__semanticPageExtractorStreams.open).length") == 0
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from semantic_page_extractor import ExtractionBudget, extract_page_semantics
+
+pytest.importorskip("playwright.async_api")
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[1] / "fixtures" / "sample-page.html"
+
+
+async def test_json_transport_matches_object_transport(page) -> None:
+    await page.set_content(SAMPLE_PAGE.read_text(encoding="utf-8"))
+
+    assert await extract_page_semantics(page, transport="json") == await extract_page_semantics(page)
+
+
+async def test_json_transport_matches_object_transport_when_budgeted(page) -> None:
+    options = "".join(f"<option>Option {i}</option>" for i in range(20))
+    await page.set_content(
+        SAMPLE_PAGE.read_text(encoding="utf-8").replace(
+            "<body>", f"<body><form><select aria-label='Pick'>{options}</select></form>"
+        )
+    )
+    budget = ExtractionBudget(max_elements=5, max_options=3, max_text_length=4)
+    summary = await extract_page_semantics(page, budget=budget)
+
+    assert summary.truncation.elements_limit_reached
+    assert summary.truncation.truncated_option_lists == 1
+    assert await extract_page_semantics(page, transport="json", budget=budget) == summary
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from semantic_page_extractor import ActionableIndex, rank_actionable_elements
+from semantic_page_extractor.models import InteractiveElement
+
+DATA_PATH = Path(__file__).resolve().parents[2] / "data" / "out1.json"
+QUERIES = ["add to cart", "ad to crt", "iphone air 512", "sky blue", "conditions of use", "esim", "to", "help"]
+
+
+def test_index_matches_linear_ranking_on_captured_page() -> None:
+    if not DATA_PATH.exists():
+        return
+
+    elements = [InteractiveElement.model_validate(item) for item in json.loads(DATA_PATH.read_text(encoding="utf-8"))]
+    index = ActionableIndex(elements)
+    for query in QUERIES:
+        expected = [(r.element.action_signature, r.score) for r in rank_actionable_elements(elements, query) if r.score >= 0.45]
+        assert [(r.element.action_signature, r.score) for r in index.rank(query)] == expected
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from semantic_page_extractor import VECTOR_SCORE_TOLERANCE, VectorizedScorer
+from semantic_page_extractor.intent import _score_element
+from semantic_page_extractor.models import InteractiveElement
+
+np = pytest.importorskip("numpy")
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+QUERIES = ["add to cart", "ad to crt", "iphone air 512", "sky blue", "conditions of use", "esim", "help", "back to top"]
+
+
+def test_vector_scores_within_tolerance_on_captured_pages() -> None:
+    for name in ("out1.json", "out2.json"):
+        path = DATA_DIR / name
+        if not path.exists():
+            continue
+
+        elements = [InteractiveElement.model_validate(item) for item in json.loads(path.read_text(encoding="utf-8"))]
+        scores = VectorizedScorer(elements).scores(QUERIES)
+        reference = np.array([[_score_element(element, query) for element in elements] for query in QUERIES])
+        assert np.abs(scores - reference).max() <= VECTOR_SCORE_TOLERANCE
+        assert ((scores >= 0.45) == (reference >= 0.45)).all()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+
+from semantic_page_extractor.transport import TRANSPORT_VERSION
+
+# Python mirror of encodeTransport in browser_script.py, used to build payloads
+# offline. tests/integration/test_transport.py checks the real JS encoder.
+_ACTION_KEYS = ("role", "visible_text", "aria_label", "section_context")
+_FIELD_KEYS = ("label_for", "label_wrapped", "aria_label", "placeholder", "type", "section_context")
+
+
+def encode_transport(raw: dict) -> str:
+    strings: list[str] = []
+    string_ids: dict[str, int] = {}
+
+    def _str(value: str | None) -> int:
+        if value is None:
+            return -1
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    actions: list[list[int]] = [[] for _ in range(len(_ACTION_KEYS) + 1)]
+    action_ids: dict[int, int] = {}
+
+    def _action(record: dict) -> int:
+        if id(record) not in action_ids:
+            action_ids[id(record)] = len(actions[0])
+            for column, key in zip(actions, _ACTION_KEYS):
+                column.append(_str(record.get(key)))
+            actions[-1].append(1 if record.get("disabled") else 0)
+        return action_ids[id(record)]
+
+    option_lists: list[list[int]] = []
+    option_ids: dict[int, int] = {}
+
+    def _options(values: list[str] | None) -> int:
+        if values is None:
+            return -1
+        if id(values) not in option_ids:
+            option_ids[id(values)] = len(option_lists)
+            option_lists.append([_str(v) for v in values])
+        return option_ids[id(values)]
+
+    fields: list[list[int]] = [[] for _ in range(len(_FIELD_KEYS) + 3)]
+
+    def _field(record: dict) -> int:
+        for column, key in zip(fields, _FIELD_KEYS):
+            column.append(_str(record.get(key)))
+        fields[-3].append(1 if record.get("required") else 0)
+        fields[-2].append(1 if record.get("disabled") else 0)
+        fields[-1].append(_options(record.get("options")))
+        return len(fields[0]) - 1
+
+    form_columns: list[list] = [[], [], []]
+    for form in raw.get("forms", []):
+        form_columns[0].append(_str(form.get("section_context")))
+        form_columns[1].append([_field(item) for item in form.get("fields", [])])
+        form_columns[2].append([_action(item) for item in form.get("submit_buttons", [])])
+    interactive_ids = [_action(item) for item in raw.get("interactive_elements", [])]
+
+    return json.dumps(
+        {
+            "v": TRANSPORT_VERSION,
+            "u": _str(raw.get("url")),
+            "t": _str(raw.get("title")),
+            "h": [_str(h) for h in raw.get("headers", [])],
+            "a": actions,
+            "f": fields,
+            "o": option_lists,
+            "F": form_columns,
+            "i": interactive_ids,
+            "s": strings,
+            **({"x": raw["truncation"]} if raw.get("truncation") else {}),
+        },
+        separators=(",", ":"),
+    )
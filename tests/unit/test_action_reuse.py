@@ -0,0 +1,23 @@
+from semantic_page_extractor.extractor import _to_form, _to_interactive
+
+
+def test_shared_submit_record_is_converted_once() -> None:
+    submit = {
+        "role": "button",
+        "visible_text": "Add to cart",
+        "aria_label": None,
+        "disabled": False,
+        "section_context": "Phone A",
+    }
+    actions = {}
+    form = _to_form({"section_context": "Phone A", "fields": [], "submit_buttons": [submit]}, actions)
+    element = _to_interactive(submit, actions)
+
+    assert form.submit_buttons[0] is element
+    assert len(actions) == 1
+
+
+def test_conversion_without_cache_is_unchanged() -> None:
+    raw = {"role": "link", "visible_text": "Help", "aria_label": None, "disabled": False, "section_context": None}
+    assert _to_interactive(raw) == _to_interactive(raw)
+    assert _to_interactive(raw) is not _to_interactive(raw)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from semantic_page_extractor.bench import (
+    _percentile,
+    generate_page,
+    page_from_actionables,
+    reference_workloads,
+    scaled_page,
+    summarize_stage,
+)
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _tags(html: str) -> int:
+    return len(re.findall(r"<[a-z]", html))
+
+
+def test_generate_page_is_deterministic_per_seed() -> None:
+    assert generate_page(seed=3) == generate_page(seed=3)
+    assert generate_page(seed=3) != generate_page(seed=4)
+
+
+def test_generate_page_scales_each_feature() -> None:
+    html = generate_page(headings=4, forms=3, fields_per_form=5, radio_groups=2, radios_per_group=3, links=40, depth=6, shadow_roots=2)
+
+    assert html.count("<h2>") == 4
+    assert html.count("<form>") == 3
+    assert html.count("<label for=") == 15
+    assert html.count("type='radio'") == 6
+    assert html.count("data-shadow=") == 2
+    assert html.count("<template>") == 2
+    assert html.count("attachShadow") == 1
+    assert html.count("href='/p/") + html.count("role='button'") == 40
+    assert "<div>" * 6 + "<section>" in html
+
+
+def test_generate_page_without_shadow_roots_has_no_script() -> None:
+    assert "<script>" not in generate_page(shadow_roots=0)
+
+
+@pytest.mark.parametrize("elements", [100, 1000, 10000, 50000])
+def test_scaled_page_tracks_element_target(elements: int) -> None:
+    assert 0.8 * elements <= _tags(scaled_page(elements)) <= 1.25 * elements
+
+
+def test_page_from_actionables_escapes_and_groups_by_context() -> None:
+    html = page_from_actionables(
+        [
+            {"role": "button", "visible_text": "Add <b>", "aria_label": "Add to cart", "section_context": "Cart"},
+            {"role": "link", "visible_text": "Details", "section_context": "Cart"},
+            {"role": "image_link", "visible_text": "Phone", "section_context": None},
+        ]
+    )
+
+    assert html.count("<h2>Cart</h2>") == 1
+    assert "<button aria-label='Add to cart'>Add &lt;b&gt;</button>" in html
+    assert "<img src='/img/2.png' alt='Phone'>" in html
+
+
+def test_reference_workloads_include_fixture_and_data_outputs() -> None:
+    names = [name for name, _ in reference_workloads(ROOT / "tests" / "fixtures" / "sample-page.html", ROOT / "data")]
+
+    assert names[0] == "sample-page.html"
+    assert names[1:] == [f"data/{path.name}" for path in sorted((ROOT / "data").glob("out*.json"))]
+
+
+def test_reference_workloads_default_to_the_current_directory(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    assert reference_workloads() == []
+    assert reference_workloads(None, None) == []
+
+
+def test_reference_workloads_decode_compact_outputs(tmp_path) -> None:
+    (tmp_path / "out1.json").write_text(json.dumps({"v": 1, "r": ["button"], "t": ["Buy now"], "c": ["Deals"], "i": [[0, 0, 0]]}))
+
+    [(name, html)] = reference_workloads(tmp_path / "missing.html", tmp_path)
+
+    assert name == "data/out1.json"
+    assert "<h2>Deals</h2>" in html and "<button>Buy now</button>" in html
+
+
+def test_percentiles_interpolate() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert _percentile(values, 0.5) == 50.5
+    assert _percentile([4.0], 0.99) == 4.0
+    assert summarize_stage(values) == {"p50": 50.5, "p90": 90.1, "p99": 99.01, "max": 100.0}
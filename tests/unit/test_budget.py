@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from semantic_page_extractor import ExtractionBudget, ExtractionError, PageSummary, SummaryCache, extract_page_semantics
+from semantic_page_extractor.browser_script import FINGERPRINT_SCRIPT
+from semantic_page_extractor.extractor import _to_summary
+from semantic_page_extractor.transport import decode_transport
+from tests.transport_encoder import encode_transport
+
+TRUNCATION = {
+    "elements_limit_reached": True,
+    "deadline_exceeded": False,
+    "skipped_candidates": 12,
+    "truncated_option_lists": 1,
+    "truncated_texts": 3,
+}
+
+
+def _raw(truncation: dict | None = None) -> dict:
+    raw = {
+        "url": "https://example.com/",
+        "title": "Catalog",
+        "headers": ["Catalog"],
+        "forms": [],
+        "interactive_elements": [{"role": "link", "visible_text": "View", "section_context": "Catalog"}],
+    }
+    if truncation is not None:
+        raw["truncation"] = truncation
+    return raw
+
+
+class BudgetPage:
+    def __init__(self, truncation: dict | None = None) -> None:
+        self.truncation = truncation
+        self.args: list[object] = []
+
+    async def evaluate(self, script: str, arg: object = None) -> dict:
+        if script == FINGERPRINT_SCRIPT:
+            return {"url": "https://example.com/", "hash": "a"}
+        self.args.append(arg)
+        return _raw(self.truncation)
+
+
+async def test_budget_is_passed_to_script_and_truncation_reported() -> None:
+    page = BudgetPage(TRUNCATION)
+    budget = ExtractionBudget(max_elements=50, max_options=20, max_text_length=80, deadline_ms=250)
+    summary = await extract_page_semantics(page, budget=budget)
+
+    assert page.args[0]["budget"] == {"max_elements": 50, "max_options": 20, "max_text_length": 80, "deadline_ms": 250}
+    assert summary.truncation.skipped_candidates == 12
+    assert summary.model_dump(mode="json")["truncation"] == TRUNCATION
+
+
+def test_untruncated_summary_serializes_without_truncation_key() -> None:
+    summary = _to_summary(_raw())
+
+    assert summary.truncation is None
+    assert "truncation" not in summary.model_dump()
+    assert "truncation" not in json.loads(summary.model_dump_json())
+    assert _to_summary(_raw(), trusted=True).model_dump() == summary.model_dump()
+
+
+def test_truncated_summary_round_trips() -> None:
+    summary = _to_summary(_raw(TRUNCATION), trusted=True)
+
+    assert PageSummary.model_validate_json(summary.model_dump_json()) == summary
+    assert _to_summary(decode_transport(encode_transport(_raw(TRUNCATION)))) == summary
+
+
+async def test_cache_is_keyed_by_budget_and_skips_deadline_results() -> None:
+    cache = SummaryCache()
+    page = BudgetPage()
+    await extract_page_semantics(page, cache=cache)
+    await extract_page_semantics(page, cache=cache, budget=ExtractionBudget(max_elements=5))
+    assert cache.misses == 2
+
+    page.truncation = {**TRUNCATION, "deadline_exceeded": True}
+    await extract_page_semantics(page, cache=cache, budget=ExtractionBudget(deadline_ms=1))
+    await extract_page_semantics(page, cache=cache, budget=ExtractionBudget(deadline_ms=1))
+    assert cache.misses == 4
+
+
+@pytest.mark.parametrize("kwargs", [{"max_elements": -1}, {"deadline_ms": -5}, {"max_text_length": 0}])
+def test_invalid_budget_is_rejected(kwargs: dict) -> None:
+    with pytest.raises(ExtractionError) as exc:
+        ExtractionBudget(**kwargs)
+    assert exc.value.code == "INVALID_BUDGET"
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import ExtractionBudget, ExtractionError, SummaryCache, extract_page_semantics, release_fingerprint
+from semantic_page_extractor.browser_script import FINGERPRINT_RELEASE_SCRIPT, FINGERPRINT_SCRIPT
+from semantic_page_extractor.extractor import _to_summary
+
+
+def _summary(title: str):
+    return _to_summary({"url": "https://example.com/", "title": title, "headers": [], "forms": [], "interactive_elements": []})
+
+
+class FingerprintPage:
+    def __init__(self) -> None:
+        self.fingerprint = {"url": "https://example.com/", "title": "Home", "elements": 10, "text_length": 42, "hash": "a"}
+        self.scroll = "0,0"
+        self.extractions = 0
+        self.released = False
+
+    async def evaluate(self, script: str, arg: object = None) -> dict | bool:
+        if script == FINGERPRINT_RELEASE_SCRIPT:
+            self.released = True
+            return True
+        if script == FINGERPRINT_SCRIPT:
+            return {**self.fingerprint, "scroll": self.scroll} if arg["scroll"] else dict(self.fingerprint)
+        self.extractions += 1
+        return {"url": self.fingerprint["url"], "title": f"Home {self.extractions}", "headers": [], "forms": [], "interactive_elements": []}
+
+
+async def test_unchanged_fingerprint_skips_extraction() -> None:
+    page = FingerprintPage()
+    cache = SummaryCache()
+    first = await extract_page_semantics(page, cache=cache)
+    second = await extract_page_semantics(page, cache=cache)
+    page.fingerprint["hash"] = "b"
+    third = await extract_page_semantics(page, cache=cache)
+
+    assert second is first
+    assert third.title == "Home 2"
+    assert page.extractions == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_scroll_position_keys_only_budgeted_extractions() -> None:
+    page = FingerprintPage()
+    cache = SummaryCache()
+    budget = ExtractionBudget(max_elements=5)
+    await extract_page_semantics(page, cache=cache)
+    await extract_page_semantics(page, cache=cache, budget=budget)
+    page.scroll = "0,800"
+    await extract_page_semantics(page, cache=cache)
+    await extract_page_semantics(page, cache=cache, budget=budget)
+
+    assert page.extractions == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+async def test_release_fingerprint_runs_release_script() -> None:
+    page = FingerprintPage()
+
+    assert await release_fingerprint(page) is True
+    assert page.released and page.extractions == 0
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    cache = SummaryCache(max_entries=2)
+    cache.put("a", _summary("A"))
+    cache.put("b", _summary("B"))
+    assert cache.get("a") is not None
+    cache.put("c", _summary("C"))
+
+    assert cache.get("b") is None
+    assert [cache.get(key).title for key in ("a", "c")] == ["A", "C"]
+    assert cache.stats()["entries"] == 2
+
+
+def test_disk_tier_survives_new_instances(tmp_path) -> None:
+    SummaryCache(directory=tmp_path).put("a", _summary("A"))
+    cache = SummaryCache(directory=tmp_path)
+
+    assert cache.get("a").title == "A"
+    assert (cache.hits, cache.disk_hits, cache.misses) == (1, 1, 0)
+
+
+def test_disk_tier_evicts_oldest_entries_by_size(tmp_path) -> None:
+    size = len(_summary("A").model_dump_json())
+    cache = SummaryCache(max_entries=1, directory=tmp_path, max_disk_bytes=2 * size)
+    for key in "abc":
+        cache.put(key, _summary(key.upper()))
+
+    assert cache.disk_bytes <= 2 * size
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.spe-cache.json", "c.spe-cache.json"]
+    assert cache.get("a") is None
+    assert cache.get("b").title == "B"
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path) -> None:
+    cache = SummaryCache(max_entries=1, directory=tmp_path)
+    cache.put("a", _summary("A"))
+    cache.put("b", _summary("B"))
+    (tmp_path / "a.spe-cache.json").write_text("{not json", encoding="utf-8")
+
+    assert cache.get("a") is None
+    assert not (tmp_path / "a.spe-cache.json").exists()
+
+
+def test_disk_tier_ignores_files_it_did_not_write(tmp_path) -> None:
+    (tmp_path / "notes.json").write_text('{"keep": true}', encoding="utf-8")
+    (tmp_path / "data.txt").write_text("keep", encoding="utf-8")
+    cache = SummaryCache(max_entries=1, directory=tmp_path, max_disk_bytes=1)
+    cache.put("a", _summary("A"))
+    cache.clear()
+
+    assert cache.stats()["disk_entries"] == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.txt", "notes.json"]
+
+
+def test_invalid_cache_sizes_are_rejected() -> None:
+    with pytest.raises(ExtractionError) as exc:
+        SummaryCache(max_entries=0)
+    assert exc.value.code == "INVALID_CACHE_CONFIG"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import copy
+
+from semantic_page_extractor import diff_summaries
+from semantic_page_extractor.extractor import _to_summary
+
+
+def _raw() -> dict:
+    pay = {"role": "button", "visible_text": "Pay", "aria_label": None, "disabled": False, "section_context": "Checkout"}
+    email = {"label_for": "Email", "type": "email", "required": True, "section_context": "Checkout"}
+    return {
+        "url": "https://example.com/cart",
+        "title": "Cart",
+        "headers": ["Checkout"],
+        "forms": [{"section_context": "Checkout", "fields": [email], "submit_buttons": [pay]}],
+        "interactive_elements": [
+            pay,
+            {"role": "link", "visible_text": "Help", "aria_label": None, "disabled": False, "section_context": "Checkout"},
+            {"role": "link", "visible_text": "Help", "aria_label": None, "disabled": False, "section_context": "Checkout"},
+        ],
+    }
+
+
+def test_identical_summaries_have_empty_diff() -> None:
+    diff = diff_summaries(_to_summary(_raw()), _to_summary(_raw()))
+
+    assert not diff
+    assert diff.to_dict()["interactive_elements"] == {"added": [], "removed": [], "changed": []}
+
+
+def test_attribute_change_is_reported_as_changed() -> None:
+    raw = _raw()
+    raw["forms"][0]["fields"][0]["required"] = False
+    raw["interactive_elements"][0] = {**raw["interactive_elements"][0], "disabled": True}
+    old, new = _to_summary(_raw()), _to_summary(raw)
+    diff = diff_summaries(old, new)
+
+    assert not diff.page_signature_changed
+    assert [(a.required, b.required) for a, b in diff.fields.changed] == [(True, False)]
+    assert [(a.disabled, b.disabled) for a, b in diff.interactive_elements.changed] == [(False, True)]
+    assert [b.form_signature for _, b in diff.forms.changed] == [new.forms[0].form_signature]
+    assert not diff.interactive_elements.added and not diff.interactive_elements.removed
+
+
+def test_duplicate_signatures_are_matched_as_a_multiset() -> None:
+    raw = _raw()
+    raw["interactive_elements"].pop()
+    old, new = _to_summary(_raw()), _to_summary(raw)
+    diff = diff_summaries(old, new)
+
+    assert diff.page_signature_changed
+    assert [e.visible_text for e in diff.interactive_elements.removed] == ["Help"]
+    assert not diff.interactive_elements.added and not diff.interactive_elements.changed
+    assert not diff.forms and not diff.fields
+
+
+def test_renamed_elements_are_added_and_removed() -> None:
+    raw = copy.deepcopy(_raw())
+    raw["forms"][0]["submit_buttons"][0] = {**raw["forms"][0]["submit_buttons"][0], "visible_text": "Pay now"}
+    raw["interactive_elements"][0] = raw["forms"][0]["submit_buttons"][0]
+    old, new = _to_summary(_raw()), _to_summary(raw)
+    diff = diff_summaries(old, new)
+    payload = diff.to_dict()
+
+    assert [e.visible_text for e in diff.interactive_elements.added] == ["Pay now"]
+    assert payload["interactive_elements"]["removed"] == [old.interactive_elements[0].action_signature]
+    assert payload["forms"]["removed"] == [old.forms[0].form_signature]
+    assert payload["forms"]["added"][0]["form_signature"] == new.forms[0].form_signature
+    assert not diff.fields
+
+
+def test_insertion_between_unchanged_elements_is_only_added() -> None:
+    raw = _raw()
+    raw["interactive_elements"].insert(1, {"role": "link", "visible_text": "Cart (1)", "aria_label": None, "disabled": False})
+    diff = diff_summaries(_to_summary(_raw()), _to_summary(raw))
+
+    assert [e.visible_text for e in diff.interactive_elements.added] == ["Cart (1)"]
+    assert not diff.interactive_elements.removed and not diff.interactive_elements.changed
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager, nullcontext
+
+import pytest
+
+from semantic_page_extractor import ExtractionError, ExtractorPool, PageSummary, extract_many
+
+DELAYS = {"https://slow.test/": 1.0, "https://queued.test/": 0.05}
+
+
+class FakePage:
+    def __init__(self, pool: FakePool) -> None:
+        self.pool = pool
+        self.url = ""
+
+    async def goto(self, url: str, wait_until: str = "load") -> None:
+        if url == "https://broken.test/":
+            raise RuntimeError("net::ERR_NAME_NOT_RESOLVED")
+        self.url = url
+        if url in self.pool.gates:
+            await self.pool.gates[url].wait()
+        await asyncio.sleep(DELAYS.get(url, 0.0))
+
+    async def evaluate(self, script: str, arg: object = None) -> dict:
+        return {
+            "url": self.url,
+            "title": self.url,
+            "headers": [],
+            "forms": [],
+            "interactive_elements": [
+                {"role": "link", "visible_text": "Home", "aria_label": None, "disabled": False, "section_context": None}
+            ],
+        }
+
+
+class FakePool(ExtractorPool):
+    def __init__(self, gated: list[str] = (), slots: int | None = None) -> None:
+        super().__init__()
+        self.gates = {url: asyncio.Event() for url in gated}
+        self.slots = asyncio.Semaphore(slots) if slots else None
+        self.open_pages = 0
+        self.peak_pages = 0
+
+    @asynccontextmanager
+    async def page(self):
+        async with self.slots or nullcontext():
+            self.open_pages += 1
+            self.peak_pages = max(self.peak_pages, self.open_pages)
+            try:
+                yield FakePage(self)
+            finally:
+                self.open_pages -= 1
+
+
+async def _until(predicate) -> None:
+    while not predicate():
+        await asyncio.sleep(0)
+
+
+async def test_extract_many_yields_in_completion_order_with_bounded_concurrency() -> None:
+    urls = ["https://a.test/", "https://b.test/", "https://c.test/"]
+    pool = FakePool(gated=urls)
+    stream = extract_many(urls, concurrency=3, pool=pool)
+    first = asyncio.ensure_future(anext(stream))
+    await _until(lambda: pool.open_pages == 3)
+    pool.gates["https://b.test/"].set()
+    results = [await first]
+    for url in ["https://c.test/", "https://a.test/"]:
+        pool.gates[url].set()
+        results.append(await anext(stream))
+    assert [item async for item in stream] == []
+
+    assert [url for url, _ in results] == ["https://b.test/", "https://c.test/", "https://a.test/"]
+    assert all(isinstance(result, PageSummary) for _, result in results)
+    assert pool.peak_pages == 3
+
+    pool = FakePool()
+    results = [item async for item in extract_many(urls * 3, concurrency=2, pool=pool)]
+    assert len(results) == 9
+    assert pool.peak_pages == 2
+
+
+async def test_extract_many_reports_per_url_errors_and_timeouts() -> None:
+    urls = ["https://slow.test/", "https://broken.test/", "https://b.test/"]
+    results = dict([item async for item in extract_many(urls, concurrency=3, timeout=0.2, pool=FakePool())])
+
+    assert results["https://slow.test/"].code == "URL_TIMEOUT"
+    assert results["https://broken.test/"].code == "URL_EXTRACTION_FAILED"
+    assert isinstance(results["https://b.test/"], PageSummary)
+
+
+async def test_extract_many_timeout_excludes_waiting_for_a_page() -> None:
+    pool = FakePool(slots=1)
+    urls = ["https://queued.test/"] * 20
+    results = [item async for item in extract_many(urls, concurrency=20, timeout=0.5, pool=pool)]
+
+    assert len(results) == 20
+    assert all(isinstance(result, PageSummary) for _, result in results)
+    assert pool.peak_pages == 1
+
+
+async def test_extract_many_reraises_errors_from_the_url_iterable() -> None:
+    def urls():
+        yield "https://b.test/"
+        raise FileNotFoundError("urls.txt")
+
+    results = []
+
+    async def _collect(concurrency: int) -> None:
+        async for item in extract_many(urls(), concurrency=concurrency, pool=FakePool()):
+            results.append(item)
+
+    with pytest.raises(FileNotFoundError):
+        await asyncio.wait_for(_collect(1), 5)
+    assert [url for url, _ in results] == ["https://b.test/"]
+
+    with pytest.raises(FileNotFoundError):
+        await asyncio.wait_for(_collect(3), 5)
+
+
+async def test_extract_many_applies_output_options() -> None:
+    results = [item async for item in extract_many(["https://b.test/"], pool=FakePool(), actionable_only=True)]
+
+    assert results == [
+        (
+            "https://b.test/",
+            [
+                {
+                    "action_signature": results[0][1][0]["action_signature"],
+                    "role": "link",
+                    "visible_text": "Home",
+                    "aria_label": None,
+                    "disabled": False,
+                    "section_context": None,
+                }
+            ],
+        )
+    ]
+
+
+async def test_extract_many_stops_workers_when_consumer_breaks() -> None:
+    pool = FakePool()
+    stream = extract_many(["https://b.test/"] * 10, concurrency=2, pool=pool)
+    async for _ in stream:
+        break
+    await stream.aclose()
+    await asyncio.sleep(0)
+    assert pool.open_pages == 0
+
+
+async def test_extract_many_rejects_zero_concurrency() -> None:
+    with pytest.raises(ExtractionError) as exc_info:
+        async for _ in extract_many(["https://b.test/"], concurrency=0, pool=FakePool()):
+            pass
+    assert exc_info.value.code == "INVALID_CONCURRENCY"
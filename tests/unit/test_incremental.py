@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from semantic_page_extractor import extract_page_semantics, release_incremental
+from semantic_page_extractor.browser_script import INCREMENTAL_RELEASE_SCRIPT
+
+RAW_PAGE = {
+    "url": "https://example.com/",
+    "title": "Example",
+    "headers": ["Example"],
+    "forms": [],
+    "interactive_elements": [],
+}
+
+
+class RecordingPage:
+    def __init__(self) -> None:
+        self.args: list[object] = []
+        self.released = False
+
+    async def evaluate(self, script: str, arg: object = None) -> dict | bool:
+        if script == INCREMENTAL_RELEASE_SCRIPT:
+            self.released = True
+            return True
+        self.args.append(arg)
+        return RAW_PAGE
+
+
+async def test_incremental_flag_is_forwarded_to_script() -> None:
+    page = RecordingPage()
+    await extract_page_semantics(page)
+    await extract_page_semantics(page, incremental=True)
+
+    assert page.args == [
+        {"transport": "object", "incremental": False},
+        {"transport": "object", "incremental": True},
+    ]
+
+
+async def test_release_incremental_runs_release_script() -> None:
+    page = RecordingPage()
+
+    assert await release_incremental(page) is True
+    assert page.released and page.args == []
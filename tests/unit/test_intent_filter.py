@@ -47,3 +47,21 @@ def test_tie_order_is_deterministic() -> None:
     r1 = [e.action_signature for e in filter_actionable_elements(items, "add to cart", min_score=0.1)]
     r2 = [e.action_signature for e in filter_actionable_elements(items, "add to cart", min_score=0.1)]
     assert r1 == r2 == ["a", "b"]
+
+
+def test_top_k_filter_matches_full_ranking() -> None:
+    items = [
+        _mk("c", "Add to cart", section="Phone C"),
+        _mk("a", "Add to cart", section="Phone A"),
+        _mk("a", "Add to cart", section="Phone A"),
+        _mk("b", "Proceed to checkout"),
+        _mk("d", "Cartoon gallery", role="link"),
+        _mk("e", None, section="Cart summary", role="image_link"),
+    ]
+    for query in ["add to cart", "ad to crt", "cart", "checkout", ""]:
+        for min_score in [0.0, 0.2, 0.45, 0.9]:
+            ranked = [item.element for item in rank_actionable_elements(items, query) if item.score >= min_score]
+            for max_results in [None, 0, 1, 2, 10]:
+                expected = ranked[:max_results] if max_results is not None else ranked
+                got = filter_actionable_elements(items, query, min_score=min_score, max_results=max_results)
+                assert [id(e) for e in got] == [id(e) for e in expected], (query, min_score, max_results)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from semantic_page_extractor import ActionableIndex, rank_actionable_elements, rank_many
+from semantic_page_extractor.models import FormSummary, InteractiveElement, PageSummary
+
+
+def _mk(sig: str, text: str | None, section: str | None = None, role: str = "button") -> InteractiveElement:
+    return InteractiveElement(
+        action_signature=sig,
+        role=role,
+        visible_text=text,
+        aria_label=None,
+        disabled=False,
+        section_context=section,
+    )
+
+
+ITEMS = [
+    _mk("1", "Add to cart", section="Phone A"),
+    _mk("2", "Add to cart", section="Phone B"),
+    _mk("3", "Proceed to checkout"),
+    _mk("4", None, section="iPhone 17 Pro listing", role="image_link"),
+    _mk("5", "Cartoon gallery", role="link"),
+    _mk("6", "Sign in", section="Account"),
+]
+
+
+def _reference(query: str, min_score: float) -> list[tuple[str, float]]:
+    return [(r.element.action_signature, r.score) for r in rank_actionable_elements(ITEMS, query) if r.score >= min_score]
+
+
+def test_index_rank_matches_linear_ranking() -> None:
+    index = ActionableIndex(ITEMS)
+    for query in ["add to cart", "ad to crt", "iphone 17", "cart", "to", "sign", "", "!!", "zzz"]:
+        for min_score in [0.0, 0.1, 0.35, 0.45, 0.8]:
+            ranked = [(r.element.action_signature, r.score) for r in index.rank(query, min_score=min_score)]
+            assert ranked == _reference(query, min_score), (query, min_score)
+
+
+def test_index_top_matches_cut_linear_ranking() -> None:
+    index = ActionableIndex(ITEMS * 3)
+    for query in ["add to cart", "ad to crt", "cart", "sign", "", "zzz"]:
+        for min_score in [0.0, 0.1, 0.45]:
+            expected = [r for r in rank_actionable_elements(ITEMS * 3, query) if r.score >= min_score]
+            for max_results in [None, -1, 0, 1, 2, 5, 100]:
+                top = index.top(query, min_score=min_score, max_results=max_results)
+                assert top == (expected[:max_results] if max_results is not None else expected), (query, min_score, max_results)
+
+
+def test_index_filter_respects_max_results() -> None:
+    index = ActionableIndex(ITEMS)
+    assert [e.action_signature for e in index.filter("add to cart", max_results=1)] == ["1"]
+
+
+def test_index_from_summary_uses_deduped_actionables() -> None:
+    shared = ITEMS[0]
+    summary = PageSummary(
+        schema_version="1.0",
+        url="https://example.com",
+        title="Example",
+        page_signature="page",
+        headers=[],
+        forms=[FormSummary(form_signature="f", section_context=None, fields=[], submit_buttons=[shared])],
+        interactive_elements=[shared, ITEMS[2]],
+    )
+    index = ActionableIndex.from_summary(summary)
+    assert len(index) == 2
+    assert [e.action_signature for e in index.filter("add to cart")] == ["1"]
+
+
+def test_rank_many_matches_per_query_ranking() -> None:
+    summary = PageSummary(
+        schema_version="1.0",
+        url="https://example.com",
+        title="Example",
+        page_signature="page",
+        headers=[],
+        forms=[],
+        interactive_elements=ITEMS,
+    )
+    queries = ["add to cart", "checkout", "sign in", "add to cart", "zzz"]
+    results = rank_many(summary, queries, min_score=0.3, max_results=2)
+
+    assert len(results) == len(queries)
+    for query, ranked in zip(queries, results):
+        expected = [r for r in rank_actionable_elements(ITEMS, query) if r.score >= 0.3][:2]
+        assert ranked == expected
+    assert results[0] is not results[3]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import VECTOR_SCORE_TOLERANCE, VectorizedScorer, rank_actionable_elements
+from semantic_page_extractor.intent import _score_element
+from semantic_page_extractor.models import InteractiveElement
+
+np = pytest.importorskip("numpy")
+
+
+def _mk(sig: str, text: str | None, section: str | None = None, role: str = "button") -> InteractiveElement:
+    return InteractiveElement(
+        action_signature=sig,
+        role=role,
+        visible_text=text,
+        aria_label=None,
+        disabled=False,
+        section_context=section,
+    )
+
+
+ITEMS = [
+    _mk("1", "Add to cart", section="Phone A"),
+    _mk("2", "Add to cart", section="Phone B"),
+    _mk("3", "Proceed to checkout"),
+    _mk("4", None, section="iPhone 17 Pro listing", role="image_link"),
+    _mk("5", "Cartoon gallery", role="link"),
+    _mk("6", "Sign in", section="Account"),
+]
+QUERIES = ["add to cart", "ad to crt", "iphone 17", "cart", "to", "sign", "", "zzz", "add to cart add"]
+
+
+def test_vector_scores_stay_within_tolerance() -> None:
+    scores = VectorizedScorer(ITEMS).scores(QUERIES)
+
+    assert scores.shape == (len(QUERIES), len(ITEMS))
+    reference = np.array([[_score_element(item, query) for item in ITEMS] for query in QUERIES])
+    assert np.abs(scores - reference).max() <= VECTOR_SCORE_TOLERANCE
+    assert not scores[QUERIES.index("")].any()
+
+
+def test_vector_rank_orders_like_reference_for_clear_matches() -> None:
+    ranked = VectorizedScorer(ITEMS).rank("add to cart")
+    expected = [r.element for r in rank_actionable_elements(ITEMS, "add to cart") if r.score >= 0.45]
+
+    assert [r.element for r in ranked] == expected
+    assert VectorizedScorer(ITEMS).rank_many(["add to cart", "sign in"], max_results=1)[1][0].element.action_signature == "6"
+
+
+def test_vector_scorer_handles_empty_corpus() -> None:
+    assert VectorizedScorer([]).scores(["add to cart"]).shape == (1, 0)
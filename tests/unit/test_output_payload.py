@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import json
+
+import pytest
+
 from semantic_page_extractor.models import FieldSummary, FormSummary, InteractiveElement, PageSummary
-from semantic_page_extractor.output import build_output_payload
+from semantic_page_extractor.output import (
+    COMPACT_BINARY_VERSION,
+    build_output_payload,
+    compact_actionable_binary,
+    compact_actionable_payload,
+    decode_compact,
+)
 
 
 def _mk_action(sig: str, text: str, section: str = "S", role: str = "button") -> InteractiveElement:
@@ -70,3 +80,59 @@ def test_build_output_payload_compact_format() -> None:
     payload = build_output_payload(_summary(), actionable_only=True, output_format="compact")
     assert isinstance(payload, dict)
     assert {"v", "r", "t", "c", "i"} == set(payload.keys())
+
+
+def _actionables(count: int) -> list[dict]:
+    return [
+        {
+            "role": "button" if i % 2 else "link",
+            "visible_text": f"Item {i}" if i % 7 else None,
+            "aria_label": None,
+            "section_context": f"Section {i % 300}",
+            "disabled": i % 3 == 0,
+        }
+        for i in range(count)
+    ]
+
+
+def test_compact_binary_round_trips_like_json_compact() -> None:
+    payload = build_output_payload(_summary(), actionable_only=True)
+    payload[1]["disabled"] = True
+    compact = compact_actionable_payload(payload)
+    binary = compact_actionable_binary(payload)
+
+    assert binary[0] == COMPACT_BINARY_VERSION
+    assert decode_compact(binary) == decode_compact(json.dumps(compact)) == decode_compact(compact)
+    assert [item["disabled"] for item in decode_compact(binary)] == [False, True]
+
+
+def test_compact_binary_handles_wide_tables_and_is_smaller() -> None:
+    items = _actionables(70_000)
+    compact_json = json.dumps(compact_actionable_payload(items), separators=(",", ":")).encode()
+    binary = compact_actionable_binary(items)
+
+    decoded = decode_compact(binary)
+    assert decoded == decode_compact(compact_json)
+    assert decoded[7]["visible_text"] is None
+    assert sum(item["disabled"] for item in decoded) == 23_334
+    assert len(binary) < len(compact_json)
+
+
+def test_decode_compact_rejects_unknown_versions_and_truncation() -> None:
+    binary = compact_actionable_binary(_actionables(20))
+
+    assert decode_compact(compact_actionable_binary([])) == []
+    for broken in (binary[:-1], binary + b"\x00", b"\x09" + binary[1:]):
+        with pytest.raises(ValueError):
+            decode_compact(broken)
+    with pytest.raises(ValueError):
+        decode_compact({"v": 2, "r": [], "t": [], "c": [], "i": []})
+
+
+def test_decode_compact_rejects_list_payloads() -> None:
+    plain = compact_actionable_payload([{"label": "Email", "type": "email"}])
+    assert isinstance(plain, list)
+
+    for payload in ("[]", b"[]", json.dumps(plain), json.dumps(plain).encode("utf-8"), plain):
+        with pytest.raises(ValueError):
+            decode_compact(payload)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from semantic_page_extractor import ExtractionError, decode_compact, pack_actionable_payload
+from semantic_page_extractor.models import InteractiveElement, PageSummary
+from semantic_page_extractor.packer import ELLIPSIS
+
+
+def _element(i: int, text: str, context: str | None = "Phones", role: str = "button", disabled: bool = False) -> InteractiveElement:
+    return InteractiveElement(
+        action_signature=f"sig-{i:03d}",
+        role=role,
+        visible_text=text,
+        aria_label=None,
+        disabled=disabled,
+        section_context=context,
+    )
+
+
+def _elements() -> list[InteractiveElement]:
+    long_context = "Matte Case for iPhone 17 Pro, Shockproof Military Grade Drop Protection " * 6
+    elements = [_element(0, "Add to cart", long_context), _element(1, "Buy now", long_context, disabled=True)]
+    elements += [_element(i, f"View product {i}", "Phones", role="link") for i in range(2, 60)]
+    return elements
+
+
+@pytest.mark.parametrize("max_bytes", [60, 150, 400, 1000, 5000])
+def test_packed_payload_always_fits_byte_budget(max_bytes: int) -> None:
+    packed = pack_actionable_payload(_elements(), max_bytes=max_bytes)
+
+    assert len(packed.text.encode("utf-8")) == packed.size <= max_bytes
+    assert json.loads(packed.text) == packed.payload
+    assert len(decode_compact(packed.text)) == packed.included
+    assert packed.included + packed.dropped == 60
+
+
+def test_intent_ranked_elements_come_first_and_long_text_is_truncated() -> None:
+    packed = pack_actionable_payload(_elements(), max_bytes=300, intent="add to cart", min_score=0.0)
+    items = decode_compact(packed.payload)
+
+    assert items[0]["visible_text"] == "Add to cart"
+    assert items[0]["section_context"].endswith(ELLIPSIS)
+    assert len(items[0]["section_context"]) <= 120
+    assert packed.truncated >= 1
+    assert packed.dropped > 0
+
+
+def test_repeated_contexts_are_stored_once() -> None:
+    packed = pack_actionable_payload(_elements(), max_bytes=10_000)
+
+    assert packed.dropped == 0
+    assert packed.payload["c"].count("Phones") == 1
+    assert [item["disabled"] for item in decode_compact(packed.payload)][:2] == [False, True]
+
+
+def test_token_budget_uses_chars_per_token_estimate() -> None:
+    summary = PageSummary(
+        schema_version="1.0",
+        url="https://example.com",
+        title="Example",
+        page_signature="page",
+        headers=[],
+        forms=[],
+        interactive_elements=_elements(),
+    )
+    packed = pack_actionable_payload(summary, max_tokens=100, chars_per_token=3.0)
+
+    assert packed.size <= 100
+    assert len(packed.text) <= 300
+
+
+def test_invalid_and_too_small_budgets_are_rejected() -> None:
+    for kwargs in ({}, {"max_bytes": 100, "max_tokens": 10}, {"max_bytes": 0}, {"max_bytes": 100, "max_text_length": 3}):
+        with pytest.raises(ExtractionError) as exc_info:
+            pack_actionable_payload(_elements(), **kwargs)
+        assert exc_info.value.code == "INVALID_PACK_BUDGET"
+    with pytest.raises(ExtractionError) as exc_info:
+        pack_actionable_payload(_elements(), max_bytes=10)
+    assert exc_info.value.code == "PACK_BUDGET_TOO_SMALL"
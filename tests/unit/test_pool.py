@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from semantic_page_extractor import ExtractionError, ExtractorPool, PageSummary, extract_from_url
+
+RAW_PAGE = {
+    "url": "https://example.com/",
+    "title": "Example",
+    "headers": ["Example"],
+    "forms": [],
+    "interactive_elements": [
+        {"role": "link", "visible_text": "More", "aria_label": None, "disabled": False, "section_context": "Example"}
+    ],
+}
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.visited: list[str] = []
+
+    async def goto(self, url: str, wait_until: str = "load") -> None:
+        self.visited.append(url)
+
+    async def evaluate(self, script: str, arg: object = None) -> dict:
+        return RAW_PAGE
+
+
+class FakeContext:
+    def __init__(self, browser: FakeBrowser) -> None:
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self) -> FakePage:
+        return FakePage()
+
+    async def close(self) -> None:
+        self.closed = True
+        self.browser.open_contexts -= 1
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.open_contexts = 0
+        self.peak_contexts = 0
+        self.closed = False
+
+    async def new_context(self, **options: object) -> FakeContext:
+        self.open_contexts += 1
+        self.peak_contexts = max(self.peak_contexts, self.open_contexts)
+        return FakeContext(self)
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakePool(ExtractorPool):
+    async def _start_driver(self) -> None:
+        self._playwright = object()
+        self.launched: list[FakeBrowser] = []
+
+    async def _stop_driver(self) -> None:
+        pass
+
+    async def _launch(self) -> FakeBrowser:
+        self._launches += 1
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+async def test_pool_caps_pages_per_browser() -> None:
+    async with FakePool(browsers=2, max_pages_per_browser=2) as pool:
+
+        async def _hold() -> None:
+            async with pool.page():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(_hold() for _ in range(9)))
+
+        assert [browser.peak_contexts for browser in pool.launched] == [2, 2]
+        assert all(browser.open_contexts == 0 for browser in pool.launched)
+
+
+async def test_pool_recycles_browser_after_max_uses() -> None:
+    async with FakePool(max_uses_per_browser=2) as pool:
+        for _ in range(5):
+            async with pool.page() as page:
+                await page.goto("https://example.com/")
+
+        assert pool.launches == 3
+        assert [browser.closed for browser in pool.launched] == [True, True, False]
+    assert pool.launched[-1].closed
+
+
+async def test_pool_replaces_disconnected_browser() -> None:
+    async with FakePool() as pool:
+        async with pool.page():
+            pool.launched[0].closed = True
+        async with pool.page():
+            pass
+        assert pool.launches == 2
+
+
+async def test_failed_relaunch_drops_only_that_browser() -> None:
+    class FailingPool(FakePool):
+        async def _launch(self) -> FakeBrowser:
+            if self._launches >= self.browsers:
+                raise RuntimeError("chromium crashed on launch")
+            return await super()._launch()
+
+    async with FailingPool(browsers=2, max_pages_per_browser=1) as pool:
+        async with pool.page() as page:
+            await page.goto("https://example.com/")
+            broken = next(browser for browser in pool.launched if browser.open_contexts)
+            broken.closed = True
+        assert page.visited == ["https://example.com/"]
+        assert "chromium crashed on launch" in str(pool.relaunch_error)
+
+        async with pool.page() as page:
+            await page.goto("https://example.com/other")
+        assert page.visited == ["https://example.com/other"]
+
+        async with pool.page():
+            next(browser for browser in pool.launched if not browser.closed).closed = True
+        with pytest.raises(ExtractionError) as exc_info:
+            async with pool.page():
+                pass
+        assert exc_info.value.code == "POOL_EXHAUSTED"
+        assert "chromium crashed on launch" in str(exc_info.value)
+        assert exc_info.value.__cause__ is pool.relaunch_error
+
+
+async def test_pool_must_be_open() -> None:
+    pool = FakePool()
+    with pytest.raises(ExtractionError) as exc_info:
+        async with pool.page():
+            pass
+    assert exc_info.value.code == "POOL_CLOSED"
+
+
+def test_pool_rejects_empty_sizes() -> None:
+    with pytest.raises(ExtractionError) as exc_info:
+        ExtractorPool(max_pages_per_browser=0)
+    assert exc_info.value.code == "INVALID_POOL_CONFIG"
+
+
+async def test_extract_from_url_reuses_pool_browsers() -> None:
+    async with FakePool() as pool:
+        first = await extract_from_url("https://example.com/", pool=pool)
+        second = await extract_from_url("https://example.com/", pool=pool, actionable_only=True)
+
+        assert isinstance(first, PageSummary)
+        assert second == [item.model_dump() for item in first.interactive_elements]
+        assert pool.launches == 1
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_page_extractor import ExtractionError, PageRecord, SummaryCache, extract_page_semantics, stream_page_semantics
+from semantic_page_extractor.browser_script import FINGERPRINT_SCRIPT, SCOPE_SCRIPT, STREAM_RELEASE_SCRIPT
+
+
+def _raw() -> dict:
+    return {
+        "url": "https://example.com/checkout",
+        "title": "Shop",
+        "headers": ["Checkout"],
+        "forms": [],
+        "interactive_elements": [{"role": "button", "visible_text": "Pay", "section_context": "Checkout"}],
+    }
+
+
+class ElementHandle:
+    pass
+
+
+class ScopedPage:
+    def __init__(self, found: bool = True) -> None:
+        self.found = found
+        self.args: list[object] = []
+
+    async def evaluate(self, script: str, arg: object = None) -> object:
+        if script == FINGERPRINT_SCRIPT:
+            return {"url": "https://example.com/checkout", "hash": "a"}
+        if script == SCOPE_SCRIPT:
+            assert isinstance(arg, ElementHandle)
+            return "section#checkout"
+        if script == STREAM_RELEASE_SCRIPT:
+            return None
+        self.args.append(arg)
+        if not self.found:
+            return None
+        if arg.get("stream"):
+            return {"id": 1, "url": "https://example.com/checkout", "title": "Shop", "counts": {"headers": 0, "forms": 0, "interactive_elements": 0}}
+        return _raw()
+
+
+async def test_selector_root_is_passed_to_script_and_recorded_as_scope() -> None:
+    page = ScopedPage()
+    summary = await extract_page_semantics(page, root="#checkout")
+
+    assert page.args == [{"transport": "object", "incremental": False, "root": "#checkout"}]
+    assert summary.scope == "#checkout"
+    assert summary.model_dump()["scope"] == "#checkout"
+
+
+async def test_element_handle_root_is_described_by_its_path() -> None:
+    page = ScopedPage()
+    handle = ElementHandle()
+    summary = await extract_page_semantics(page, root=handle)
+
+    assert page.args[0]["root"] is handle
+    assert summary.scope == "section#checkout"
+
+
+async def test_unscoped_summary_serializes_without_scope_key() -> None:
+    summary = await extract_page_semantics(ScopedPage())
+
+    assert summary.scope is None
+    assert "scope" not in summary.model_dump()
+
+
+async def test_missing_root_raises_root_not_found() -> None:
+    with pytest.raises(ExtractionError) as exc_info:
+        await extract_page_semantics(ScopedPage(found=False), root="#missing")
+
+    assert exc_info.value.code == "ROOT_NOT_FOUND"
+
+
+async def test_empty_root_selector_is_rejected() -> None:
+    with pytest.raises(ExtractionError) as exc_info:
+        await extract_page_semantics(ScopedPage(), root="  ")
+
+    assert exc_info.value.code == "INVALID_ROOT"
+
+
+async def test_cache_keys_differ_per_scope() -> None:
+    page = ScopedPage()
+    cache = SummaryCache()
+    await extract_page_semantics(page, cache=cache)
+    await extract_page_semantics(page, cache=cache, root="#checkout")
+    await extract_page_semantics(page, cache=cache, root="#checkout")
+
+    assert len(page.args) == 2
+    assert cache.stats()["misses"] == 2
+    assert cache.hits == 1
+
+
+async def test_stream_records_scope_on_page_record() -> None:
+    page = ScopedPage()
+    records = [record async for record in stream_page_semantics(page, root="#checkout")]
+
+    assert page.args[0]["root"] == "#checkout"
+    assert isinstance(records[-1], PageRecord)
+    assert records[-1].scope == "#checkout"
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from semantic_page_extractor import ExtractionError, PageSummary, extract_sharded
+from semantic_page_extractor.sharded import _decode_result, _encode_result
+
+SUMMARY = PageSummary(
+    schema_version="1.0",
+    url="https://example.com/",
+    title="Example",
+    page_signature="page",
+    headers=["Example"],
+    forms=[],
+    interactive_elements=[],
+)
+
+
+def test_results_round_trip_through_compact_messages() -> None:
+    assert _decode_result(_encode_result("u", SUMMARY)) == ("u", SUMMARY)
+    assert _decode_result(_encode_result("u", [{"t": "Buy"}])) == ("u", [{"t": "Buy"}])
+
+    url, error = _decode_result(_encode_result("u", ExtractionError("boom", code="URL_TIMEOUT")))
+    assert url == "u"
+    assert error.to_dict() == {"code": "URL_TIMEOUT", "message": "boom"}
+
+
+async def test_failed_workers_report_every_url() -> None:
+    urls = ["https://a.test/", "https://b.test/", "https://a.test/"]
+    results = [
+        item
+        async for item in extract_sharded(
+            urls,
+            processes=2,
+            concurrency=1,
+            launch_options={"executable_path": "/nonexistent/chromium"},
+        )
+    ]
+
+    assert sorted(url for url, _ in results) == sorted(urls)
+    assert all(isinstance(result, ExtractionError) for _, result in results)
+    assert {result.code for _, result in results} == {"WORKER_FAILED"}
@@ -1,4 +1,13 @@
-from semantic_page_extractor.signatures import action_signature, field_signature, sha256_canonical
+from semantic_page_extractor.normalize import normalize_text
+from semantic_page_extractor.signatures import (
+    action_signature,
+    batch_action_signatures,
+    batch_field_signatures,
+    field_signature,
+    form_signature,
+    page_signature,
+    sha256_canonical,
+)
 
 
 def test_signature_stability() -> None:
@@ -15,3 +24,55 @@ def test_canonical_hash_is_order_independent() -> None:
     a = sha256_canonical({"b": 2, "a": 1})
     b = sha256_canonical({"a": 1, "b": 2})
     assert a == b
+
+
+def _reference_field(label, input_type, section_context) -> str:
+    return sha256_canonical(
+        {
+            "label": normalize_text(label),
+            "type": normalize_text(input_type) or "text",
+            "section_context": normalize_text(section_context),
+        }
+    )
+
+
+def _reference_action(text, role, section_context) -> str:
+    return sha256_canonical(
+        {
+            "visible_text": normalize_text(text),
+            "role": normalize_text(role) or "",
+            "section_context": normalize_text(section_context),
+        }
+    )
+
+
+SAMPLES = [
+    ("Email", "email", "Login"),
+    (None, "", None),
+    ("  Add \n to   cart ", "button", "iPhone Air 512 GB: 16.63 cm (6.5″) Display; Sky Blue"),
+    ('Say "hi" \\ now', "link", "Café \U0001f600 \t tab"),
+    ("\x01ctrl", " radio ", ""),
+]
+
+
+def test_fast_encoder_matches_canonical_json() -> None:
+    for text, kind, context in SAMPLES:
+        assert field_signature(text, kind, context) == _reference_field(text, kind, context)
+        assert action_signature(text, kind, context) == _reference_action(text, kind, context)
+
+
+def test_form_and_page_signatures_match_canonical_json() -> None:
+    fields = ["b" * 64, "a" * 64]
+    submits = ["é\"x"]
+    assert form_signature(fields, submits, " Login ") == sha256_canonical(
+        {"section_context": "Login", "field_signatures": sorted(fields), "submit_signatures": submits}
+    )
+    assert page_signature(" T ", ["b", " a "], 2, 0) == sha256_canonical(
+        {"title": "T", "headers": ["a", "b"], "forms_count": 2, "interactive_count": 0}
+    )
+    assert page_signature("", [], 0, 0) == sha256_canonical({"title": None, "headers": [], "forms_count": 0, "interactive_count": 0})
+
+
+def test_batch_signatures_match_single_calls() -> None:
+    assert batch_action_signatures(SAMPLES) == [action_signature(*item) for item in SAMPLES]
+    assert batch_field_signatures(SAMPLES) == [field_signature(*item) for item in SAMPLES]
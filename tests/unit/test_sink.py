@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import json
+import lzma
+
+import pytest
+
+from semantic_page_extractor import ExtractionError, NdjsonSink
+from semantic_page_extractor.extractor import _to_summary
+from semantic_page_extractor.sink import _OPENERS
+
+
+def _summary(title: str):
+    return _to_summary({"url": f"https://example.com/{title}", "title": title, "headers": [], "forms": [], "interactive_elements": []})
+
+
+class RecordingFile(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks: list[int] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(len(data))
+        return super().write(data)
+
+
+@pytest.mark.parametrize("suffix,opener", [(".ndjson", open), (".ndjson.gz", gzip.open), (".ndjson.bz2", bz2.open), (".ndjson.xz", lzma.open)])
+async def test_sink_writes_ndjson_with_compression_from_suffix(tmp_path, suffix, opener) -> None:
+    path = tmp_path / f"out{suffix}"
+    async with NdjsonSink(path) as sink:
+        await sink.write(_summary("a"))
+        await sink.write([{"role": "link", "visible_text": "Café"}])
+
+    with opener(path, "rb") as handle:
+        lines = handle.read().decode("utf-8").splitlines()
+    assert json.loads(lines[0]) == _summary("a").model_dump(mode="json")
+    assert json.loads(lines[1]) == [{"role": "link", "visible_text": "Café"}]
+    assert sink.records == 2
+
+
+async def test_sink_flushes_at_bounded_sizes_and_waits_for_each_flush() -> None:
+    target = RecordingFile()
+    sink = NdjsonSink(target, flush_bytes=200)
+    for i in range(20):
+        await sink.write({"i": i, "pad": "x" * 40})
+        assert sink._buffered < 200
+    await sink.close()
+
+    assert len(target.chunks) == sink.flushes > 1
+    assert max(target.chunks) < 200 + 60
+    assert len(target.getvalue().splitlines()) == 20
+    assert not target.closed
+
+
+async def test_write_results_records_errors_and_payloads() -> None:
+    async def results():
+        yield "https://example.com/a", _summary("a")
+        yield "https://example.com/b", ExtractionError("timed out", code="URL_TIMEOUT")
+        yield "https://example.com/c", [{"role": "button"}]
+
+    target = io.BytesIO()
+    async with NdjsonSink(target) as sink:
+        written = await sink.write_results(results())
+
+    lines = [json.loads(line) for line in target.getvalue().splitlines()]
+    assert written == 3
+    assert lines[0]["result"]["title"] == "a"
+    assert lines[1] == {"url": "https://example.com/b", "error": {"code": "URL_TIMEOUT", "message": "timed out"}}
+    assert lines[2] == {"url": "https://example.com/c", "result": [{"role": "button"}]}
+
+
+def test_invalid_sink_configuration_is_rejected(tmp_path) -> None:
+    with pytest.raises(ExtractionError) as exc_info:
+        NdjsonSink(tmp_path / "out.ndjson", flush_bytes=0)
+    assert exc_info.value.code == "INVALID_SINK_CONFIG"
+    with pytest.raises(ExtractionError) as exc_info:
+        NdjsonSink(tmp_path / "out.ndjson", compression="snappy")
+    assert exc_info.value.code == "INVALID_COMPRESSION"
+    if _OPENERS["zstd"] is None:
+        with pytest.raises(ExtractionError) as exc_info:
+            NdjsonSink(tmp_path / "out.ndjson.zst")
+        assert exc_info.value.code == "INVALID_COMPRESSION"
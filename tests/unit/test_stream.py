@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from semantic_page_extractor import (
+    ExtractionError,
+    FormBatch,
+    HeaderBatch,
+    InteractiveBatch,
+    PageRecord,
+    extract_page_semantics,
+    stream_page_semantics,
+)
+from semantic_page_extractor.browser_script import EXTRACTION_SCRIPT, STREAM_CHUNK_SCRIPT, STREAM_RELEASE_SCRIPT
+from semantic_page_extractor.normalize import sort_key
+
+
+def _raw() -> dict:
+    forms = []
+    links = []
+    for i in range(7):
+        section = f"Product {i}"
+        submit = {"role": "button", "visible_text": "Add", "aria_label": None, "disabled": False, "section_context": section}
+        forms.append(
+            {
+                "section_context": section,
+                "fields": [{"label_for": "Qty", "type": "number", "section_context": section}],
+                "submit_buttons": [submit],
+            }
+        )
+        links += [submit, {"role": "link", "visible_text": f"View {i}", "section_context": section}]
+    headers = [" Catalog ", "", *(f"Product {i}" for i in range(7))]
+    return {"url": "https://example.com/", "title": " Catalog ", "headers": headers, "forms": forms, "interactive_elements": links}
+
+
+class StreamingPage:
+    def __init__(self) -> None:
+        self.streams: dict[int, dict] = {}
+        self.chunk_calls = 0
+
+    async def evaluate(self, script: str, arg: object = None) -> object:
+        if script == EXTRACTION_SCRIPT and arg.get("stream"):
+            payload = _raw()
+            stream_id = len(self.streams) + 1
+            self.streams[stream_id] = payload
+            counts = {key: len(payload[key]) for key in ("headers", "forms", "interactive_elements")}
+            return {"id": stream_id, "url": payload["url"], "title": payload["title"], "counts": counts}
+        if script == EXTRACTION_SCRIPT:
+            return _raw()
+        if script == STREAM_CHUNK_SCRIPT:
+            self.chunk_calls += 1
+            payload = self.streams.get(arg["id"])
+            if payload is None:
+                return None
+            return copy.deepcopy(payload[arg["section"]][arg["offset"] : arg["offset"] + arg["limit"]])
+        if script == STREAM_RELEASE_SCRIPT:
+            self.streams.pop(arg, None)
+            return None
+        raise AssertionError("unexpected script")
+
+
+async def test_stream_reassembles_to_full_summary() -> None:
+    page = StreamingPage()
+    records = [record async for record in stream_page_semantics(page, chunk_size=3)]
+    summary = await extract_page_semantics(page)
+
+    headers = [h for r in records if isinstance(r, HeaderBatch) for h in r.headers]
+    forms = [f for r in records if isinstance(r, FormBatch) for f in r.forms]
+    elements = [e for r in records if isinstance(r, InteractiveBatch) for e in r.elements]
+    forms.sort(key=lambda f: sort_key(f.form_signature, f.section_context))
+    elements.sort(key=lambda a: sort_key(a.action_signature, a.role, a.visible_text))
+    final = records[-1]
+
+    assert isinstance(final, PageRecord)
+    assert final.page_signature == summary.page_signature
+    assert (final.title, final.url, final.interactive_count) == (summary.title, summary.url, 14)
+    assert sorted(headers, key=str.lower) == summary.headers
+    assert forms == summary.forms
+    assert elements == summary.interactive_elements
+    assert not page.streams
+
+
+async def test_stream_batches_are_bounded_by_chunk_size() -> None:
+    page = StreamingPage()
+    records = [record async for record in stream_page_semantics(page, chunk_size=4)]
+
+    assert all(len(r.elements) <= 4 for r in records if isinstance(r, InteractiveBatch))
+    assert [type(r).__name__ for r in records[:3]] == ["HeaderBatch", "HeaderBatch", "HeaderBatch"]
+    assert page.chunk_calls == 3 + 2 + 4
+
+
+async def test_closing_stream_early_releases_cursor() -> None:
+    page = StreamingPage()
+    stream = stream_page_semantics(page, chunk_size=2)
+    assert isinstance(await stream.__anext__(), HeaderBatch)
+    await stream.aclose()
+
+    assert not page.streams
+
+
+async def test_lost_cursor_raises() -> None:
+    page = StreamingPage()
+    stream = stream_page_semantics(page, chunk_size=2)
+    await stream.__anext__()
+    page.streams.clear()
+
+    with pytest.raises(ExtractionError) as exc:
+        async for _ in stream:
+            pass
+    assert exc.value.code == "STREAM_CURSOR_LOST"
+
+
+async def test_invalid_chunk_size_is_rejected() -> None:
+    with pytest.raises(ExtractionError) as exc:
+        async for _ in stream_page_semantics(StreamingPage(), chunk_size=0):
+            pass
+    assert exc.value.code == "INVALID_CHUNK_SIZE"
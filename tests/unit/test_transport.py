@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from semantic_page_extractor.extractor import _to_form, _to_interactive
+from semantic_page_extractor.transport import decode_transport
+from tests.transport_encoder import encode_transport
+
+
+def _raw() -> dict:
+    submit = {"role": "button", "visible_text": "Pay", "aria_label": None, "disabled": False, "section_context": "Checkout"}
+    sizes = ["S", "M"]
+    radio = {
+        "label_for": None,
+        "label_wrapped": None,
+        "aria_label": None,
+        "placeholder": None,
+        "type": "radio",
+        "required": True,
+        "options": sizes,
+        "disabled": False,
+        "section_context": "Checkout",
+    }
+    return {
+        "url": "https://example.com/cart",
+        "title": "Cart",
+        "headers": ["Checkout"],
+        "forms": [{"section_context": "Checkout", "fields": [radio, dict(radio)], "submit_buttons": [submit]}],
+        "interactive_elements": [
+            submit,
+            {"role": "link", "visible_text": "Help", "aria_label": "Help", "disabled": True, "section_context": "Checkout"},
+        ],
+    }
+
+
+def test_transport_round_trip_matches_raw_payload() -> None:
+    raw = _raw()
+    assert decode_transport(encode_transport(raw)) == raw
+
+
+def test_transport_deduplicates_strings_and_shared_actions() -> None:
+    encoded = json.loads(encode_transport(_raw()))
+    assert encoded["s"].count("Checkout") == 1
+    assert len(encoded["a"][0]) == 2
+    assert len(encoded["o"]) == 1
+
+
+def test_decoded_actions_are_shared_between_form_and_page() -> None:
+    decoded = decode_transport(encode_transport(_raw()))
+    actions = {}
+    form = _to_form(decoded["forms"][0], actions)
+    assert form.submit_buttons[0] is _to_interactive(decoded["interactive_elements"][0], actions)
+
+
+def test_decode_rejects_unknown_version() -> None:
+    with pytest.raises(ValueError):
+        decode_transport(json.dumps({"v": 99}))
@@ -0,0 +1,43 @@
+from semantic_page_extractor.extractor import _to_summary
+from semantic_page_extractor.models import PageSummary
+
+
+def _raw() -> dict:
+    submit = {"role": "button", "visible_text": "Sign in", "aria_label": None, "disabled": False, "section_context": "Login"}
+    return {
+        "url": "https://example.com/login",
+        "title": "  Login   Page ",
+        "headers": ["Login", " Account "],
+        "forms": [
+            {
+                "section_context": "Login",
+                "fields": [
+                    {
+                        "label_for": "Email",
+                        "type": "email",
+                        "required": True,
+                        "placeholder": None,
+                        "options": None,
+                        "disabled": False,
+                        "section_context": "Login",
+                    },
+                    {"label_wrapped": "Plan", "type": "radio", "options": ["Pro", " Free "], "section_context": "Login"},
+                ],
+                "submit_buttons": [submit],
+            }
+        ],
+        "interactive_elements": [submit, {"role": "link", "visible_text": "Help", "disabled": True}],
+    }
+
+
+def test_trusted_summary_matches_validated_summary() -> None:
+    validated = _to_summary(_raw())
+    trusted = _to_summary(_raw(), trusted=True)
+
+    assert trusted == validated
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+def test_trusted_summary_round_trips_through_validation() -> None:
+    trusted = _to_summary(_raw(), trusted=True)
+    assert PageSummary.model_validate(trusted.model_dump(mode="json")) == trusted